@@ -1,25 +1,77 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from src.api.utils.response_builder import failure
 from src.api.routers import jira_router
 from src.api.routers.activity_router import router as activity_router
 from src.api.routers.github_router import router as github_router
+from src.api.routers.webhook_router import router as webhook_router
 
 from src.core.logger import get_logger
+from src.core.concurrency import flight_stats
 from src.core.config import settings
+from src.integrations.github_client import GitHubClient
+from src.integrations.http_session import aclose_async_clients, close_sessions, pool_stats
+from src.services.activity_service import ActivityService
+from src.services.activity_store import get_activity_store
+from src.services.jira_service import JiraService
+from src.services.pagination import InvalidCursor, cursor_store
+from src.services.sync_service import run_periodic_sync
+from src.services.webhook_service import webhook_processor
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    store = get_activity_store()
+    sync_task = None
+    if store is not None and settings.activity_store_sync_interval > 0:
+        sync_task = asyncio.create_task(run_periodic_sync(store, settings.activity_store_sync_interval))
+
+    yield
+
+    if sync_task is not None:
+        sync_task.cancel()
+    webhook_processor.flush()
+    await aclose_async_clients()
+    close_sessions()
+
+
 app = FastAPI(
     title="Team Activity Monitor",
     description="AI agent integrating with JIRA and GitHub",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(jira_router.router)
 app.include_router(activity_router)
 
 app.include_router(github_router)
+app.include_router(webhook_router)
+
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(status_code=400, content=failure("Invalid cursor.", str(exc)))
 
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok", "environment": settings.env}
+    store = get_activity_store()
+    return {
+        "status": "ok",
+        "environment": settings.env,
+        "http_pools": pool_stats(),
+        "github_etag_cache": GitHubClient.etag_cache.stats(),
+        "github_rate_limit": GitHubClient.token_pool.snapshot(),
+        "jira_details_cache": JiraService.details_cache.stats(),
+        "activity_cache": ActivityService.response_cache.stats(),
+        "single_flight": flight_stats(),
+        "cursor_snapshots": cursor_store.stats(),
+        "activity_store": store.stats() if store else None,
+        "webhooks": webhook_processor.stats(),
+    }
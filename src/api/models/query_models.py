@@ -1,4 +1,23 @@
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from src.core.config import settings
 
 class QueryRequestModel(BaseModel):
     question: str
+
+
+class ActivityBatchRequestModel(BaseModel):
+    questions: list[str] = Field(default=[], max_length=settings.activity_batch_max_items)
+    users: list[str] = Field(default=[], max_length=settings.activity_batch_max_items)  # each user's full activity
+
+
+class JiraBatchRequestModel(BaseModel):
+    users: Optional[list[str]] = None  # defaults to every configured user
+
+
+class JiraDetailsRequestModel(BaseModel):
+    keys: list[str] = Field(max_length=settings.jira_details_max_keys)
+    changelog: bool = False
+    changelog_limit: int = Field(default=100, ge=1, le=settings.jira_changelog_max_entries)
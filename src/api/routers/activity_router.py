@@ -1,18 +1,94 @@
+import json
+
 from fastapi import APIRouter, Query
-from src.api.models.query_models import QueryRequestModel
+from fastapi.responses import StreamingResponse
+from src.api.models.query_models import ActivityBatchRequestModel, QueryRequestModel
+from src.core.concurrency import Deadline
+from src.core.config import settings
 from src.services.activity_service import ActivityService
 
 router = APIRouter(tags=["Activity"])
 service = ActivityService()
 
+TIMEOUT_QUERY = Query(None, gt=0, le=120, description="Seconds this request may take (default ACTIVITY_DEADLINE_SECONDS)")
+PERIOD_QUERY = Query("default", pattern="^(default|today|yesterday|this_week|last_week|this_month|last_month)$")
+
+
+def request_deadline(timeout: float = None) -> Deadline:
+    """The request's deadline starts when the router receives it."""
+    return Deadline(timeout or settings.activity_deadline_seconds)
+
 @router.post("/activity")
-def get_activity(
+async def get_activity(
     payload: QueryRequestModel,
     limit: int = Query(10, ge=1, le=50),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    timeout: float = TIMEOUT_QUERY
 ):
-    return service.get_activity(
+    return await service.get_activity_async(
         question=payload.question,
         limit=limit,
-        offset=offset
+        offset=offset,
+        deadline=request_deadline(timeout)
+    )
+
+
+@router.post("/activity/stream")
+async def stream_activity(
+    payload: QueryRequestModel,
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$"),
+    timeout: float = TIMEOUT_QUERY
+):
+    """Same answer as /activity, streamed section by section (NDJSON or Server-Sent Events)."""
+    events = service.stream_activity_async(
+        question=payload.question, limit=limit, offset=offset, deadline=request_deadline(timeout)
+    )
+
+    async def body():
+        async for event in events:
+            data = json.dumps(event, default=str)
+            if format == "sse":
+                yield f"event: {event['event']}\ndata: {data}\n\n"
+            else:
+                yield data + "\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(body(), media_type=media_type)
+
+
+@router.post("/activity/batch")
+async def get_activity_batch(
+    payload: ActivityBatchRequestModel,
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    timeout: float = TIMEOUT_QUERY
+):
+    return await service.get_activity_batch_async(
+        questions=payload.questions,
+        users=payload.users,
+        limit=limit,
+        offset=offset,
+        deadline=request_deadline(timeout)
     )
+
+
+@router.get("/activity/summary/{user}")
+async def get_activity_summary(
+    user: str,
+    period: str = PERIOD_QUERY,
+    timeout: float = TIMEOUT_QUERY
+):
+    """Only the summary, built from the same counts as /activity/counts."""
+    return await service.get_summary_async(user, period=period, deadline=request_deadline(timeout))
+
+
+@router.get("/activity/counts/{user}")
+async def get_activity_counts(
+    user: str,
+    period: str = PERIOD_QUERY,
+    timeout: float = TIMEOUT_QUERY
+):
+    """Counts only, for dashboards: daily rollups when fresh, else count-only upstream requests."""
+    return await service.get_counts_async(user, period=period, deadline=request_deadline(timeout))
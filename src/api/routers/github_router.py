@@ -6,34 +6,43 @@ service = GitHubService()
 
 # Summary
 @router.get("/{username}")
-def github_summary(
+async def github_summary(
     username: str,
     limit: int = Query(5),
     offset: int = Query(0),
 ):
-    return service.get_user_github_activity(username, limit, offset)
+    return await service.get_user_github_activity_async(username, limit, offset)
 
 
 # Commits with period OR date range
 @router.get("/{username}/commits")
-def get_commits(
+async def get_commits(
     username: str,
     limit: int = Query(5),
     offset: int = Query(0),
     period: str = Query(None, description="today|yesterday|this_week|last_week|this_month|last_month"),
     since: str = Query(None, description="ISO date like 2025-01-01"),
     until: str = Query(None, description="ISO date like 2025-01-20"),
+    cursor: str = Query(None, description="meta.next_cursor of the previous page"),
 ):
-    return service.get_user_commits(username, limit, offset, period, since, until)
+    return await service.get_user_commits_async(username, limit, offset, period, since, until, cursor=cursor)
 
 
 # Pull Requests
 @router.get("/{username}/prs")
-def get_prs(username: str, limit: int = 5, offset: int = 0):
-    return service.get_user_prs(username, limit, offset)
+async def get_prs(
+    username: str,
+    limit: int = 5,
+    offset: int = 0,
+    period: str = Query(None, description="today|yesterday|this_week|last_week|this_month|last_month"),
+    since: str = Query(None, description="ISO date like 2025-01-01"),
+    until: str = Query(None, description="ISO date like 2025-01-20"),
+    cursor: str = None,
+):
+    return await service.get_user_prs_async(username, limit, offset, period, since, until, cursor=cursor)
 
 
 # Repos
 @router.get("/{username}/repos")
-def get_repos(username: str, limit: int = 5, offset: int = 0):
-    return service.get_recent_repos(username, limit, offset)
+async def get_repos(username: str, limit: int = 5, offset: int = 0, cursor: str = None):
+    return await service.get_recent_repos_async(username, limit, offset, cursor=cursor)
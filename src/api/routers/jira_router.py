@@ -1,13 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from src.api.models.query_models import JiraBatchRequestModel, JiraDetailsRequestModel
 from src.services.jira_service import JiraService
 from src.core.user_resolver import UserResolver
+from src.core.config import settings
 
 router = APIRouter(prefix="/api/v1/jira", tags=["JIRA"])
 jira_service = JiraService()
 
 
 @router.get("/users/{username}/issues")
-def get_user_issues(username: str, limit: int = 10, offset: int = 0):
+async def get_user_issues(username: str, limit: int = 10, offset: int = 0, cursor: str = None):
 
     resolved = UserResolver.resolve(username)
     if not resolved:
@@ -15,10 +17,40 @@ def get_user_issues(username: str, limit: int = 10, offset: int = 0):
 
     account_id = resolved["jira"]
 
-    return jira_service.get_user_issues(account_id, limit=limit, offset=offset)
+    return await jira_service.get_user_issues_async(account_id, limit=limit, offset=offset, cursor=cursor)
+
+
+@router.post("/issues:batch")
+async def get_team_issues(
+    payload: JiraBatchRequestModel,
+    limit: int = Query(10, ge=1, le=50),
+    offset: int = Query(0, ge=0)
+):
+    """Active issues for several users (default: everyone configured) in batched queries."""
+    users = payload.users or list(UserResolver.MAP)
+
+    unknown = [u for u in users if not UserResolver.resolve(u)]
+    if unknown:
+        return {"error": f"No accountId configured for {', '.join(repr(u) for u in unknown)}"}
+
+    account_ids = [UserResolver.resolve(u)["jira"] for u in users]
+
+    return await jira_service.get_team_issues_async(account_ids, limit=limit, offset=offset)
+
+
+@router.post("/issues:details")
+async def get_issues_details(payload: JiraDetailsRequestModel):
+    """Details of several JIRA issues in one call (fields only unless `changelog` is set)."""
+    return await jira_service.get_issues_details_async(
+        payload.keys, changelog=payload.changelog, changelog_limit=payload.changelog_limit
+    )
 
 
 @router.get("/issues/{issue_key}")
-def get_issue_details(issue_key: str):
-    """Get full details of a specific JIRA issue."""
-    return jira_service.get_issue_details(issue_key)
+async def get_issue_details(
+    issue_key: str,
+    changelog: bool = False,
+    changelog_limit: int = Query(100, ge=1, le=settings.jira_changelog_max_entries)
+):
+    """Get details of a specific JIRA issue; the changelog is paged in only on request."""
+    return await jira_service.get_issue_details_async(issue_key, changelog=changelog, changelog_limit=changelog_limit)
@@ -0,0 +1,55 @@
+import json
+
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import JSONResponse
+from src.api.utils.response_builder import failure
+from src.core.config import settings
+from src.services.webhook_service import normalize_github, normalize_jira, verify_signature, webhook_processor
+
+router = APIRouter(prefix="/webhooks", tags=["Webhooks"])
+
+
+async def _verified_payload(request: Request, secret: str, signature: str):
+    """(payload, error_response): the JSON body if its HMAC signature checks out."""
+    if not secret:
+        return None, JSONResponse(status_code=503, content=failure("Webhook secret not configured."))
+
+    body = await request.body()
+    if not verify_signature(secret, body, signature):
+        return None, JSONResponse(status_code=401, content=failure("Invalid webhook signature."))
+
+    try:
+        return json.loads(body), None
+    except ValueError:
+        return None, JSONResponse(status_code=400, content=failure("Webhook body is not valid JSON."))
+
+
+def _accepted(result):
+    if result is None:
+        return JSONResponse(status_code=503, content=failure("Webhook queue is full, retry later."))
+    return JSONResponse(status_code=202, content=result)
+
+
+@router.post("/github")
+async def github_webhook(
+    request: Request,
+    x_github_event: str = Header(""),
+    x_hub_signature_256: str = Header(None),
+):
+    """GitHub `push` / `pull_request` events (signed with GITHUB_WEBHOOK_SECRET)."""
+    payload, error = await _verified_payload(request, settings.github_webhook_secret, x_hub_signature_256)
+    if error:
+        return error
+
+    return _accepted(webhook_processor.submit("github", x_github_event, normalize_github(x_github_event, payload)))
+
+
+@router.post("/jira")
+async def jira_webhook(request: Request, x_hub_signature: str = Header(None)):
+    """JIRA issue created/updated events (signed with JIRA_WEBHOOK_SECRET)."""
+    payload, error = await _verified_payload(request, settings.jira_webhook_secret, x_hub_signature)
+    if error:
+        return error
+
+    event = payload.get("webhookEvent", "")
+    return _accepted(webhook_processor.submit("jira", event, normalize_jira(payload)))
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU map with hit/miss/eviction counters.
+    Shared by the integration and service layers for in-memory caching.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Read without touching recency or counters."""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Optional[Any]:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def discard_where(self, predicate) -> int:
+        """Drop every entry whose key satisfies `predicate`; returns how many."""
+        with self._lock:
+            doomed = [key for key in self._data if predicate(key)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class TTLCache:
+    """
+    LRU-bounded cache with two-stage expiry: an entry is fresh for `ttl`
+    seconds, then stale for `stale_ttl` more (still servable while the
+    caller refreshes it), then gone.
+    """
+
+    FRESH = "fresh"
+    STALE = "stale"
+
+    def __init__(self, maxsize: int = 256):
+        self._entries = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable) -> tuple[Any, Optional[str]]:
+        """Return (value, FRESH | STALE), or (None, None) on a miss."""
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        with self._lock:
+            if entry and now < entry["fresh_until"]:
+                self.hits += 1
+                return entry["value"], self.FRESH
+            if entry and now < entry["stale_until"]:
+                self.stale_hits += 1
+                return entry["value"], self.STALE
+            self.misses += 1
+
+        if entry:
+            self._entries.pop(key)
+        return None, None
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0):
+        now = time.monotonic()
+        self._entries.set(key, {
+            "value": value,
+            "fresh_until": now + ttl,
+            "stale_until": now + ttl + stale_ttl,
+        })
+
+    def clear(self):
+        self._entries.clear()
+
+    def discard_where(self, predicate) -> int:
+        """Invalidate every entry whose key satisfies `predicate`."""
+        return self._entries.discard_where(predicate)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lru = self._entries.stats()
+        with self._lock:
+            return {
+                "size": lru["size"],
+                "maxsize": lru["maxsize"],
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": lru["evictions"],
+            }
@@ -0,0 +1,282 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+
+class Deadline:
+    """Absolute per-request deadline shared by every fetch of that request."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+# Deadline of the request being served; upstream clients cap their
+# timeouts by it. Context copies made by fan_out() & co carry it along.
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]):
+    """Make `deadline` the current request deadline for the enclosed calls."""
+    token = current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        current_deadline.reset(token)
+
+
+def fan_out(
+    tasks: dict[str, Callable[[], Any]],
+    deadline: Optional[Deadline] = None,
+    on_timeout: Callable[[str], Any] = lambda name: None,
+) -> dict[str, Any]:
+    """
+    Run independent zero-arg callables concurrently and return their
+    results keyed like `tasks`.
+
+    Latency is the slowest task, capped by `deadline`. Tasks still running
+    when the deadline passes are abandoned and replaced by `on_timeout(name)`.
+    Exceptions raised by a task propagate exactly as a sequential call would.
+    """
+    if not tasks:
+        return {}
+
+    executor = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="fan-out")
+    try:
+        # Each task runs in a copy of the caller's context so context
+        # variables (request deadline, priority, ...) follow the work.
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, fn)
+            for name, fn in tasks.items()
+        }
+        wait(futures.values(), timeout=deadline.remaining() if deadline else None)
+
+        results = {}
+        for name, future in futures.items():
+            if future.done():
+                results[name] = future.result()
+            else:
+                future.cancel()
+                results[name] = on_timeout(name)
+        return results
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def bounded_map(fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int) -> list:
+    """
+    Apply `fn` to every item on at most `max_workers` threads, preserving
+    input order and the caller's context variables.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="bounded-map") as pool:
+        return list(pool.map(lambda pair: pair[0].run(fn, pair[1]), zip(contexts, items)))
+
+
+async def bounded_gather(fn: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: int) -> list:
+    """Async counterpart of bounded_map(): at most `max_concurrency` coroutines in flight."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item):
+        async with semaphore:
+            return await fn(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+async def fan_out_async(
+    tasks: dict[str, Callable[[], Awaitable[Any]]],
+    deadline: Optional[Deadline] = None,
+    on_timeout: Callable[[str], Any] = lambda name: None,
+) -> dict[str, Any]:
+    """Async counterpart of fan_out(): coroutines run concurrently on the event loop."""
+    if not tasks:
+        return {}
+
+    pending = {name: asyncio.ensure_future(fn()) for name, fn in tasks.items()}
+    await asyncio.wait(pending.values(), timeout=deadline.remaining() if deadline else None)
+
+    results = {}
+    for name, task in pending.items():
+        if task.done():
+            results[name] = task.result()
+        else:
+            task.cancel()
+            results[name] = on_timeout(name)
+    return results
+
+
+async def iter_completed_async(
+    tasks: dict[str, Callable[[], Awaitable[Any]]],
+    deadline: Optional[Deadline] = None,
+    on_timeout: Callable[[str], Any] = lambda name: None,
+):
+    """
+    Like fan_out_async(), but yields (name, result) pairs in completion
+    order so callers can forward each result as soon as it is ready. Tasks
+    unfinished at the deadline are cancelled and yielded as `on_timeout(name)`.
+    """
+    pending = {asyncio.ensure_future(fn()): name for name, fn in tasks.items()}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=deadline.remaining() if deadline else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for task in done:
+                yield pending.pop(task), task.result()
+
+        for task, name in list(pending.items()):
+            task.cancel()
+            del pending[task]
+            yield name, on_timeout(name)
+    finally:
+        # The consumer stopped early (e.g. client disconnected): don't leak work
+        for task in pending:
+            task.cancel()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the
+    function, everyone arriving while it is in flight waits for and receives
+    the same result (or exception). A follower with a request deadline waits
+    only until it expires and then makes its own call, which fails fast with
+    that caller's timeout. Nothing is cached once the call returns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Any, Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            deadline = current_deadline.get()
+            try:
+                return call.result(timeout=deadline.remaining() if deadline else None)
+            except FutureTimeout:
+                return fn()  # runs into the spent deadline: the caller's own timeout response
+
+        try:
+            result = fn()
+            call.set_result(result)
+            return result
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Async counterpart of SingleFlight; in-flight calls are tracked per event loop."""
+
+    def __init__(self):
+        self._calls: dict[Any, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        key = (loop, key)
+
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+            deadline = current_deadline.get()
+            try:
+                # shield: one waiter giving up must not cancel the shared call
+                return await asyncio.wait_for(asyncio.shield(call), deadline.remaining() if deadline else None)
+            except asyncio.TimeoutError:
+                return await fn()  # runs into the spent deadline: the caller's own timeout response
+
+        call = self._calls[key] = loop.create_future()
+        self.calls += 1
+        try:
+            result = await fn()
+            call.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            call.exception()  # mark retrieved: there may be no other waiter
+            raise
+        finally:
+            self._calls.pop(key, None)
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._calls)}
+
+
+flights = SingleFlight()
+async_flights = AsyncSingleFlight()
+
+
+def coalesced(fn):
+    """
+    Method decorator: concurrent identical calls share one execution via
+    `flights` / `async_flights`. The owning class provides `_flight_key(name,
+    args, kwargs)` so the key can include e.g. the upstream base URL and the
+    request priority (background work must not hold interactive callers).
+    """
+    name = fn.__qualname__
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(self, *args, **kwargs):
+            key = self._flight_key(name, args, kwargs)
+            return await async_flights.do(key, lambda: fn(self, *args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        key = self._flight_key(name, args, kwargs)
+        return flights.do(key, lambda: fn(self, *args, **kwargs))
+    return wrapper
+
+
+def flight_stats() -> dict:
+    return {"sync": flights.stats(), "async": async_flights.stats()}
@@ -13,13 +13,61 @@ class Settings(BaseSettings):
     jira_abhishek_account_id: str = ""
     jira_abhialien_account_id: str = ""
     jira_test_account_id: str = ""
+    jira_project_key: str = "SCRUM"
+    jira_page_size: int = 100
+    jira_assignee_batch_size: int = 50
+    jira_bulk_fetch_size: int = 100
+    jira_details_workers: int = 4
+    jira_changelog_page_size: int = 100
+    jira_changelog_max_entries: int = 1000
+    jira_details_max_keys: int = 100  # issue keys per /jira/issues:details
+    jira_details_cache_size: int = 256
+    jira_version_hint_ttl: float = 60.0
     github_token: str = ""
+    github_tokens: str = ""  # comma-separated pool, used alongside github_token
+    github_token_quarantine_seconds: int = 3600
     github_repo_name: str = ""
     github_username_for_abhishek: str = ""
     github_username_for_abhialien: str = ""
     github_api_host_url: str = ""
     openai_api_key: str = ""
     use_mock_data: bool = False
+    http_pool_connections: int = 10
+    http_pool_maxsize: int = 20
+    http_max_retries: int = 3
+    http_retry_backoff: float = 0.5
+    http_connect_timeout: float = 3.05
+    http_hedge_delay_seconds: float = 0.0  # 0 disables hedged GETs
+    github_timeout_seconds: float = 10.0
+    jira_timeout_seconds: float = 10.0
+    activity_deadline_seconds: float = 20.0
+    activity_cache_size: int = 256
+    activity_batch_concurrency: int = 8
+    activity_batch_max_items: int = 50  # questions (and users) per /activity/batch
+    cursor_snapshot_max_items: int = 50000  # items retained across all open snapshots
+    cursor_snapshot_ttl: float = 300.0
+    activity_cache_ttl_jira: float = 60.0
+    activity_cache_ttl_github: float = 120.0
+    activity_cache_stale_seconds: float = 300.0
+    activity_store_path: str = ""  # SQLite file; empty = live upstream calls only
+    activity_store_max_age: float = 900.0
+    activity_store_sync_interval: float = 300.0
+    activity_store_history_days: int = 90
+    backfill_workers: int = 4
+    backfill_jira_requests_per_second: float = 5.0  # shared by all backfill workers
+    github_webhook_secret: str = ""
+    jira_webhook_secret: str = ""
+    webhook_queue_size: int = 10000
+    webhook_batch_size: int = 200
+    webhook_batch_wait: float = 0.5
+    github_etag_cache_size: int = 512
+    github_use_graphql: bool = False
+    github_search_per_minute: int = 30
+    github_core_background_reserve: int = 500
+    github_search_background_reserve: int = 5
+    github_max_wait_seconds: float = 5.0
+    github_commit_repo_limit: int = 10
+    github_commit_fetch_workers: int = 4
     env: str = "development"
 
     model_config = SettingsConfigDict(env_file=ENV_PATH)
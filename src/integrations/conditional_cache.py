@@ -0,0 +1,87 @@
+import copy
+
+from src.core.cache import LRUCache
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for a `requests`/`httpx` response, built from a cache
+    entry. Exposes the attributes the client parsers rely on.
+    """
+
+    def __init__(self, status_code: int, headers: dict, body):
+        self.status_code = status_code
+        self.headers = headers
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class ConditionalCache:
+    """
+    ETag / Last-Modified cache for conditional GETs.
+
+    Stores validators plus the parsed body per URL+params and credential
+    `scope` (a token fingerprint: what a token may see differs). Repeat calls
+    send If-None-Match / If-Modified-Since; a 304 (which GitHub does not count
+    against the rate limit) is answered from a copy of the stored body.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self._entries = LRUCache(maxsize)
+        self.not_modified = 0
+
+    @staticmethod
+    def key(url: str, params: dict = None, scope: str = None):
+        return scope, url, tuple(sorted((params or {}).items()))
+
+    def request_headers(self, url: str, params: dict = None, scope: str = None) -> dict:
+        """Validator headers to add to the next request for this URL+params."""
+        entry = self._entries.peek(self.key(url, params, scope))
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def resolve(self, url: str, params: dict, response, scope: str = None):
+        """
+        Fold a fresh response into the cache. Returns the response to parse:
+        the cached body on 304, a parsed copy on a cacheable 200, otherwise
+        the original response untouched. None for a 304 whose entry was
+        evicted after the validators went out: the caller must re-request
+        unconditionally.
+        """
+        key = self.key(url, params, scope)
+
+        if response.status_code == 304:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            self.not_modified += 1
+            return CachedResponse(200, entry["headers"], copy.deepcopy(entry["body"]))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if response.status_code != 200 or not (etag or last_modified):
+            return response
+
+        body = response.json()
+        link = response.headers.get("Link")
+        headers = {"Link": link} if link else {}
+        self._entries.set(key, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": headers,
+            "body": copy.deepcopy(body),  # callers may mutate what they get back
+        })
+        return CachedResponse(200, headers, body)
+
+    def stats(self) -> dict:
+        return {**self._entries.stats(), "not_modified": self.not_modified}
@@ -1,84 +1,196 @@
 import os
+from datetime import datetime, timezone
+from functools import partial
+from urllib.parse import parse_qs, urlparse
 
-import requests
+from src.core.concurrency import coalesced
 from src.core.config import settings
 from src.core.logger import get_logger
+from src.integrations.conditional_cache import ConditionalCache
+from src.integrations.http_session import (
+    async_request_timeout,
+    get_async_client,
+    get_session,
+    hedged,
+    hedged_async,
+    is_timeout,
+    request_timeout,
+)
+from src.integrations.rate_limiter import RateLimitScheduler, request_priority
+from src.integrations.token_pool import TokenPool
 
 logger = get_logger(__name__)
 
-class GitHubClient:
-    """Handles communication with the GitHub API."""
+# Everything GitHubService emits for /activity, in one round trip.
+ACTIVITY_QUERY = """
+query Activity($login: String!, $prQuery: String!, $since: GitTimestamp, $until: GitTimestamp,
+               $first: Int!, $commitRepos: Int!, $commitsFirst: Int!) {
+  user(login: $login) {
+    repositories(first: $first, ownerAffiliations: OWNER,
+                 orderBy: {field: PUSHED_AT, direction: DESC}) {
+      nodes { name nameWithOwner url description pushedAt stargazerCount forkCount }
+    }
+    active: repositories(first: $commitRepos, ownerAffiliations: OWNER,
+                         orderBy: {field: PUSHED_AT, direction: DESC}) {
+      nodes {
+        nameWithOwner
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: $commitsFirst, since: $since, until: $until) {
+                nodes { oid message url author { date user { login } } }
+                pageInfo { hasNextPage }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  search(query: $prQuery, type: ISSUE, first: $first) {
+    issueCount
+    nodes { ... on PullRequest { title url } }
+  }
+}
+"""
+
+
+class _GitHubBase:
+    """
+    Transport-agnostic part of the GitHub client: request building and
+    response parsing shared by the sync and async clients. Both `requests`
+    and `httpx` responses expose `status_code`, `headers` and `json()`.
+    """
     BASE_URL = os.environ.get("GITHUB_API_HOST_URL", "https://api.github.com")
 
+    # One conditional-request cache and one credential pool (each token with
+    # its own rate-limit scheduler) per process, shared by sync and async clients
+    etag_cache = ConditionalCache(settings.github_etag_cache_size)
+    token_pool = TokenPool.from_settings()
+
     def __init__(self):
         self.token = settings.github_token
         self.headers = {
-            "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github+json",
             "User-Agent": "activity-monitor"
         }
 
-    def _get(self, url: str, params=None, headers=None):
-        """Generic GET request."""
-        try:
-            response = requests.get(
-                url,
-                headers=headers or self.headers,
-                params=params or {}
-            )
-            data = response.json()
-
-            if response.status_code >= 400:
-                return {
-                    "success": False,
-                    "error": data.get("message", "Unknown GitHub error")
-                }
-
-            return {"success": True, "data": data}
+    @staticmethod
+    def _failed(error: Exception) -> dict:
+        """Error envelope; `reason` tells timeouts apart from other failures."""
+        return {"success": False, "error": str(error), "reason": "timeout" if is_timeout(error) else None}
 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+    def _flight_key(self, name: str, args: tuple, kwargs: dict):
+        """Single-flight key: identical calls at the same priority against the same API host coalesce."""
+        return self.BASE_URL, request_priority.get(), name, repr(args), repr(sorted(kwargs.items()))
 
-    def get_recent_commits(self, username: str, repo_name: str, limit: int = 100, page: int = 1):
-        """Fetch recent commits from a repo with pagination."""
-        """Fetch commits from a repo with pagination."""
+    # ---- request builders -------------------------------------------------
+    def _commits_request(
+        self, username: str, repo_name: str, limit: int = 100, page: int = 1, since=None, until=None, author=None
+    ):
         url = f"{self.BASE_URL}/repos/{username}/{repo_name}/commits"
-
         params = {
             "per_page": limit,
             "page": page,
         }
+        # Forks and shared repos carry everyone's history; keep only the user's commits
+        if author:
+            params["author"] = author
+        # Let GitHub apply the time window instead of filtering locally
+        if since:
+            params["since"] = self._iso(since)
+        if until:
+            params["until"] = self._iso(until)
+        return url, params
 
-        return self._get(url, params=params)
+    @staticmethod
+    def _iso(value) -> str:
+        """GitHub expects ISO 8601 timestamps (YYYY-MM-DDTHH:MM:SSZ)."""
+        if isinstance(value, str):
+            return value
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    def get_pull_requests(self, username: str, repo_name: str = "autonomize-activity-monitor"):
-        """Search PRs authored by user in a specific repo only."""
+    def _pull_requests_request(
+        self, username: str, repo_name: str, page: int = None, per_page: int = None, created_since=None,
+        created_until=None
+    ):
         url = f"{self.BASE_URL}/search/issues"
-
+        created = ""
+        if created_since and created_until:
+            created = f" created:{self._iso(created_since)}..{self._iso(created_until)}"
+        elif created_since:
+            created = f" created:>={self._iso(created_since)}"
+        elif created_until:
+            created = f" created:<={self._iso(created_until)}"
         params = {
-            "q": f"author:{username} repo:{username}/{repo_name} type:pr",
+            "q": f"author:{username} repo:{username}/{repo_name} type:pr{created}",
             "sort": "created",
             "order": "desc"
         }
+        if page:
+            params["page"] = page
+        if per_page:
+            params["per_page"] = per_page
+        return url, params
 
-        return self._get(url, params=params)
+    def _activity_graphql_request(self, username: str, repo_name: str, since=None, until=None, commits_first: int = 100):
+        url = f"{self.BASE_URL}/graphql"
+        _, pr_params = self._pull_requests_request(username, repo_name, created_since=since, created_until=until)
+        payload = {
+            "query": ACTIVITY_QUERY,
+            "variables": {
+                "login": username,
+                "prQuery": pr_params["q"] + " sort:created-desc",
+                "since": self._iso(since) if since else None,
+                "until": self._iso(until) if until else None,
+                "first": 100,
+                "commitRepos": settings.github_commit_repo_limit,
+                "commitsFirst": commits_first,
+            },
+        }
+        return url, payload
 
-    def get_total_commits(self, username: str, repo_name: str):
-        """
-        Fetch total number of commits in the repo using GitHub Link headers.
-        """
+    def _repos_request(self, username: str, per_page: int = 100):
+        url = f"{self.BASE_URL}/users/{username}/repos"
+        params = {"sort": "pushed", "direction": "desc", "per_page": per_page}
+        return url, params
 
-        url = f"{self.BASE_URL}/repos/{username}/{repo_name}/commits"
-        params = {"per_page": 1, "page": 1}
+    def _user_request(self, username: str):
+        return f"{self.BASE_URL}/users/{username}", None
 
-        response_data = requests.get(
-            url,
-            headers=self.headers,
-            params=params
-        )
+    def _attempt_headers(self, headers: dict, entry, url: str, params=None, conditional: bool = False) -> dict:
+        """Headers for one attempt: the chosen token plus, for conditional GETs, its cached validators."""
+        headers = self._authorized(headers, entry)
+        if conditional:
+            headers = {**headers, **self.etag_cache.request_headers(url, params, entry.fingerprint)}
+        return headers
 
+    @staticmethod
+    def _authorized(headers: dict, entry) -> dict:
+        """Attach the pooled token chosen for this attempt."""
+        if not entry.token:
+            return headers
+        return {**headers, "Authorization": f"token {entry.token}"}
+
+    # ---- response parsers -------------------------------------------------
+    @staticmethod
+    def _envelope(response) -> dict:
+        """Turn a raw response into the {"success", "data"|"error"} envelope."""
+        data = response.json()
+
+        if response.status_code >= 400:
+            return {
+                "success": False,
+                "error": data.get("message", "Unknown GitHub error")
+            }
+
+        return {"success": True, "data": data}
+
+    @staticmethod
+    def _last_page(response) -> int:
+        """Read the page number of rel="last" from the Link header."""
         # If no link header → only 1 page
-        link = response_data.headers.get("Link", "")
+        link = response.headers.get("Link", "")
         if not link:
             return 1
 
@@ -91,46 +203,388 @@ class GitHubClient:
             return 1
 
         last_url = last[0].split(";")[0].strip()[1:-1]
-        last_page_num = int(last_url.split("page=")[-1])
+        return int(parse_qs(urlparse(last_url).query)["page"][0])
+
+    @classmethod
+    def _count_envelope(cls, response) -> dict:
+        """
+        Count from a per_page=1 listing: the rel="last" page number, or the
+        items on the only page. An empty repository answers 409 (no commits).
+        """
+        if response.status_code == 409:
+            return {"success": True, "data": 0}
+
+        envelope = cls._envelope(response)
+        if not envelope["success"]:
+            return envelope
+        if 'rel="last"' in response.headers.get("Link", ""):
+            return {"success": True, "data": cls._last_page(response)}
+        return {"success": True, "data": len(envelope["data"])}
+
+    @staticmethod
+    def _field_count(raw: dict, field: str) -> dict:
+        """Envelope of a single numeric field (search `total_count`, user `public_repos`)."""
+        if not raw["success"]:
+            return raw
+        return {"success": True, "data": raw["data"].get(field, 0)}
+
+    @staticmethod
+    def _repos_envelope(response) -> dict:
+        data = response.json()
+
+        if response.status_code != 200:
+            err = data.get("message", "GitHub repos fetch failed")
+            logger.error(f"GitHub Repo Error: {err}")
+            return {"success": False, "error": err}
+
+        repos = []
+        for repo in data:
+            repos.append({
+                "name": repo.get("name"),
+                "full_name": repo.get("full_name"),
+                "url": repo.get("html_url"),
+                "description": repo.get("description"),
+                "last_pushed": repo.get("pushed_at"),
+                "stars": repo.get("stargazers_count"),
+                "forks": repo.get("forks_count"),
+            })
+
+        return {"success": True, "data": repos}
+
+    @staticmethod
+    def _utc(ts):
+        """GraphQL GitTimestamps carry the author's offset; REST reports UTC 'Z'."""
+        if not ts:
+            return ts
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    @staticmethod
+    def _authored_by(node: dict, login: str = None) -> bool:
+        user = ((node.get("author") or {}).get("user") or {}).get("login") or ""
+        return not login or user.lower() == login.lower()
+
+    @classmethod
+    def _activity_graphql_envelope(cls, response, login: str = None) -> dict:
+        """
+        Map the GraphQL activity payload onto the REST shapes the service
+        already consumes (repo dicts, commit objects, search items). Like
+        REST's `author` filter, only commits authored by `login` are kept;
+        repos whose page lost commits to that filter and has more behind it
+        are listed in `partial_repos`, since their page no longer says how
+        many of the user's commits there are.
+        """
+        data = response.json()
+
+        if response.status_code >= 400 or data.get("errors"):
+            errors = data.get("errors") or [{}]
+            return {
+                "success": False,
+                "error": errors[0].get("message") or data.get("message", "Unknown GitHub GraphQL error")
+            }
+
+        root = data.get("data") or {}
+        user = root.get("user") or {}
+
+        repos = [
+            {
+                "name": r.get("name"),
+                "full_name": r.get("nameWithOwner"),
+                "url": r.get("url"),
+                "description": r.get("description"),
+                "last_pushed": r.get("pushedAt"),
+                "stars": r.get("stargazerCount"),
+                "forks": r.get("forkCount"),
+            }
+            for r in (user.get("repositories") or {}).get("nodes", [])
+        ]
+
+        commits_by_repo = {}
+        partial_repos = []
+        for r in (user.get("active") or {}).get("nodes", []):
+            branch = r.get("defaultBranchRef") or {}
+            history = (branch.get("target") or {}).get("history") or {}
+            nodes = history.get("nodes", [])
+            commits_by_repo[r.get("nameWithOwner")] = [
+                {
+                    "sha": c.get("oid"),
+                    "html_url": c.get("url"),
+                    "commit": {
+                        "message": c.get("message"),
+                        "author": {"date": cls._utc((c.get("author") or {}).get("date"))},
+                    },
+                }
+                for c in nodes
+                if cls._authored_by(c, login)
+            ]
+            filtered = len(commits_by_repo[r.get("nameWithOwner")]) < len(nodes)
+            if filtered and (history.get("pageInfo") or {}).get("hasNextPage"):
+                partial_repos.append(r.get("nameWithOwner"))
+
+        search = root.get("search") or {}
+        prs = [
+            {"title": pr.get("title"), "html_url": pr.get("url")}
+            for pr in search.get("nodes", []) if pr
+        ]
+
+        return {
+            "success": True,
+            "data": {
+                "repos": repos,
+                "commits_by_repo": commits_by_repo,
+                "partial_repos": partial_repos,
+                "prs": {"total_count": search.get("issueCount", len(prs)), "items": prs},
+            }
+        }
+
+
+class GitHubClient(_GitHubBase):
+    """Handles communication with the GitHub API."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = get_session("github")
+
+    def _send(self, method: str, url: str, headers: dict, conditional: bool = False, **kwargs):
+        """
+        Send with the pooled token that has the most budget left, through its
+        rate-limit scheduler. A rejected call is retried once (on the next best token).
+        Every attempt is bounded by the GitHub timeout budget and the request
+        deadline; GETs may be hedged, the duplicate taking its own scheduler
+        slot and recording its own response. `conditional` GETs revalidate
+        against the ETag cache entry of the token actually used.
+        """
+        resource = RateLimitScheduler.resource_for(url)
+        params = kwargs.get("params")
+
+        for attempt in (1, 2):
+            entry = self.token_pool.select(resource)
+            entry.scheduler.acquire(resource)
+            attempt_headers = self._attempt_headers(headers, entry, url, params, conditional)
+            send = partial(self._recorded_request, entry, resource, method, url, attempt_headers, **kwargs)
+            if method == "GET":
+                response, retry = hedged(send, acquire=partial(entry.scheduler.acquire, resource))
+            else:
+                response, retry = send()
+            if not retry or attempt == 2:
+                break
 
-        return last_page_num  # total commits = last_page_num (since per_page=1)
+        if not conditional:
+            return response
+        resolved = self.etag_cache.resolve(url, params, response, entry.fingerprint)
+        # A 304 whose entry was evicted meanwhile has no body to serve: ask again unconditionally
+        return resolved if resolved is not None else self._send(method, url, headers, **kwargs)
 
-    def get_recent_repos(self, username: str):
+    def _recorded_request(self, entry, resource: str, method: str, url: str, headers: dict, **kwargs):
+        """One request on `entry`'s token, recorded in the pool; returns (response, retry)."""
+        response = self.session.request(method, url, headers=headers, timeout=request_timeout("github"), **kwargs)
+        return response, self.token_pool.record(entry, resource, response)
+
+    def _request(self, url: str, params=None, headers=None):
+        """Conditional GET over the pooled keep-alive session (304 → cached body)."""
+        return self._send("GET", url, headers=headers or self.headers, conditional=True, params=params or {})
+
+    def _get(self, url: str, params=None, headers=None):
+        """Generic GET request."""
+        try:
+            return self._envelope(self._request(url, params=params, headers=headers))
+        except Exception as e:
+            return self._failed(e)
+
+    @coalesced
+    def get_recent_commits(
+        self, username: str, repo_name: str, limit: int = 100, page: int = 1, since=None, until=None, author=None
+    ):
+        """Fetch one page of commits from a repo, optionally within [since, until] and by `author` only."""
+        url, params = self._commits_request(username, repo_name, limit, page, since, until, author)
+        return self._get(url, params=params)
+
+    @coalesced
+    def get_pull_requests(self, username: str, repo_name: str = "autonomize-activity-monitor",
+                          page: int = None, per_page: int = None, created_since=None, created_until=None):
+        """Search the user's PRs in a specific repo (optionally created in a window, one page of many)."""
+        url, params = self._pull_requests_request(username, repo_name, page, per_page, created_since, created_until)
+        return self._get(url, params=params)
+
+    @coalesced
+    def get_total_commits(self, username: str, repo_name: str):
+        """
+        Fetch total number of commits in the repo using GitHub Link headers.
+        """
+        url, params = self._commits_request(username, repo_name, limit=1, page=1)
+        response = self._request(url, params=params)
+
+        return self._last_page(response)  # total commits = last page (since per_page=1)
+
+    @coalesced
+    def count_commits(self, username: str, repo_name: str, since=None, until=None, author=None):
+        """Number of commits in [since, until] (by `author` only) from a single per_page=1 request."""
+        url, params = self._commits_request(username, repo_name, limit=1, page=1, since=since, until=until,
+                                            author=author)
+        try:
+            return self._count_envelope(self._request(url, params=params))
+        except Exception as e:
+            logger.error(f"GitHub commit count error: {e}")
+            return self._failed(e)
+
+    @coalesced
+    def count_pull_requests(self, username: str, repo_name: str = "autonomize-activity-monitor",
+                            since=None, until=None):
+        """Number of the user's PRs created in [since, until] from the search `total_count`."""
+        url, params = self._pull_requests_request(username, repo_name, per_page=1, created_since=since,
+                                                  created_until=until)
+        return self._field_count(self._get(url, params=params), "total_count")
+
+    @coalesced
+    def count_repos(self, username: str):
+        """Number of the user's public repositories, from their profile."""
+        url, params = self._user_request(username)
+        return self._field_count(self._get(url, params=params), "public_repos")
+
+    @coalesced
+    def get_recent_repos(self, username: str, per_page: int = 100):
         """
         Fetch recently-active repositories for a user.
         Sorted by last push date (most recent first).
         """
+        url, params = self._repos_request(username, per_page)
+
+        logger.info(f"Fetching recent repos for GitHub user = {username}")
+
+        try:
+            return self._repos_envelope(self._request(url, params=params))
+        except Exception as e:
+            logger.error(f"GitHub repo fetch error: {e}")
+            return self._failed(e)
+
+    @coalesced
+    def get_activity_graphql(self, username: str, since=None, until=None, commits_first: int = 100,
+                             pr_repo_name: str = "autonomize-activity-monitor"):
+        """Fetch recent repos with their windowed commit histories and authored PRs in one GraphQL query."""
+        url, payload = self._activity_graphql_request(username, pr_repo_name, since, until, commits_first)
 
-        url = (
-            f"https://api.github.com/users/{username}/repos"
-            f"?sort=pushed&direction=desc&per_page=100"
+        try:
+            response = self._send("POST", url, headers=self.headers, json=payload)
+            return self._activity_graphql_envelope(response, username)
+        except Exception as e:
+            logger.error(f"GitHub GraphQL error: {e}")
+            return self._failed(e)
+
+
+class AsyncGitHubClient(_GitHubBase):
+    """Non-blocking GitHub client (httpx.AsyncClient) with the same API as GitHubClient."""
+
+    async def _send(self, method: str, url: str, headers: dict, conditional: bool = False, **kwargs):
+        """Async variant of GitHubClient._send (token pool + rate-limit scheduler)."""
+        resource = RateLimitScheduler.resource_for(url)
+        client = get_async_client("github")
+        params = kwargs.get("params")
+
+        for attempt in (1, 2):
+            entry = self.token_pool.select(resource)
+            await entry.scheduler.acquire_async(resource)
+            attempt_headers = self._attempt_headers(headers, entry, url, params, conditional)
+            send = partial(self._recorded_request, client, entry, resource, method, url, attempt_headers, **kwargs)
+            if method == "GET":
+                response, retry = await hedged_async(send, acquire=partial(entry.scheduler.acquire_async, resource))
+            else:
+                response, retry = await send()
+            if not retry or attempt == 2:
+                break
+
+        if not conditional:
+            return response
+        resolved = self.etag_cache.resolve(url, params, response, entry.fingerprint)
+        return resolved if resolved is not None else await self._send(method, url, headers, **kwargs)
+
+    async def _recorded_request(self, client, entry, resource: str, method: str, url: str, headers: dict, **kwargs):
+        """Async variant of GitHubClient._recorded_request."""
+        response = await client.request(
+            method, url, headers=headers, timeout=async_request_timeout("github"), **kwargs
         )
+        return response, self.token_pool.record(entry, resource, response)
 
-        logger.info(f"Fetching recent repos for GitHub user = {username}")
+    async def _request(self, url: str, params=None, headers=None):
+        """Conditional GET over the pooled async client of the running event loop."""
+        return await self._send("GET", url, headers=headers or self.headers, conditional=True, params=params or {})
+
+    async def _get(self, url: str, params=None, headers=None):
+        """Generic GET request."""
+        try:
+            return self._envelope(await self._request(url, params=params, headers=headers))
+        except Exception as e:
+            return self._failed(e)
+
+    @coalesced
+    async def get_recent_commits(
+        self, username: str, repo_name: str, limit: int = 100, page: int = 1, since=None, until=None, author=None
+    ):
+        """Fetch one page of commits from a repo, optionally within [since, until] and by `author` only."""
+        url, params = self._commits_request(username, repo_name, limit, page, since, until, author)
+        return await self._get(url, params=params)
 
+    @coalesced
+    async def get_pull_requests(self, username: str, repo_name: str = "autonomize-activity-monitor",
+                                page: int = None, per_page: int = None, created_since=None, created_until=None):
+        """Search the user's PRs in a specific repo (optionally created in a window, one page of many)."""
+        url, params = self._pull_requests_request(username, repo_name, page, per_page, created_since, created_until)
+        return await self._get(url, params=params)
+
+    @coalesced
+    async def get_total_commits(self, username: str, repo_name: str):
+        """Fetch total number of commits in the repo using GitHub Link headers."""
+        url, params = self._commits_request(username, repo_name, limit=1, page=1)
+        response = await self._request(url, params=params)
+
+        return self._last_page(response)
+
+    @coalesced
+    async def count_commits(self, username: str, repo_name: str, since=None, until=None, author=None):
+        """Number of commits in [since, until] (by `author` only) from a single per_page=1 request."""
+        url, params = self._commits_request(username, repo_name, limit=1, page=1, since=since, until=until,
+                                            author=author)
         try:
-            response = requests.get(url, headers=self.headers)
-            data = response.json()
-
-            if response.status_code != 200:
-                err = data.get("message", "GitHub repos fetch failed")
-                logger.error(f"GitHub Repo Error: {err}")
-                return {"success": False, "error": err}
-
-            repos = []
-            for repo in data:
-                repos.append({
-                    "name": repo.get("name"),
-                    "full_name": repo.get("full_name"),
-                    "url": repo.get("html_url"),
-                    "description": repo.get("description"),
-                    "last_pushed": repo.get("pushed_at"),
-                    "stars": repo.get("stargazers_count"),
-                    "forks": repo.get("forks_count"),
-                })
-
-            return {"success": True, "data": repos}
+            return self._count_envelope(await self._request(url, params=params))
+        except Exception as e:
+            logger.error(f"GitHub commit count error: {e}")
+            return self._failed(e)
+
+    @coalesced
+    async def count_pull_requests(self, username: str, repo_name: str = "autonomize-activity-monitor",
+                                  since=None, until=None):
+        """Number of the user's PRs created in [since, until] from the search `total_count`."""
+        url, params = self._pull_requests_request(username, repo_name, per_page=1, created_since=since,
+                                                  created_until=until)
+        return self._field_count(await self._get(url, params=params), "total_count")
+
+    @coalesced
+    async def count_repos(self, username: str):
+        """Number of the user's public repositories, from their profile."""
+        url, params = self._user_request(username)
+        return self._field_count(await self._get(url, params=params), "public_repos")
+
+    @coalesced
+    async def get_recent_repos(self, username: str, per_page: int = 100):
+        """Fetch recently-active repositories for a user, most recently pushed first."""
+        url, params = self._repos_request(username, per_page)
 
+        logger.info(f"Fetching recent repos for GitHub user = {username}")
+
+        try:
+            return self._repos_envelope(await self._request(url, params=params))
         except Exception as e:
             logger.error(f"GitHub repo fetch error: {e}")
-            return {"success": False, "error": str(e)}
+            return self._failed(e)
+
+    @coalesced
+    async def get_activity_graphql(self, username: str, since=None, until=None, commits_first: int = 100,
+                                   pr_repo_name: str = "autonomize-activity-monitor"):
+        """Fetch recent repos with their windowed commit histories and authored PRs in one GraphQL query."""
+        url, payload = self._activity_graphql_request(username, pr_repo_name, since, until, commits_first)
+
+        try:
+            response = await self._send("POST", url, headers=self.headers, json=payload)
+            return self._activity_graphql_envelope(response, username)
+        except Exception as e:
+            logger.error(f"GitHub GraphQL error: {e}")
+            return self._failed(e)
@@ -0,0 +1,259 @@
+import asyncio
+import contextvars
+import threading
+import weakref
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.core.concurrency import current_deadline
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_sessions: dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+# httpx pools are bound to the event loop that opened their connections,
+# so async clients are kept per running loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def build_session() -> requests.Session:
+    """
+    Build a keep-alive session backed by a bounded connection pool.
+    Idempotent calls (GET/HEAD/...) are retried with exponential backoff
+    on connection errors and transient 5xx responses.
+    """
+    retry = Retry(
+        total=settings.http_max_retries,
+        backoff_factor=settings.http_retry_backoff,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_connections,
+        pool_maxsize=settings.http_pool_maxsize,
+        max_retries=retry,
+        pool_block=False,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(name: str) -> requests.Session:
+    """Return the long-lived session registered under `name` (one per upstream)."""
+    session = _sessions.get(name)
+    if session is not None:
+        return session
+
+    with _lock:
+        if name not in _sessions:
+            logger.info(f"Creating pooled HTTP session for '{name}'")
+            _sessions[name] = build_session()
+        return _sessions[name]
+
+
+def close_sessions():
+    """Close every pooled session (used on application shutdown)."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """Async counterpart of build_session() with the same pool limits."""
+    limits = httpx.Limits(
+        max_connections=settings.http_pool_maxsize,
+        max_keepalive_connections=settings.http_pool_maxsize,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, retries=settings.http_max_retries)
+    return httpx.AsyncClient(transport=transport)
+
+
+def get_async_client(name: str) -> httpx.AsyncClient:
+    """Return the pooled async client for `name` on the running event loop."""
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        if name not in clients:
+            logger.info(f"Creating pooled async HTTP client for '{name}'")
+            clients[name] = build_async_client()
+        return clients[name]
+
+
+async def aclose_async_clients():
+    """Close the async clients opened on the running event loop."""
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        clients = _async_clients.pop(loop, {})
+
+    for client in clients.values():
+        await client.aclose()
+
+
+# Per-call budget of each upstream, before the request deadline caps it
+UPSTREAM_TIMEOUTS = {
+    "github": lambda: settings.github_timeout_seconds,
+    "jira": lambda: settings.jira_timeout_seconds,
+}
+
+# Hedged calls and their duplicates run here, as many as one session's
+# connection pool holds. Work is only submitted to a free worker, so a busy
+# pool means no hedging rather than calls queueing behind each other.
+_hedge_pool = ThreadPoolExecutor(max_workers=settings.http_pool_maxsize, thread_name_prefix="http-hedge")
+_hedge_slots = threading.BoundedSemaphore(settings.http_pool_maxsize)
+
+
+def time_budget(upstream: str) -> float:
+    """Seconds the next call to `upstream` may take: its budget, capped by the current request deadline."""
+    budget = UPSTREAM_TIMEOUTS[upstream]()
+    deadline = current_deadline.get()
+    if deadline is not None:
+        budget = min(budget, deadline.remaining())
+    return budget
+
+
+def request_timeout(upstream: str) -> tuple[float, float]:
+    """`timeout=` for a `requests` call; raises Timeout if the deadline already passed."""
+    budget = time_budget(upstream)
+    if budget <= 0:
+        raise requests.exceptions.Timeout(f"Request deadline exceeded before calling {upstream}.")
+    return min(settings.http_connect_timeout, budget), budget
+
+
+def async_request_timeout(upstream: str) -> httpx.Timeout:
+    """`timeout=` for an httpx call; raises TimeoutException if the deadline already passed."""
+    budget = time_budget(upstream)
+    if budget <= 0:
+        raise httpx.TimeoutException(f"Request deadline exceeded before calling {upstream}.")
+    return httpx.Timeout(budget, connect=min(settings.http_connect_timeout, budget))
+
+
+def is_timeout(error: Exception) -> bool:
+    return isinstance(error, (requests.exceptions.Timeout, httpx.TimeoutException))
+
+
+def _submit_hedged(send):
+    """Start `send` on a free hedge worker; None when every worker is busy."""
+    if not _hedge_slots.acquire(blocking=False):
+        return None
+    future = _hedge_pool.submit(contextvars.copy_context().run, send)
+    future.add_done_callback(lambda _: _hedge_slots.release())
+    return future
+
+
+def hedged(send, acquire=None):
+    """
+    Run an idempotent call; if it has not answered after
+    HTTP_HEDGE_DELAY_SECONDS, fire a duplicate and return whichever
+    succeeds first. Trims tail latency at the cost of the odd extra request.
+    Without a free worker the call runs on the caller's thread, unhedged.
+    `acquire`, when given, runs on the duplicate's worker before it is sent
+    (e.g. to take a rate-limit slot for it).
+    """
+    delay = settings.http_hedge_delay_seconds
+    if delay <= 0:
+        return send()
+
+    def duplicate():
+        if acquire is not None:
+            acquire()
+        return send()
+
+    first = _submit_hedged(send)
+    if first is None:
+        return send()
+    done, _ = wait([first], timeout=delay)
+    if done:
+        return first.result()
+
+    second = _submit_hedged(duplicate)
+    if second is None:
+        return first.result()
+
+    logger.info("Upstream call slower than hedge delay, sending a hedged duplicate")
+    pending = {first, second}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+    return first.result()
+
+
+async def hedged_async(send, acquire=None):
+    """Async variant of hedged(); the losing call is cancelled."""
+    delay = settings.http_hedge_delay_seconds
+    if delay <= 0:
+        return await send()
+
+    async def duplicate():
+        if acquire is not None:
+            await acquire()
+        return await send()
+
+    first = asyncio.ensure_future(send())
+    done, _ = await asyncio.wait({first}, timeout=delay)
+    if done:
+        return first.result()
+
+    logger.info("Upstream call slower than hedge delay, sending a hedged duplicate")
+    pending = {first, asyncio.ensure_future(duplicate())}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        return first.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def pool_stats() -> dict:
+    """
+    Connection pool usage per session and host:
+
+    {
+        "github": {
+            "api.github.com:443": {"created": 3, "in_use": 1, "idle": 2, "requests": 40}
+        }
+    }
+    """
+    stats = {}
+    with _lock:
+        sessions = dict(_sessions)
+
+    for name, session in sessions.items():
+        hosts = {}
+        for adapter in session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                hosts[f"{pool.host}:{pool.port}"] = {
+                    "created": pool.num_connections,
+                    "in_use": pool.pool.maxsize - pool.pool.qsize(),
+                    "idle": idle,
+                    "requests": pool.num_requests,
+                }
+        stats[name] = hosts
+
+    return stats
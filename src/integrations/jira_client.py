@@ -1,12 +1,28 @@
+import httpx
 import requests
+from src.core.concurrency import bounded_gather, bounded_map, coalesced
 from src.core.config import settings
 from src.core.logger import get_logger
 from src.integrations.base_client import BaseClient
+from src.integrations.rate_limiter import request_priority
+from src.integrations.http_session import (
+    async_request_timeout,
+    get_async_client,
+    get_session,
+    hedged,
+    hedged_async,
+    is_timeout,
+    request_timeout,
+)
 
 logger = get_logger(__name__)
 
-class JiraClient(BaseClient):
-    """Handles communication with the JIRA Cloud REST API."""
+
+class _JiraBase:
+    """
+    Transport-agnostic part of the JIRA client: request building and
+    response parsing shared by the sync and async clients.
+    """
 
     def __init__(self):
         self.base_url = f"{settings.jira_base_url}/rest/api/3"
@@ -16,103 +32,622 @@ class JiraClient(BaseClient):
             "Content-Type": "application/json"
         }
 
-    def get_user_activity(self, account_id: str) -> dict:
-        """Fetch issues assigned to the given JIRA accountId."""
+    def _flight_key(self, name: str, args: tuple, kwargs: dict):
+        """Single-flight key: identical calls at the same priority against the same JIRA site coalesce."""
+        return self.base_url, request_priority.get(), name, repr(args), repr(sorted(kwargs.items()))
+
+    @staticmethod
+    def _network_error(error: Exception) -> str:
+        """Error text for a failed call; timeouts are reported as "timeout"."""
+        if is_timeout(error):
+            return "timeout"
+        return "Network error contacting JIRA service."
 
-        jql = f'project = SCRUM AND assignee = "{account_id}" AND statusCategory != Done ORDER BY updated DESC'
+    @staticmethod
+    def _user_activity_jql(account_id: str) -> str:
+        return f'project = {settings.jira_project_key} AND assignee = "{account_id}" AND statusCategory != Done'
+
+    def _user_activity_request(self, account_id: str, max_results: int = None, next_page_token: str = None):
+        jql = f"{self._user_activity_jql(account_id)} ORDER BY updated DESC"
         logger.info(f"Final JQL used: {jql}")
 
         url = f"{self.base_url}/search/jql"
         payload = {
             "jql": jql,
-            "maxResults": 10,
+            "maxResults": max_results or settings.jira_page_size,
             "fields": ["summary", "status", "updated"]
         }
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        return url, payload
+
+    def _user_activity_count_request(self, account_id: str):
+        # Ordering is meaningless for a count and only costs Jira time
+        url = f"{self.base_url}/search/approximate-count"
+        return url, {"jql": self._user_activity_jql(account_id)}
+
+    def _user_updates_request(
+        self, account_id: str, updated_since: str = None, max_results: int = None, next_page_token: str = None
+    ):
+        """
+        Every issue of the user (done ones included, so transitions are seen)
+        updated at or after `updated_since` ("yyyy-MM-dd HH:mm"), oldest first.
+        """
+        jql = f'project = {settings.jira_project_key} AND assignee = "{account_id}"'
+        if updated_since:
+            jql += f' AND updated >= "{updated_since}"'
+        jql += " ORDER BY updated ASC"
+
+        url = f"{self.base_url}/search/jql"
+        payload = {
+            "jql": jql,
+            "maxResults": max_results or settings.jira_page_size,
+            "fields": ["summary", "status", "updated", "created", "resolutiondate"]
+        }
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        return url, payload
+
+    def _team_activity_request(self, account_ids: list[str], max_results: int = None, next_page_token: str = None):
+        assignees = ", ".join(f'"{a}"' for a in account_ids)
+        jql = (
+            f'project = {settings.jira_project_key} AND assignee in ({assignees}) '
+            f'AND statusCategory != Done ORDER BY updated DESC'
+        )
+        logger.info(f"Final JQL used: {jql}")
+
+        url = f"{self.base_url}/search/jql"
+        payload = {
+            "jql": jql,
+            "maxResults": max_results or settings.jira_page_size,
+            "fields": ["summary", "status", "updated", "assignee"]
+        }
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        return url, payload
+
+    @staticmethod
+    def _search_data(response, label: str) -> dict:
+        """Decode a /search/jql response, mapping HTTP and JIRA errors to {"error": ...}."""
+        # Don't use raise_for_status() — handle errors manually
+        try:
+            data = response.json()
+        except Exception as e:
+            logger.error(f"JIRA returned invalid JSON: {e}")
+            return {"error": "Invalid JSON response from JIRA."}
+
+        # Handle HTTP errors gracefully
+        if response.status_code >= 400:
+            error_msg = data.get("errorMessages", ["Unknown JIRA error"])[0]
+            logger.error(f"JIRA error for {label}: {error_msg}")
+            return {"error": error_msg}
+
+        # Handle JIRA application-level errors
+        if "errorMessages" in data:
+            error_msg = data["errorMessages"][0]
+            logger.error(f"JIRA error for {label}: {error_msg}")
+            return {"error": error_msg}
+
+        return data
+
+    @staticmethod
+    def _issue_row(issue: dict) -> dict:
+        return {
+            "key": issue.get("key"),
+            "summary": issue.get("fields", {}).get("summary"),
+            "status": issue.get("fields", {}).get("status", {}).get("name"),
+            "updated": issue.get("fields", {}).get("updated"),
+        }
+
+    @staticmethod
+    def _next_page_token(data: dict):
+        # /search/jql pages by token; absent (or isLast) means this was the last page
+        return None if data.get("isLast") else data.get("nextPageToken")
+
+    @classmethod
+    def _parse_user_activity(cls, response, account_id: str) -> dict:
+        data = cls._search_data(response, account_id)
+        if "error" in data:
+            return data
+
+        issues = [cls._issue_row(issue) for issue in data.get("issues", [])]
+
+        return {
+            "user": account_id,
+            "count": len(issues),
+            "issues": issues,
+            "next_page_token": cls._next_page_token(data),
+        }
+
+    @classmethod
+    def _sync_row(cls, issue: dict) -> dict:
+        """_issue_row plus what the activity store needs to track an issue's lifecycle."""
+        fields = issue.get("fields", {})
+        category = (fields.get("status") or {}).get("statusCategory", {}).get("key")
+        return {
+            **cls._issue_row(issue),
+            "done": category == "done",
+            "created": fields.get("created"),
+            "resolved": fields.get("resolutiondate"),
+        }
+
+    @classmethod
+    def _parse_user_updates(cls, response, account_id: str) -> dict:
+        data = cls._search_data(response, account_id)
+        if "error" in data:
+            return data
+
+        return {
+            "user": account_id,
+            "issues": [cls._sync_row(issue) for issue in data.get("issues", [])],
+            "next_page_token": cls._next_page_token(data),
+        }
+
+    @classmethod
+    def _parse_team_activity(cls, response, account_ids: list[str]) -> dict:
+        """Partition one page of an `assignee in (...)` search by assignee, in a single pass."""
+        data = cls._search_data(response, f"{len(account_ids)} users")
+        if "error" in data:
+            return {"account_ids": account_ids, **data}
+
+        issues_by_user = {a: [] for a in account_ids}
+        for issue in data.get("issues", []):
+            assignee = (issue.get("fields", {}).get("assignee") or {}).get("accountId")
+            if assignee in issues_by_user:
+                issues_by_user[assignee].append(cls._issue_row(issue))
+
+        return {
+            "account_ids": account_ids,
+            "issues_by_user": issues_by_user,
+            "next_page_token": cls._next_page_token(data),
+        }
+
+    @staticmethod
+    def chunks(account_ids: list[str]):
+        """Split account ids into the groups one `assignee in (...)` query covers."""
+        size = settings.jira_assignee_batch_size
+        for i in range(0, len(account_ids), size):
+            yield account_ids[i: i + size]
+
+    @staticmethod
+    def _parse_count(response, account_id: str) -> dict:
+        try:
+            data = response.json()
+        except Exception as e:
+            logger.error(f"JIRA returned invalid JSON: {e}")
+            return {"error": "Invalid JSON response from JIRA."}
+
+        if response.status_code >= 400 or "errorMessages" in data:
+            error_msg = data.get("errorMessages", ["Unknown JIRA error"])[0]
+            logger.error(f"JIRA count error for {account_id}: {error_msg}")
+            return {"error": error_msg}
+
+        return {"user": account_id, "count": data.get("count", 0)}
+
+    # Fields the details view renders; everything else (and the changelog) stays upstream
+    DETAIL_FIELDS = [
+        "summary", "description", "status", "priority", "assignee", "reporter",
+        "labels", "issuetype", "updated", "created", "attachment", "comment",
+    ]
+
+    def _issue_details_request(self, issue_key: str, fields: list[str] = None):
+        url = f"{self.base_url}/issue/{issue_key}"
+        return url, {"fields": ",".join(fields or self.DETAIL_FIELDS)}
+
+    def _bulk_details_request(self, issue_keys: list[str]):
+        url = f"{self.base_url}/issue/bulkfetch"
+        return url, {"issueIdsOrKeys": issue_keys, "fields": self.DETAIL_FIELDS}
+
+    def _changelog_request(self, issue_key: str, start_at: int, max_results: int = None):
+        url = f"{self.base_url}/issue/{issue_key}/changelog"
+        return url, {"startAt": start_at, "maxResults": max_results or settings.jira_changelog_page_size}
+
+    @staticmethod
+    def _parse_issue_details(response) -> dict:
+        data = response.json()
+
+        if response.status_code >= 400:
+            return {"error": data.get("errorMessages", ["Unknown error"])[0]}
+
+        return {"key": data.get("key"), "fields": data.get("fields", {})}
+
+    @classmethod
+    def _parse_bulk_details(cls, response, issue_keys: list[str]) -> dict:
+        """Map a bulkfetch response to {"issues": {key: issue}, "errors": {key: message}}."""
+        data = cls._search_data(response, f"{len(issue_keys)} issues")
+        if "error" in data:
+            return {"issues": {}, "errors": {k: data["error"] for k in issue_keys}}
+
+        issues = {i.get("key"): {"key": i.get("key"), "fields": i.get("fields", {})} for i in data.get("issues", [])}
+        errors = {}
+        for err in data.get("issueErrors", []):
+            message = (err.get("errorMessages") or ["Unknown JIRA error"])[0]
+            for key in err.get("issueIdsOrKeys", []):
+                errors[key] = message
+
+        for key in issue_keys:
+            if key not in issues:
+                errors.setdefault(key, "Issue does not exist or you do not have permission to see it.")
+        return {"issues": issues, "errors": errors}
+
+    @staticmethod
+    def _parse_changelog_page(response) -> dict:
+        data = response.json()
+
+        if response.status_code >= 400:
+            return {"error": data.get("errorMessages", ["Unknown error"])[0]}
+
+        entries = [
+            {
+                "field": item.get("field"),
+                "from": item.get("fromString"),
+                "to": item.get("toString"),
+                "created": h.get("created")
+            }
+            for h in data.get("values", [])
+            for item in h.get("items", [])
+        ]
+        histories = len(data.get("values", []))
+        is_last = data.get("isLast", data.get("startAt", 0) + histories >= data.get("total", 0))
+        return {"entries": entries, "histories": histories, "is_last": is_last or histories == 0}
+
+    @staticmethod
+    def _bulk_chunks(issue_keys: list[str]):
+        size = settings.jira_bulk_fetch_size
+        for i in range(0, len(issue_keys), size):
+            yield issue_keys[i: i + size]
+
+
+class JiraClient(_JiraBase, BaseClient):
+    """Handles communication with the JIRA Cloud REST API."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = get_session("jira")
+
+    def _post(self, url: str, payload: dict):
+        """POST within the Jira timeout budget (capped by the request deadline)."""
+        return self.session.post(
+            url, auth=self.auth, headers=self.headers, json=payload, timeout=request_timeout("jira")
+        )
+
+    def _get(self, url: str, params: dict):
+        """Idempotent GET within the Jira timeout budget; hedged when enabled."""
+        return hedged(lambda: self.session.get(
+            url, auth=self.auth, headers=self.headers, params=params, timeout=request_timeout("jira")
+        ))
+
+    @coalesced
+    def get_user_activity(self, account_id: str, max_results: int = None, next_page_token: str = None) -> dict:
+        """Fetch one page of issues assigned to the given JIRA accountId."""
+        url, payload = self._user_activity_request(account_id, max_results, next_page_token)
 
         logger.info(f"Fetching JIRA issues for accountId: {account_id}")
 
         try:
-            response = requests.post(url, auth=self.auth, headers=self.headers, json=payload)
+            response = self._post(url, payload)
+            return self._parse_user_activity(response, account_id)
 
-            # Don't use raise_for_status() — handle errors manually
-            try:
-                data = response.json()
-            except Exception as e:
-                logger.error(f"JIRA returned invalid JSON: {e}")
-                return {"error": "Invalid JSON response from JIRA."}
-
-            # Handle HTTP errors gracefully
-            if response.status_code >= 400:
-                error_msg = data.get("errorMessages", ["Unknown JIRA error"])[0]
-                logger.error(f"JIRA error for {account_id}: {error_msg}")
-                return {"error": error_msg}
-
-            # Handle JIRA application-level errors
-            if "errorMessages" in data:
-                error_msg = data["errorMessages"][0]
-                logger.error(f"JIRA error for {account_id}: {error_msg}")
-                return {"error": error_msg}
-
-            # Safe extraction
-            issues = [
-                {
-                    "key": issue.get("key"),
-                    "summary": issue.get("fields", {}).get("summary"),
-                    "status": issue.get("fields", {}).get("status", {}).get("name"),
-                    "updated": issue.get("fields", {}).get("updated"),
-                }
-                for issue in data.get("issues", [])
-            ]
-
-            return {"user": account_id, "count": len(issues), "issues": issues}
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"error": self._network_error(e)}
+
+    def iter_user_activity(self, account_id: str, page_size: int = None):
+        """
+        Yield pages of the user's issues lazily, following nextPageToken.
+        Stops after the last page or the first error page.
+        """
+        token = None
+        while True:
+            page = self.get_user_activity(account_id, max_results=page_size, next_page_token=token)
+            yield page
+
+            token = page.get("next_page_token")
+            if "error" in page or not token:
+                return
+
+    @coalesced
+    def get_user_updates(
+        self, account_id: str, updated_since: str = None, max_results: int = None, next_page_token: str = None
+    ) -> dict:
+        """One page of the user's issues (done ones too) updated since `updated_since`, oldest first."""
+        url, payload = self._user_updates_request(account_id, updated_since, max_results, next_page_token)
+
+        try:
+            response = self._post(url, payload)
+            return self._parse_user_updates(response, account_id)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error contacting JIRA: {e}")
-            return {"error": "Network error contacting JIRA service."}
+            return {"error": self._network_error(e)}
 
+    def iter_user_updates(self, account_id: str, updated_since: str = None, page_size: int = None):
+        """Yield pages of get_user_updates, following nextPageToken; stops after an error page."""
+        token = None
+        while True:
+            page = self.get_user_updates(account_id, updated_since, max_results=page_size, next_page_token=token)
+            yield page
+
+            token = page.get("next_page_token")
+            if "error" in page or not token:
+                return
+
+    @coalesced
+    def get_team_activity(self, account_ids: list[str], max_results: int = None, next_page_token: str = None) -> dict:
+        """Fetch one page of issues assigned to any of `account_ids`, partitioned per user."""
+        url, payload = self._team_activity_request(account_ids, max_results, next_page_token)
+
+        try:
+            response = self._post(url, payload)
+            return self._parse_team_activity(response, account_ids)
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"account_ids": account_ids, "error": self._network_error(e)}
+
+    def iter_team_activity(self, account_ids: list[str], page_size: int = None):
+        """
+        Yield partitioned pages for a batch of users: one `assignee in (...)`
+        query per JIRA_ASSIGNEE_BATCH_SIZE chunk, following nextPageToken.
+        A failing chunk yields its error page and the next chunk continues.
+        """
+        for chunk in self.chunks(account_ids):
+            token = None
+            while True:
+                page = self.get_team_activity(chunk, max_results=page_size, next_page_token=token)
+                yield page
+
+                token = page.get("next_page_token")
+                if "error" in page or not token:
+                    break
+
+    @coalesced
+    def count_user_activity(self, account_id: str) -> dict:
+        """Approximate number of issues for the user, without fetching them."""
+        url, payload = self._user_activity_count_request(account_id)
+
+        try:
+            response = self._post(url, payload)
+            return self._parse_count(response, account_id)
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"error": self._network_error(e)}
+
+    @coalesced
     def get_issue_details(self, issue_key: str):
-        """Fetch details of a specific JIRA issue."""
-        url = f"{self.base_url}/issue/{issue_key}?expand=changelog"
+        """Fetch the fields of a specific JIRA issue (no changelog)."""
+        url, params = self._issue_details_request(issue_key)
 
         try:
-            r = requests.get(url, auth=self.auth, headers=self.headers)
-            data = r.json()
-
-            if r.status_code >= 400:
-                return {"error": data.get("errorMessages", ["Unknown error"])[0]}
-
-            issue = {
-                "key": data.get("key"),
-                "summary": data["fields"].get("summary"),
-                "description": data["fields"].get("description"),
-                "status": data["fields"].get("status", {}).get("name"),
-                "priority": data["fields"].get("priority", {}).get("name"),
-                "assignee": data["fields"].get("assignee", {}).get("displayName"),
-                "updated": data["fields"].get("updated"),
-                "created": data["fields"].get("created"),
-                "comments": [
-                    {
-                        "author": c["author"]["displayName"],
-                        "body": c["body"],
-                        "created": c["created"]
-                    }
-                    for c in data["fields"].get("comment", {}).get("comments", [])
-                ],
-                "changelog": [
-                    {
-                        "field": h["items"][0].get("field"),
-                        "from": h["items"][0].get("fromString"),
-                        "to": h["items"][0].get("toString"),
-                        "created": h.get("created")
-                    }
-                    for h in data.get("changelog", {}).get("histories", [])
-                ]
-            }
+            r = self._get(url, params)
+            return self._parse_issue_details(r)
+
+        except Exception as e:
+            return {"error": "timeout" if is_timeout(e) else str(e)}
+
+    @coalesced
+    def get_issue_version(self, issue_key: str) -> dict:
+        """Cheap revalidation probe: only the issue's `updated` field."""
+        url, params = self._issue_details_request(issue_key, fields=["updated"])
+
+        try:
+            r = self._get(url, params)
+            return self._parse_issue_details(r)
+
+        except Exception as e:
+            return {"error": "timeout" if is_timeout(e) else str(e)}
+
+    @coalesced
+    def get_issues_details(self, issue_keys: list[str]) -> dict:
+        """
+        Fields of many issues via /issue/bulkfetch, one request per
+        JIRA_BULK_FETCH_SIZE keys with the chunks fetched concurrently.
+        """
+        def fetch(chunk):
+            url, payload = self._bulk_details_request(chunk)
+            try:
+                r = self._post(url, payload)
+                return self._parse_bulk_details(r, chunk)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Network error contacting JIRA: {e}")
+                return {"issues": {}, "errors": {k: self._network_error(e) for k in chunk}}
+
+        results = bounded_map(fetch, self._bulk_chunks(issue_keys), settings.jira_details_workers)
+        return {
+            "issues": {k: v for r in results for k, v in r["issues"].items()},
+            "errors": {k: v for r in results for k, v in r["errors"].items()},
+        }
+
+    def iter_changelog(self, issue_key: str, page_size: int = None):
+        """
+        Yield changelog entries (oldest first) lazily from the dedicated
+        changelog endpoint; a page is only requested once the previous one
+        has been consumed. A failing page is logged and ends the stream.
+        """
+        start_at = 0
+        while True:
+            url, params = self._changelog_request(issue_key, start_at, page_size)
+            try:
+                page = self._parse_changelog_page(
+                    self._get(url, params)
+                )
+            except Exception as e:
+                page = {"error": str(e)}
+
+            if "error" in page:
+                logger.error(f"JIRA changelog error for {issue_key}: {page['error']}")
+                return
+
+            yield from page["entries"]
+            if page["is_last"]:
+                return
+            start_at += page["histories"]
+
+
+class AsyncJiraClient(_JiraBase):
+    """Non-blocking JIRA client (httpx.AsyncClient) with the same API as JiraClient."""
+
+    async def _post(self, url: str, payload: dict):
+        client = get_async_client("jira")
+        return await client.post(
+            url, auth=self.auth, headers=self.headers, json=payload, timeout=async_request_timeout("jira")
+        )
+
+    async def _get(self, url: str, params: dict):
+        client = get_async_client("jira")
+        return await hedged_async(lambda: client.get(
+            url, auth=self.auth, headers=self.headers, params=params, timeout=async_request_timeout("jira")
+        ))
+
+    @coalesced
+    async def get_user_activity(self, account_id: str, max_results: int = None, next_page_token: str = None) -> dict:
+        """Fetch one page of issues assigned to the given JIRA accountId."""
+        url, payload = self._user_activity_request(account_id, max_results, next_page_token)
+
+        logger.info(f"Fetching JIRA issues for accountId: {account_id}")
+
+        try:
+            response = await self._post(url, payload)
+            return self._parse_user_activity(response, account_id)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"error": self._network_error(e)}
+
+    async def iter_user_activity(self, account_id: str, page_size: int = None):
+        """Async variant of JiraClient.iter_user_activity."""
+        token = None
+        while True:
+            page = await self.get_user_activity(account_id, max_results=page_size, next_page_token=token)
+            yield page
+
+            token = page.get("next_page_token")
+            if "error" in page or not token:
+                return
+
+    @coalesced
+    async def get_user_updates(
+        self, account_id: str, updated_since: str = None, max_results: int = None, next_page_token: str = None
+    ) -> dict:
+        """One page of the user's issues (done ones too) updated since `updated_since`, oldest first."""
+        url, payload = self._user_updates_request(account_id, updated_since, max_results, next_page_token)
+
+        try:
+            response = await self._post(url, payload)
+            return self._parse_user_updates(response, account_id)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"error": self._network_error(e)}
+
+    async def iter_user_updates(self, account_id: str, updated_since: str = None, page_size: int = None):
+        """Async variant of JiraClient.iter_user_updates."""
+        token = None
+        while True:
+            page = await self.get_user_updates(account_id, updated_since, max_results=page_size, next_page_token=token)
+            yield page
+
+            token = page.get("next_page_token")
+            if "error" in page or not token:
+                return
+
+    @coalesced
+    async def get_team_activity(self, account_ids: list[str], max_results: int = None, next_page_token: str = None) -> dict:
+        """Fetch one page of issues assigned to any of `account_ids`, partitioned per user."""
+        url, payload = self._team_activity_request(account_ids, max_results, next_page_token)
+
+        try:
+            response = await self._post(url, payload)
+            return self._parse_team_activity(response, account_ids)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"account_ids": account_ids, "error": self._network_error(e)}
+
+    async def iter_team_activity(self, account_ids: list[str], page_size: int = None):
+        """Async variant of JiraClient.iter_team_activity."""
+        for chunk in self.chunks(account_ids):
+            token = None
+            while True:
+                page = await self.get_team_activity(chunk, max_results=page_size, next_page_token=token)
+                yield page
 
-            return issue
+                token = page.get("next_page_token")
+                if "error" in page or not token:
+                    break
+
+    @coalesced
+    async def count_user_activity(self, account_id: str) -> dict:
+        """Approximate number of issues for the user, without fetching them."""
+        url, payload = self._user_activity_count_request(account_id)
+
+        try:
+            response = await self._post(url, payload)
+            return self._parse_count(response, account_id)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Network error contacting JIRA: {e}")
+            return {"error": self._network_error(e)}
+
+    @coalesced
+    async def get_issue_details(self, issue_key: str):
+        """Fetch the fields of a specific JIRA issue (no changelog)."""
+        url, params = self._issue_details_request(issue_key)
+
+        try:
+            r = await self._get(url, params)
+            return self._parse_issue_details(r)
 
         except Exception as e:
-            return {"error": str(e)}
+            return {"error": "timeout" if is_timeout(e) else str(e)}
 
+    @coalesced
+    async def get_issue_version(self, issue_key: str) -> dict:
+        """Cheap revalidation probe: only the issue's `updated` field."""
+        url, params = self._issue_details_request(issue_key, fields=["updated"])
+
+        try:
+            r = await self._get(url, params)
+            return self._parse_issue_details(r)
+
+        except Exception as e:
+            return {"error": "timeout" if is_timeout(e) else str(e)}
+
+    @coalesced
+    async def get_issues_details(self, issue_keys: list[str]) -> dict:
+        """Async variant of JiraClient.get_issues_details."""
+        async def fetch(chunk):
+            url, payload = self._bulk_details_request(chunk)
+            try:
+                r = await self._post(url, payload)
+                return self._parse_bulk_details(r, chunk)
+            except httpx.HTTPError as e:
+                logger.error(f"Network error contacting JIRA: {e}")
+                return {"issues": {}, "errors": {k: self._network_error(e) for k in chunk}}
+
+        results = await bounded_gather(fetch, self._bulk_chunks(issue_keys), settings.jira_details_workers)
+        return {
+            "issues": {k: v for r in results for k, v in r["issues"].items()},
+            "errors": {k: v for r in results for k, v in r["errors"].items()},
+        }
+
+    async def iter_changelog(self, issue_key: str, page_size: int = None):
+        """Async variant of JiraClient.iter_changelog."""
+        start_at = 0
+        while True:
+            url, params = self._changelog_request(issue_key, start_at, page_size)
+            try:
+                page = self._parse_changelog_page(await self._get(url, params))
+            except Exception as e:
+                page = {"error": str(e)}
 
+            if "error" in page:
+                logger.error(f"JIRA changelog error for {issue_key}: {page['error']}")
+                return
 
+            for entry in page["entries"]:
+                yield entry
+            if page["is_last"]:
+                return
+            start_at += page["histories"]
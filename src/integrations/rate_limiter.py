@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+# Callers serving a user request run as interactive (the default); batch
+# jobs wrap their work in `background_priority()`.
+request_priority: ContextVar[str] = ContextVar("request_priority", default=PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def background_priority():
+    """Run the enclosed upstream calls at background priority."""
+    token = request_priority.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call would have to wait longer than its priority allows."""
+
+
+class TokenBucket:
+    """Classic token bucket: `capacity` tokens, refilled at `rate` tokens/second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, reserve: int = 0) -> float:
+        """Seconds until a token is available above `reserve` (0 = take it now)."""
+        self._refill()
+        if self.tokens >= reserve + 1:
+            self.tokens -= 1
+            return 0.0
+        return (reserve + 1 - self.tokens) / self.rate
+
+
+class RateLimitScheduler:
+    """
+    Tracks GitHub's per-resource budgets from X-RateLimit-* headers and
+    decides how long a call must wait before it may be sent.
+
+    - core/graphql: wait for the reset once `remaining` is exhausted
+    - search: local 30/min token bucket (GitHub's search limit)
+    - Retry-After / secondary limits block every resource until they lapse
+    - background callers leave a reserve of budget for interactive ones
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.budgets: dict[str, dict] = {}
+        self.blocked_until = 0.0
+        self.buckets = {
+            "search": TokenBucket(settings.github_search_per_minute / 60.0, settings.github_search_per_minute),
+        }
+        self.reserves = {
+            "core": settings.github_core_background_reserve,
+            "graphql": settings.github_core_background_reserve,
+            "search": settings.github_search_background_reserve,
+        }
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        if "/search/" in url:
+            return "search"
+        if url.rstrip("/").endswith("/graphql"):
+            return "graphql"
+        return "core"
+
+    def _delay(self, resource: str, priority: str) -> float:
+        now = time.time()
+        reserve = self.reserves.get(resource, 0) if priority == PRIORITY_BACKGROUND else 0
+
+        if self.blocked_until > now:
+            return self.blocked_until - now
+
+        budget = self.budgets.get(resource)
+        if budget and budget["reset"] > now and budget["remaining"] <= reserve:
+            return budget["reset"] - now
+
+        bucket = self.buckets.get(resource)
+        if bucket:
+            return bucket.wait_time(reserve)
+
+        return 0.0
+
+    def _next_wait(self, resource: str, priority: Optional[str], max_wait: Optional[float]) -> float:
+        priority = priority or request_priority.get()
+        if max_wait is None and priority == PRIORITY_INTERACTIVE:
+            max_wait = settings.github_max_wait_seconds
+
+        with self._lock:
+            delay = self._delay(resource, priority)
+
+        if max_wait is not None and delay > max_wait:
+            raise RateLimitExceeded(
+                f"GitHub {resource} rate limit exhausted; retry in {int(delay) + 1}s."
+            )
+        return delay
+
+    def acquire(self, resource: str, priority: str = None, max_wait: float = None):
+        """Block until a `resource` call may be sent (raises RateLimitExceeded if too long)."""
+        while True:
+            delay = self._next_wait(resource, priority, max_wait)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self, resource: str, priority: str = None, max_wait: float = None):
+        """Async variant of acquire()."""
+        while True:
+            delay = self._next_wait(resource, priority, max_wait)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def record(self, resource: str, response) -> bool:
+        """
+        Update budgets from a response's headers. Returns True when the
+        response was a rate-limit rejection (caller may retry once).
+        """
+        headers = response.headers
+        now = time.time()
+
+        with self._lock:
+            if headers.get("X-RateLimit-Remaining") is not None:
+                resource = headers.get("X-RateLimit-Resource", resource)
+                self.budgets[resource] = {
+                    "limit": int(headers.get("X-RateLimit-Limit", 0)),
+                    "remaining": int(headers["X-RateLimit-Remaining"]),
+                    "reset": float(headers.get("X-RateLimit-Reset", now)),
+                }
+
+            if response.status_code not in (403, 429):
+                return False
+
+            retry_after = headers.get("Retry-After")
+            budget = self.budgets.get(resource)
+
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + float(retry_after))
+            elif budget and budget["remaining"] == 0:
+                self.blocked_until = max(self.blocked_until, budget["reset"])
+            elif response.status_code == 429:
+                # Secondary limit without a hint: GitHub asks for at least a minute
+                self.blocked_until = max(self.blocked_until, now + 60)
+            else:
+                return False
+
+        logger.warning(f"GitHub {resource} rate limited until {time.ctime(self.blocked_until)}")
+        return True
+
+    def snapshot(self) -> dict:
+        """Current budgets for /health."""
+        now = time.time()
+        with self._lock:
+            budgets = {
+                name: {**b, "reset_in": max(0, int(b["reset"] - now))}
+                for name, b in self.budgets.items()
+            }
+            for name, bucket in self.buckets.items():
+                bucket._refill()
+                budgets.setdefault(name, {})["local_tokens"] = int(bucket.tokens)
+
+            return {
+                "budgets": budgets,
+                "blocked_for": max(0, int(self.blocked_until - now)),
+            }
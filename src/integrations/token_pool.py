@@ -0,0 +1,98 @@
+import hashlib
+import threading
+import time
+
+from src.core.config import settings
+from src.core.logger import get_logger
+from src.integrations.rate_limiter import RateLimitScheduler
+
+logger = get_logger(__name__)
+
+
+class PooledToken:
+    """One GitHub credential with its own rate-limit budgets."""
+
+    def __init__(self, token: str):
+        self.token = token
+        self.scheduler = RateLimitScheduler()
+        self.quarantined_until = 0.0
+        self.revoked = False
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable, non-secret id of the credential (keys per-token caches)."""
+        return hashlib.sha256(self.token.encode()).hexdigest()[:16] if self.token else "anonymous"
+
+    @property
+    def label(self) -> str:
+        return f"…{self.token[-4:]}" if self.token else "anonymous"
+
+    def remaining(self, resource: str) -> float:
+        budget = self.scheduler.budgets.get(resource)
+        if not budget or budget["reset"] <= time.time():
+            return float("inf")  # unknown or already reset: worth probing
+        return budget["remaining"]
+
+
+class TokenPool:
+    """
+    Routes each GitHub request to the credential with the most remaining
+    budget for that resource. Exhausted tokens are quarantined until their
+    reset; revoked ones (401) for GITHUB_TOKEN_QUARANTINE_SECONDS.
+    """
+
+    def __init__(self, tokens: list[str]):
+        self._lock = threading.Lock()
+        self.tokens = [PooledToken(t) for t in tokens] or [PooledToken("")]
+
+    @classmethod
+    def from_settings(cls) -> "TokenPool":
+        tokens = [t.strip() for t in settings.github_tokens.split(",")]
+        tokens.append(settings.github_token)
+        # Keep order, drop blanks and duplicates
+        return cls(list(dict.fromkeys(t for t in tokens if t)))
+
+    def select(self, resource: str) -> PooledToken:
+        now = time.time()
+        with self._lock:
+            healthy = [t for t in self.tokens if t.quarantined_until <= now]
+            if healthy:
+                return max(healthy, key=lambda t: t.remaining(resource))
+
+            # Everything is quarantined: the one that frees up first; its
+            # scheduler decides whether the caller may wait that long.
+            return min(self.tokens, key=lambda t: t.quarantined_until)
+
+    def record(self, entry: PooledToken, resource: str, response) -> bool:
+        """Feed the response to the token's scheduler; quarantine it when unusable."""
+        limited = entry.scheduler.record(resource, response)
+
+        with self._lock:
+            if response.status_code == 401 and entry.token:
+                entry.revoked = True
+                entry.quarantined_until = time.time() + settings.github_token_quarantine_seconds
+                logger.error(f"GitHub token {entry.label} rejected (401); quarantined")
+            elif limited:
+                entry.quarantined_until = max(entry.quarantined_until, entry.scheduler.blocked_until)
+            else:
+                budget = entry.scheduler.budgets.get(resource)
+                if budget and budget["remaining"] == 0:
+                    entry.quarantined_until = max(entry.quarantined_until, budget["reset"])
+
+        # With other healthy tokens around, a rejected call is worth retrying at once
+        return limited or (response.status_code == 401 and len(self.tokens) > 1)
+
+    def snapshot(self) -> dict:
+        """Per-token budgets for /health (tokens are masked)."""
+        now = time.time()
+        return {
+            "tokens": [
+                {
+                    "token": t.label,
+                    "revoked": t.revoked,
+                    "quarantined_for": max(0, int(t.quarantined_until - now)),
+                    **t.scheduler.snapshot(),
+                }
+                for t in self.tokens
+            ]
+        }
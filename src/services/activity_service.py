@@ -1,14 +1,61 @@
+import asyncio
+import contextvars
+import threading
+
 from src.api.utils.response_builder import success, failure
+from src.core.cache import TTLCache
+from src.core.concurrency import (
+    Deadline,
+    bounded_gather,
+    deadline_scope,
+    fan_out,
+    fan_out_async,
+    iter_completed_async,
+)
+from src.core.config import settings
+from src.core.logger import get_logger
+from src.integrations.rate_limiter import background_priority
 from src.services.activity_summary_service import ActivitySummaryService
 from src.services.jira_service import JiraService
 from src.services.github_service import GitHubService
+from src.services.pagination import without_cursors
 from src.services.period_parser import PeriodParser
 from src.services.query_parser_service import QueryParserService
 from src.services.intent_service import IntentService
 from src.core.user_resolver import UserResolver
 
+logger = get_logger(__name__)
+
+# Upstream sources each intent needs; FULL_ACTIVITY (and anything unknown)
+# fetches Jira plus the fused GitHub activity and builds the summary.
+FETCH_PLANS = {
+    "JIRA_ISSUES": ("jira",),
+    "GITHUB_COMMITS": ("commits",),
+    "GITHUB_PRS": ("prs",),
+    "GITHUB_REPOS": ("recent_repos",),
+}
+FULL_PLAN = ("jira", "github")
+# Streaming splits GitHub into its sections so each can be sent when ready
+FULL_STREAM_PLAN = ("jira", "commits", "prs", "recent_repos")
+
+# How long each source's data may be served from the response cache
+SOURCE_TTLS = {
+    "jira": lambda: settings.activity_cache_ttl_jira,
+    "commits": lambda: settings.activity_cache_ttl_github,
+    "prs": lambda: settings.activity_cache_ttl_github,
+    "recent_repos": lambda: settings.activity_cache_ttl_github,
+    "github": lambda: settings.activity_cache_ttl_github,
+}
+
 
 class ActivityService:
+    # Rendered responses keyed on (user, intent, period, limit, offset);
+    # shared by all instances so identical questions reuse one fetch.
+    response_cache = TTLCache(settings.activity_cache_size)
+    _refreshing: set = set()
+    _refresh_lock = threading.Lock()
+    _refresh_tasks: set = set()
+
     def __init__(self):
         self.jira = JiraService()
         self.github = GitHubService()
@@ -28,14 +75,14 @@ class ActivityService:
     def _build_jira_items(self, jira_data):
         return {"jira": jira_data}
 
-    def _build_github_commits_items(self, github_data):
-        return {"commits": github_data["data"]["items"]["commits"]}
+    def _build_github_commits_items(self, commits_data):
+        return {"commits": commits_data}
 
-    def _build_github_prs_items(self, github_data):
-        return {"prs": github_data["data"]["items"]["prs"]}
+    def _build_github_prs_items(self, prs_data):
+        return {"prs": prs_data}
 
-    def _build_github_repos_items(self, github_data):
-        return {"repos": github_data["data"]["items"]["recent_repos"]}
+    def _build_github_repos_items(self, repos_data):
+        return {"repos": repos_data}
 
     def _build_full_activity_items(self, jira_data, github_data, summary_text):
         return {
@@ -44,61 +91,462 @@ class ActivityService:
             "summary": summary_text
         }
 
-    #   MAIN ENTRYPOINT — clean, readable, no duplication
-    def get_activity(self, question: str, limit: int = 5, offset: int = 0):
+    #   STEPS 1-2 — identify the user and resolve their accounts
+    def _identify(self, question: str):
+        """Return (user_name, ids, early_response); early_response ends the request."""
         # 1. Identify user
         user_name = QueryParserService.extract_user(question)
         if not user_name:
-            return failure("Could not identify the user from our records!")
+            return None, None, failure("Could not identify the user from our records!")
 
         # 2. Resolve accounts
+        return self._resolve_accounts(user_name)
+
+    @staticmethod
+    def _resolve_accounts(user_name: str):
         ids = UserResolver.resolve(user_name)
         if not ids:
-            return success(
+            return user_name, None, success(
                 message=f"No accountId configured for '{user_name}'.",
                 items={},
                 meta={}
             )
 
+        return user_name, ids, None
+
+    @staticmethod
+    def _fetch_timeout(name: str):
+        return failure(f"Timed out fetching {name} activity.", "timeout")
+
+    @staticmethod
+    def _within(deadline, fn):
+        """
+        Run `fn` with `deadline` as the current request deadline, which caps
+        every upstream timeout. Sections are answered in one go, so their
+        pages open no cursor snapshots.
+        """
+        def run():
+            with deadline_scope(deadline), without_cursors():
+                return fn()
+        return run
+
+    @staticmethod
+    def _within_async(deadline, fn):
+        async def run():
+            with deadline_scope(deadline), without_cursors():
+                return await fn()
+        return run
+
+    @classmethod
+    def _degraded(cls, fetched: dict, prefix: str = "") -> dict:
+        """
+        Sources whose section failed, with why: {"jira": "timeout",
+        "github.prs": "error"}. Looks inside the fused GitHub section.
+        """
+        degraded = {}
+        for name, section in fetched.items():
+            if not isinstance(section, dict):
+                continue
+            if not section.get("success", True):
+                degraded[prefix + name] = "timeout" if section.get("error") == "timeout" else "error"
+                continue
+
+            nested = (section.get("data") or {}).get("items")
+            if name == "github" and isinstance(nested, dict):
+                degraded.update(cls._degraded(nested, prefix=f"{name}."))
+        return degraded
+
+    #   STEP 4 — only the sources the intent needs
+    def _fetch_tasks(self, intent, ids, limit, offset, period, deadline):
         jira_id = ids["jira"]
         github_username = ids["github"]
 
+        tasks = {
+            "jira": lambda: self.jira.get_user_issues(jira_id, limit, offset),
+            "commits": lambda: self.github.get_user_commits(github_username, limit, offset, period),
+            "prs": lambda: self.github.get_user_prs(github_username, limit, offset, period),
+            "recent_repos": lambda: self.github.get_recent_repos(github_username, limit, offset),
+            "github": lambda: self.github.get_user_github_activity(
+                github_username,
+                limit,
+                offset,
+                period,
+                deadline=deadline,
+            ),
+        }
+        return {name: self._within(deadline, tasks[name]) for name in FETCH_PLANS.get(intent, FULL_PLAN)}
+
+    def _fetch_tasks_async(self, intent, ids, limit, offset, period, deadline, plan=None):
+        jira_id = ids["jira"]
+        github_username = ids["github"]
+
+        tasks = {
+            "jira": lambda: self.jira.get_user_issues_async(jira_id, limit, offset),
+            "commits": lambda: self.github.get_user_commits_async(github_username, limit, offset, period),
+            "prs": lambda: self.github.get_user_prs_async(github_username, limit, offset, period),
+            "recent_repos": lambda: self.github.get_recent_repos_async(github_username, limit, offset),
+            "github": lambda: self.github.get_user_github_activity_async(
+                github_username,
+                limit,
+                offset,
+                period,
+                deadline=deadline,
+            ),
+        }
+        return {name: self._within_async(deadline, tasks[name]) for name in plan or FETCH_PLANS.get(intent, FULL_PLAN)}
+
+    #   RESPONSE CACHE — fresh hits return at once, stale ones also trigger a refresh
+    @staticmethod
+    def _cache_key(user_name, intent, period, limit, offset):
+        return user_name.lower(), intent, period, limit, offset
+
+    def _store(self, key, intent, fetched, response):
+        """Cache a response for the shortest TTL among its sources; never cache failed or partial ones."""
+        if self._degraded(fetched):
+            return
+
+        ttl = min(SOURCE_TTLS[name]() for name in FETCH_PLANS.get(intent, FULL_PLAN))
+        if ttl > 0:
+            self.response_cache.set(key, response, ttl, settings.activity_cache_stale_seconds)
+
+    def _claim_refresh(self, key) -> bool:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key):
+        with self._refresh_lock:
+            self._refreshing.discard(key)
+
+    def _refresh_in_background(self, key, compute):
+        """Re-run `compute` on a daemon thread at background rate-limit priority."""
+        if not self._claim_refresh(key):
+            return
+
+        def run():
+            try:
+                with background_priority():
+                    compute()
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._release_refresh(key)
+
+        ctx = contextvars.copy_context()
+        threading.Thread(target=ctx.run, args=(run,), daemon=True, name="activity-refresh").start()
+
+    def _refresh_in_background_async(self, key, compute):
+        """Async variant: schedule `compute()` as a task on the running loop."""
+        if not self._claim_refresh(key):
+            return
+
+        async def run():
+            try:
+                with background_priority():
+                    await compute()
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._release_refresh(key)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    #   MAIN ENTRYPOINT — clean, readable, no duplication
+    def get_activity(self, question: str, limit: int = 5, offset: int = 0, deadline: Deadline = None):
+        """
+        Answer a question. Every upstream call is bounded by `deadline`
+        (default ACTIVITY_DEADLINE_SECONDS); sections that miss it come back
+        as timed-out failures and are listed in meta.degraded.
+        """
+        user_name, ids, early = self._identify(question)
+        if early:
+            return early
+
         # 3. Determine intent
         intent = IntentService.detect_intent(question)
         period = PeriodParser.detect_period(question)
 
-        # 4. Fetch raw data once
-        jira_data = self.jira.get_user_issues(jira_id, limit, offset)
-        github_data = self.github.get_user_github_activity(
-            github_username,
-            limit,
-            offset,
-            period,
+        key = self._cache_key(user_name, intent, period, limit, offset)
+
+        cached, state = self.response_cache.lookup(key)
+        if state == TTLCache.STALE:
+            self._refresh_in_background(
+                key, lambda: self._fetch_and_respond(key, intent, user_name, ids, limit, offset, period)
+            )
+        if cached is not None:
+            return cached
+
+        return self._fetch_and_respond(key, intent, user_name, ids, limit, offset, period, deadline)
+
+    def _fetch_and_respond(self, key, intent, user_name, ids, limit, offset, period, deadline=None):
+        # 4. Fetch what the intent needs — in parallel, one shared deadline
+        deadline = deadline or Deadline(settings.activity_deadline_seconds)
+        fetched = fan_out(
+            self._fetch_tasks(intent, ids, limit, offset, period, deadline),
+            deadline=deadline,
+            on_timeout=self._fetch_timeout,
+        )
+
+        response = self._respond(intent, user_name, fetched, limit, offset, ids, period)
+        self._store(key, intent, fetched, response)
+        return response
+
+    async def get_activity_async(self, question: str, limit: int = 5, offset: int = 0, deadline: Deadline = None):
+        """Async variant of get_activity (non-blocking upstream calls)."""
+        early, plan = await self._plan_question_async(question)
+        if early:
+            return early
+
+        return await self._answer_async(*plan, limit, offset, deadline)
+
+    async def stream_activity_async(self, question: str, limit: int = 5, offset: int = 0, deadline: Deadline = None):
+        """
+        Streaming variant of get_activity_async. Yields one
+        {"event": "section", "section", "data"} per source the moment it is
+        ready (plus the summary for full activity), then a final
+        {"event": "complete", "data"} carrying the usual response.
+        """
+        early, plan = await self._plan_question_async(question)
+        if early:
+            yield {"event": "complete", "data": early}
+            return
+
+        user_name, ids, intent, period = plan
+        key = self._cache_key(user_name, intent, period, limit, offset)
+
+        cached, state = self.response_cache.lookup(key)
+        if cached is not None:
+            if state == TTLCache.STALE:
+                self._refresh_in_background_async(
+                    key, lambda: self._fetch_and_respond_async(key, intent, user_name, ids, limit, offset, period)
+                )
+            for name, section in self._stream_sections(cached["data"]["items"]):
+                yield {"event": "section", "section": name, "data": section}
+            yield {"event": "complete", "data": cached}
+            return
+
+        full = intent not in FETCH_PLANS
+        deadline = deadline or Deadline(settings.activity_deadline_seconds)
+        tasks = self._fetch_tasks_async(
+            intent, ids, limit, offset, period, deadline, plan=FULL_STREAM_PLAN if full else None
+        )
+
+        fetched = {}
+        async for name, result in iter_completed_async(tasks, deadline=deadline, on_timeout=self._fetch_timeout):
+            fetched[name] = result
+            yield {"event": "section", "section": name, "data": result}
+
+        if full:
+            # Reassemble the fused GitHub envelope the non-streaming path returns
+            sections = {name: fetched.pop(name) for name in FULL_STREAM_PLAN[1:]}
+            fetched["github"] = success(message=f"GitHub activity retrieved for {ids['github']}.", items=sections)
+
+        response = self._respond(intent, user_name, fetched, limit, offset, ids, period)
+        self._store(key, intent, fetched, response)
+
+        if full:
+            yield {"event": "section", "section": "summary", "data": response["data"]["items"]["summary"]}
+        yield {"event": "complete", "data": response}
+
+    @staticmethod
+    def _stream_sections(items: dict):
+        """
+        (section, data) of a cached response under the names a live stream
+        uses: the fused GitHub envelope is split into its sections and the
+        repos builder's `repos` is sent as `recent_repos`.
+        """
+        for name, data in items.items():
+            nested = (data.get("data") or {}).get("items") if name == "github" and isinstance(data, dict) else None
+            if isinstance(nested, dict):
+                yield from nested.items()
+            else:
+                yield ("recent_repos" if name == "repos" else name), data
+
+    async def _plan_question_async(self, question: str):
+        """Steps 1-3 for one question: (early_response, (user_name, ids, intent, period))."""
+        user_name, ids, early = self._identify(question)
+        if early:
+            return early, None
+
+        # 3. Determine intent
+        intent = await IntentService.detect_intent_async(question)
+        period = PeriodParser.detect_period(question)
+        return None, (user_name, ids, intent, period)
+
+    def _plan_user(self, user_name: str):
+        """A bare user name asks for their full activity over the default period."""
+        user_name, ids, early = self._resolve_accounts(user_name)
+        if early:
+            return early, None
+        return None, (user_name, ids, "FULL_ACTIVITY", "default")
+
+    async def _plan_user_async(self, user_name: str):
+        return self._plan_user(user_name)
+
+    async def _answer_async(self, user_name, ids, intent, period, limit, offset, deadline=None):
+        key = self._cache_key(user_name, intent, period, limit, offset)
+
+        cached, state = self.response_cache.lookup(key)
+        if state == TTLCache.STALE:
+            self._refresh_in_background_async(
+                key, lambda: self._fetch_and_respond_async(key, intent, user_name, ids, limit, offset, period)
+            )
+        if cached is not None:
+            return cached
+
+        return await self._fetch_and_respond_async(key, intent, user_name, ids, limit, offset, period, deadline)
+
+    async def get_activity_batch_async(
+        self,
+        questions: list[str] = None,
+        users: list[str] = None,
+        limit: int = 5,
+        offset: int = 0,
+        deadline: Deadline = None,
+    ):
+        """
+        Answer many questions and/or user names in one call. Requests that
+        resolve to the same (user, intent, period) are fetched once; distinct
+        ones run ACTIVITY_BATCH_CONCURRENCY at a time under one shared
+        `deadline`. Results keep input order: questions first, then users.
+        """
+        entries = [(self._plan_question_async, q) for q in questions or []]
+        entries += [(self._plan_user_async, u) for u in users or []]
+
+        planned = await bounded_gather(
+            lambda entry: entry[0](entry[1]), entries, settings.activity_batch_concurrency
         )
 
-        # 5. Generate summary (deterministic)
-        summary_text = self.summarizer.generate(user_name, jira_data, github_data)
+        unique = {}
+        for early, plan in planned:
+            if not early:
+                unique.setdefault(self._cache_key(plan[0], plan[2], plan[3], limit, offset), plan)
+
+        keys = list(unique)
+        answers = await bounded_gather(
+            lambda key: self._answer_async(*unique[key], limit, offset, deadline), keys, settings.activity_batch_concurrency
+        )
+        by_key = dict(zip(keys, answers))
 
-        # 6. Intent → Response builder mapping
+        results = [
+            early or by_key[self._cache_key(plan[0], plan[2], plan[3], limit, offset)]
+            for early, plan in planned
+        ]
+
+        return success(
+            message=f"Answered {len(results)} request(s).",
+            items=results,
+            meta={"requested": len(results), "fetched": len(keys), "limit": limit, "offset": offset}
+        )
+
+    async def _fetch_and_respond_async(self, key, intent, user_name, ids, limit, offset, period, deadline=None):
+        # 4. Fetch what the intent needs — concurrently, one shared deadline
+        deadline = deadline or Deadline(settings.activity_deadline_seconds)
+        fetched = await fan_out_async(
+            self._fetch_tasks_async(intent, ids, limit, offset, period, deadline),
+            deadline=deadline,
+            on_timeout=self._fetch_timeout,
+        )
+
+        response = self._respond(intent, user_name, fetched, limit, offset, ids, period)
+        self._store(key, intent, fetched, response)
+        return response
+
+    #   SUMMARY — exact counts from the store's daily rollups whenever they are fresh
+    def _rollup_counts(self, ids, period):
+        return self.summarizer.rollup_counts(ids or {}, *self.github.resolve_period(period))
+
+    def _summary(self, user_name, ids, period, fetched):
+        counts = self._rollup_counts(ids, period)
+        return self.summarizer.generate(user_name, fetched["jira"], fetched["github"], counts, period)
+
+    async def get_counts_async(self, user_name: str, period: str = "default", deadline: Deadline = None):
+        """
+        Activity counts only (summaries, dashboards). Fresh rollups answer
+        from the store; otherwise a handful of count-only upstream requests
+        (search total_count, Link rel="last", Jira's approximate count)
+        instead of downloading the lists.
+        """
+        user_name, ids, early = self._resolve_accounts(user_name)
+        if early:
+            return early
+
+        counts, meta = await self._counts_async(ids, period, deadline)
+        return success(message=f"Activity counts for {user_name}", items=counts, meta=meta)
+
+    async def get_summary_async(self, user_name: str, period: str = "default", deadline: Deadline = None):
+        """Only the summary for a user, rendered from get_counts_async's counts."""
+        user_name, ids, early = self._resolve_accounts(user_name)
+        if early:
+            return early
+
+        counts, meta = await self._counts_async(ids, period, deadline)
+        summary = self.summarizer.generate_from_counts(user_name, counts, period)
+        return success(
+            message=f"Activity summary for {user_name}",
+            items={"summary": summary, "counts": counts},
+            meta=meta
+        )
+
+    async def _counts_async(self, ids, period, deadline=None):
+        counts = self._rollup_counts(ids, period)
+        if counts is not None:
+            return counts, {"period": period, "source": "rollups"}
+
+        deadline = deadline or Deadline(settings.activity_deadline_seconds)
+        tasks = {}
+        if ids.get("jira"):
+            tasks["jira"] = lambda: self.jira.count_user_issues_async(ids["jira"])
+        if ids.get("github"):
+            tasks["github"] = lambda: self.github.count_user_activity_async(ids["github"], period, deadline=deadline)
+
+        fetched = await fan_out_async(
+            {name: self._within_async(deadline, fn) for name, fn in tasks.items()},
+            deadline=deadline,
+            on_timeout=self._fetch_timeout,
+        )
+
+        counts, degraded = {}, self._degraded(fetched)
+        if fetched.get("jira", {}).get("success"):
+            counts["active_issues"] = fetched["jira"]["data"]["items"]
+        if fetched.get("github", {}).get("success"):
+            github = fetched["github"]["data"]
+            counts.update(commits=github["items"]["commits"], prs_opened=github["items"]["prs"])
+            if "repos" in github["items"]:
+                counts["repos"] = github["items"]["repos"]
+            degraded.update({f"github.{name}": why for name, why in github["meta"]["degraded"].items()})
+        return counts, {"period": period, "source": "upstream", "degraded": degraded}
+
+    #   STEPS 5-9 — shared by the sync and async entrypoints
+    def _respond(self, intent, user_name, fetched, limit, offset, ids=None, period=None):
+        # 5. Intent → Response builder mapping
         intent_builders = {
-            "JIRA_ISSUES": lambda: self._build_jira_items(jira_data),
-            "GITHUB_COMMITS": lambda: self._build_github_commits_items(github_data),
-            "GITHUB_PRS": lambda: self._build_github_prs_items(github_data),
-            "GITHUB_REPOS": lambda: self._build_github_repos_items(github_data),
+            "JIRA_ISSUES": lambda: self._build_jira_items(fetched["jira"]),
+            "GITHUB_COMMITS": lambda: self._build_github_commits_items(fetched["commits"]),
+            "GITHUB_PRS": lambda: self._build_github_prs_items(fetched["prs"]),
+            "GITHUB_REPOS": lambda: self._build_github_repos_items(fetched["recent_repos"]),
         }
 
-        # 7. Pick builder
+        # 6-7. Pick builder; the summary (deterministic) is only built for full activity
         items = intent_builders.get(
             intent,
-            lambda: self._build_full_activity_items(jira_data, github_data, summary_text)
+            lambda: self._build_full_activity_items(
+                fetched["jira"],
+                fetched["github"],
+                self._summary(user_name, ids, period, fetched),
+            )
         )()
 
         # 8. Top-level message
         top_message = self._intent_message(intent, user_name)
 
-        # 9. Final unified response
+        # 9. Final unified response; partial answers name their degraded sources
         return success(
             message=top_message,
             items=items,
-            meta={"limit": limit, "offset": offset}
+            meta={"limit": limit, "offset": offset, "degraded": self._degraded(fetched)}
         )
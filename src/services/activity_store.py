@@ -0,0 +1,448 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    repo TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    username TEXT NOT NULL,
+    message TEXT,
+    timestamp TEXT,
+    at TEXT NOT NULL,
+    url TEXT,
+    PRIMARY KEY (repo, sha)
+);
+CREATE INDEX IF NOT EXISTS commits_user_at ON commits (username, at DESC);
+
+CREATE TABLE IF NOT EXISTS prs (
+    url TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    repo TEXT,
+    title TEXT,
+    state TEXT,
+    created_at TEXT NOT NULL,
+    merged_at TEXT,
+    closed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS prs_user_created ON prs (username, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS repos (
+    full_name TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    name TEXT,
+    url TEXT,
+    description TEXT,
+    last_pushed TEXT,
+    stars INTEGER,
+    forks INTEGER
+);
+CREATE INDEX IF NOT EXISTS repos_user_pushed ON repos (username, last_pushed DESC);
+
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    account_id TEXT NOT NULL,
+    summary TEXT,
+    status TEXT,
+    done INTEGER NOT NULL DEFAULT 0,
+    updated TEXT,
+    updated_at TEXT NOT NULL,
+    created_at TEXT,
+    resolved_at TEXT
+);
+CREATE INDEX IF NOT EXISTS issues_user_updated ON issues (account_id, updated_at DESC);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    source TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    cursor TEXT,
+    synced_at REAL,
+    PRIMARY KEY (source, subject)
+);
+
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    subject TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (subject, metric, day)
+);
+"""
+
+# Per-user, per-day counters kept alongside each table:
+# table -> (key columns, user column, {metric: timestamp column that dates it})
+ROLLUPS = {
+    "commits": (("repo", "sha"), "username", {"commits": "at"}),
+    "prs": (("url",), "username", {"prs_opened": "created_at", "prs_merged": "merged_at"}),
+    "issues": (("key",), "account_id", {"issues_opened": "created_at", "issues_closed": "resolved_at"}),
+}
+
+
+def utc_iso(value) -> Optional[str]:
+    """
+    Normalize a datetime or ISO string (GitHub 'Z', Jira '+0530', ...) to
+    'YYYY-MM-DDTHH:MM:SSZ' so stored timestamps sort and compare as text.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")  # Jira
+        except ValueError:
+            try:
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ActivityStore:
+    """
+    Embedded SQLite store of normalized commits, PRs, repos and Jira issues,
+    filled by SyncService. Rows come back in the shapes the services already
+    emit. Every table is indexed on (user, timestamp) so per-user windows are
+    index range scans. Each thread gets its own connection (WAL mode lets
+    readers run alongside the syncing writer).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _tx(self):
+        """
+        Write transaction that takes the write lock up front, so what it reads
+        (e.g. the old rows behind rollup deltas) cannot change before it writes.
+        """
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
+    def _query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        return self._conn().execute(sql, params).fetchall()
+
+    def _count(self, sql: str, params: tuple = ()) -> int:
+        return self._conn().execute(sql, params).fetchone()[0]
+
+    def _iter(self, sql: str, params: tuple, start: int, shape, chunk: int = 100) -> Iterator[dict]:
+        """Rows of `sql` from position `start` on, read `chunk` at a time (backs pagination cursors)."""
+        while True:
+            rows = self._query(f"{sql} LIMIT ? OFFSET ?", params + (chunk, start))
+            yield from map(shape, rows)
+            if len(rows) < chunk:
+                return
+            start += chunk
+
+    # ---- writes (bulk upserts) -------------------------------------------
+    @staticmethod
+    def _replace(conn: sqlite3.Connection, table: str, columns: tuple, rows: list[tuple]):
+        """
+        INSERT OR REPLACE `rows`, moving each row's daily rollup counts from
+        its stored dates to its new ones (so re-synced rows are not counted
+        twice and e.g. a PR merge adds one `prs_merged` on the merge day).
+        """
+        keys, user, metrics = ROLLUPS.get(table, ((), None, {}))
+        if metrics:
+            latest = {tuple(row[columns.index(k)] for k in keys): row for row in rows}  # last write wins
+            rows = list(latest.values())
+
+            lookup = f"SELECT * FROM {table} WHERE " + " AND ".join(f"{k} = ?" for k in keys)
+            deltas = {}
+            for key, row in latest.items():
+                old = conn.execute(lookup, key).fetchone()
+                new = dict(zip(columns, row))
+                for metric, column in metrics.items():
+                    before = (old[user], old[column][:10]) if old is not None and old[column] else None
+                    after = (new[user], new[column][:10]) if new[column] else None
+                    if before != after:
+                        if before:
+                            deltas[(*before, metric)] = deltas.get((*before, metric), 0) - 1
+                        if after:
+                            deltas[(*after, metric)] = deltas.get((*after, metric), 0) + 1
+
+            conn.executemany(
+                "INSERT INTO daily_rollups (subject, day, metric, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (subject, metric, day) DO UPDATE SET count = count + excluded.count",
+                [(*k, n) for k, n in deltas.items() if n],
+            )
+
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows,
+        )
+        return len(rows)
+
+    def upsert_commits(self, username: str, commits: list[dict]) -> int:
+        """Store shaped commit items ({"repo", "sha", "message", "timestamp", "url"})."""
+        rows = [
+            (c["repo"], c["sha"], username, c.get("message"), c.get("timestamp"),
+             utc_iso(c.get("timestamp")), c.get("url"))
+            for c in commits if c.get("sha") and utc_iso(c.get("timestamp"))
+        ]
+        with self._tx() as conn:
+            return self._replace(conn, "commits", ("repo", "sha", "username", "message", "timestamp", "at", "url"), rows)
+
+    def upsert_prs(self, username: str, prs: list[dict]) -> int:
+        """Store PRs ({"title", "url", "repo", "state", "created_at", "merged_at", "closed_at"})."""
+        rows = [
+            (p["url"], username, p.get("repo"), p.get("title"), p.get("state"),
+             utc_iso(p.get("created_at")), utc_iso(p.get("merged_at")), utc_iso(p.get("closed_at")))
+            for p in prs if p.get("url") and utc_iso(p.get("created_at"))
+        ]
+        with self._tx() as conn:
+            return self._replace(
+                conn, "prs", ("url", "username", "repo", "title", "state", "created_at", "merged_at", "closed_at"), rows
+            )
+
+    def upsert_repos(self, username: str, repos: list[dict]) -> int:
+        """Store repos in the GitHubClient.get_recent_repos shape."""
+        rows = [
+            (r["full_name"], username, r.get("name"), r.get("url"), r.get("description"),
+             r.get("last_pushed"), r.get("stars"), r.get("forks"))
+            for r in repos if r.get("full_name")
+        ]
+        with self._tx() as conn:
+            return self._replace(
+                conn, "repos", ("full_name", "username", "name", "url", "description", "last_pushed", "stars", "forks"),
+                rows,
+            )
+
+    def upsert_issues(self, account_id: str, issues: list[dict]) -> int:
+        """Store issue rows ({"key", "summary", "status", "updated"} plus "done", "created", "resolved")."""
+        rows = [
+            (i["key"], account_id, i.get("summary"), i.get("status"), int(bool(i.get("done"))),
+             i.get("updated"), utc_iso(i.get("updated")), utc_iso(i.get("created")), utc_iso(i.get("resolved")))
+            for i in issues if i.get("key") and utc_iso(i.get("updated"))
+        ]
+        columns = ("key", "account_id", "summary", "status", "done", "updated", "updated_at", "created_at", "resolved_at")
+        with self._tx() as conn:
+            return self._replace(conn, "issues", columns, rows)
+
+    def remove_issues(self, account_id: str, keys: list[str]) -> int:
+        """Drop the user's rows of `keys` (e.g. issues no longer assigned to them) and their rollup counts."""
+        _, user, metrics = ROLLUPS["issues"]
+        removed = 0
+        with self._tx() as conn:
+            for key in dict.fromkeys(keys):
+                old = conn.execute("SELECT * FROM issues WHERE key = ? AND account_id = ?", (key, account_id)).fetchone()
+                if old is None:
+                    continue
+                conn.execute("DELETE FROM issues WHERE key = ?", (key,))
+                conn.executemany(
+                    "UPDATE daily_rollups SET count = count - 1 WHERE subject = ? AND metric = ? AND day = ?",
+                    [(old[user], metric, old[column][:10]) for metric, column in metrics.items() if old[column]],
+                )
+                removed += 1
+        return removed
+
+    def rebuild_rollups(self):
+        """Recount every daily rollup from the stored rows."""
+        with self._tx() as conn:
+            self._rebuild_rollups(conn)
+
+    def ensure_rollups(self):
+        """
+        Build the rollups of a store created before they existed. Called once
+        by whoever owns the store (the API process, the backfill parent), not
+        by every connection.
+        """
+        with self._tx() as conn:
+            if not conn.execute("SELECT COUNT(*) FROM daily_rollups").fetchone()[0]:
+                self._rebuild_rollups(conn)
+
+    @staticmethod
+    def _rebuild_rollups(conn: sqlite3.Connection):
+        conn.execute("DELETE FROM daily_rollups")
+        for table, (_, user, metrics) in ROLLUPS.items():
+            for metric, column in metrics.items():
+                conn.execute(
+                    f"INSERT INTO daily_rollups (subject, metric, day, count) "
+                    f"SELECT {user}, ?, substr({column}, 1, 10), COUNT(*) FROM {table} "
+                    f"WHERE {column} IS NOT NULL GROUP BY {user}, substr({column}, 1, 10)",
+                    (metric,),
+                )
+
+    # ---- sync state ------------------------------------------------------
+    def cursor(self, source: str, subject: str):
+        """The sync cursor saved for (source, subject), JSON-decoded; None before the first sync."""
+        rows = self._query("SELECT cursor FROM sync_state WHERE source = ? AND subject = ?", (source, subject))
+        return json.loads(rows[0]["cursor"]) if rows and rows[0]["cursor"] else None
+
+    def mark_synced(self, source: str, subject: str, cursor=None):
+        """Record a completed sync (keeping the previous cursor unless a new one is given)."""
+        with self._tx() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (source, subject, cursor, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (source, subject) DO UPDATE SET "
+                "cursor = COALESCE(excluded.cursor, sync_state.cursor), synced_at = excluded.synced_at",
+                (source, subject, json.dumps(cursor) if cursor is not None else None, time.time()),
+            )
+
+    def sync_age(self, source: str, subject: str) -> Optional[float]:
+        """Seconds since (source, subject) was last synced; None before the first sync."""
+        rows = self._query("SELECT synced_at FROM sync_state WHERE source = ? AND subject = ?", (source, subject))
+        if not rows or rows[0]["synced_at"] is None:
+            return None
+        return max(0.0, time.time() - rows[0]["synced_at"])
+
+    def is_fresh(self, source: str, subject: str, max_age: float = None) -> bool:
+        """True if (source, subject) was synced within `max_age` seconds (ACTIVITY_STORE_MAX_AGE)."""
+        max_age = settings.activity_store_max_age if max_age is None else max_age
+        age = self.sync_age(source, subject)
+        return age is not None and age <= max_age
+
+    @staticmethod
+    def covers(since: Optional[datetime]) -> bool:
+        """
+        True if a window starting at `since` lies inside the synced commit
+        horizon (ACTIVITY_STORE_HISTORY_DAYS back from now). Sync reads no
+        further back, so older or unbounded windows must go upstream.
+        """
+        horizon = datetime.now(timezone.utc) - timedelta(days=settings.activity_store_history_days)
+        return since is not None and since >= horizon
+
+    def forget(self, source: str) -> int:
+        """Drop every cursor saved under `source` (e.g. to restart a backfill); returns rows removed."""
+        with self._tx() as conn:
+            return conn.execute("DELETE FROM sync_state WHERE source = ?", (source,)).rowcount
+
+    # ---- reads -----------------------------------------------------------
+    @staticmethod
+    def _window(column: str, since=None, until=None) -> tuple[str, tuple]:
+        clauses, params = [], []
+        if since:
+            clauses.append(f"{column} >= ?")
+            params.append(utc_iso(since))
+        if until:
+            clauses.append(f"{column} <= ?")
+            params.append(utc_iso(until))
+        return "".join(f" AND {c}" for c in clauses), tuple(params)
+
+    @staticmethod
+    def _commit(row) -> dict:
+        return {"repo": row["repo"], "message": row["message"], "timestamp": row["timestamp"],
+                "url": row["url"], "sha": row["sha"]}
+
+    def commits(self, username: str, since=None, until=None, limit: int = 10, offset: int = 0):
+        """
+        (items, total, rest) for the user's commits in [since, until], newest
+        first; `rest` lazily continues the listing after this page.
+        """
+        window, params = self._window("at", since, until)
+        where = f"FROM commits WHERE username = ?{window}"
+        select = f"SELECT * {where} ORDER BY at DESC, sha"
+        params = (username,) + params
+
+        items = [self._commit(r) for r in self._query(f"{select} LIMIT ? OFFSET ?", params + (limit, offset))]
+        total = self._count(f"SELECT COUNT(*) {where}", params)
+        return items, total, self._iter(select, params, offset + limit, self._commit)
+
+    @staticmethod
+    def _pr(row) -> dict:
+        return {"title": row["title"], "url": row["url"], "repo": row["repo"]}
+
+    def prs(self, username: str, repo: str = None, limit: int = 10, offset: int = 0, since=None, until=None):
+        """
+        (items, total, rest) for PRs authored by the user (optionally in one
+        repo, created in [since, until]), newest first.
+        """
+        window, window_params = self._window("created_at", since, until)
+        where = "FROM prs WHERE username = ?" + (" AND repo = ?" if repo else "") + window
+        select = f"SELECT * {where} ORDER BY created_at DESC"
+        params = ((username, repo) if repo else (username,)) + window_params
+
+        items = [self._pr(r) for r in self._query(f"{select} LIMIT ? OFFSET ?", params + (limit, offset))]
+        total = self._count(f"SELECT COUNT(*) {where}", params)
+        return items, total, self._iter(select, params, offset + limit, self._pr)
+
+    @staticmethod
+    def _repo(row) -> dict:
+        return {"name": row["name"], "full_name": row["full_name"], "url": row["url"],
+                "description": row["description"], "last_pushed": row["last_pushed"],
+                "stars": row["stars"], "forks": row["forks"]}
+
+    def repos(self, username: str, limit: int = 10, offset: int = 0):
+        """(items, total, rest) for the user's repos, most recently pushed first."""
+        select = "SELECT * FROM repos WHERE username = ? ORDER BY last_pushed DESC"
+        items = [self._repo(r) for r in self._query(f"{select} LIMIT ? OFFSET ?", (username, limit, offset))]
+        total = self._count("SELECT COUNT(*) FROM repos WHERE username = ?", (username,))
+        return items, total, self._iter(select, (username,), offset + limit, self._repo)
+
+    @staticmethod
+    def _issue(row) -> dict:
+        return {"key": row["key"], "summary": row["summary"], "status": row["status"], "updated": row["updated"]}
+
+    def issues(self, account_id: str, limit: int = 10, offset: int = 0):
+        """(items, total, rest) for the user's not-done issues, most recently updated first."""
+        where = "FROM issues WHERE account_id = ? AND done = 0"
+        select = f"SELECT * {where} ORDER BY updated_at DESC"
+        items = [self._issue(r) for r in self._query(f"{select} LIMIT ? OFFSET ?", (account_id, limit, offset))]
+        total = self._count(f"SELECT COUNT(*) {where}", (account_id,))
+        return items, total, self._iter(select, (account_id,), offset + limit, self._issue)
+
+    def rollup_totals(self, subject: str, metrics: tuple, since_day: str = None, until_day: str = None) -> dict:
+        """
+        {metric: count} over the days [since_day, until_day] ('YYYY-MM-DD',
+        open-ended when None): a range sum over at most one row per day.
+        """
+        where, params = "subject = ? AND metric = ?", [subject, None]
+        if since_day:
+            where += " AND day >= ?"
+            params.append(since_day)
+        if until_day:
+            where += " AND day <= ?"
+            params.append(until_day)
+
+        totals = {}
+        for metric in metrics:
+            params[1] = metric
+            totals[metric] = self._count(f"SELECT COALESCE(SUM(count), 0) FROM daily_rollups WHERE {where}", tuple(params))
+        return totals
+
+    def stats(self) -> dict:
+        return {
+            table: self._count(f"SELECT COUNT(*) FROM {table}")
+            for table in ("commits", "prs", "repos", "issues", "sync_state", "daily_rollups")
+        }
+
+
+_store: Optional[ActivityStore] = None
+_store_lock = threading.Lock()
+
+
+def get_activity_store() -> Optional[ActivityStore]:
+    """The process-wide store, or None when ACTIVITY_STORE_PATH is unset (live calls only)."""
+    global _store
+    if not settings.activity_store_path:
+        return None
+
+    with _store_lock:
+        if _store is None or _store.path != settings.activity_store_path:
+            logger.info(f"Opening activity store at {settings.activity_store_path}")
+            _store = ActivityStore(settings.activity_store_path)
+            _store.ensure_rollups()
+        return _store
@@ -1,6 +1,63 @@
+from datetime import timedelta
+from typing import Optional
+
+from src.services.activity_store import get_activity_store
+
+PERIOD_LABELS = {
+    "today": "today",
+    "yesterday": "yesterday",
+    "this_week": "this week",
+    "last_week": "last week",
+    "this_month": "this month",
+    "last_month": "last month",
+}
+
+
 class ActivitySummaryService:
     """Generates a readable dashboard-style summary."""
 
+    def __init__(self, store=None):
+        self.store = store if store is not None else get_activity_store()
+
+    def rollup_counts(self, ids: dict, since=None, until=None) -> Optional[dict]:
+        """
+        Exact counts for the [since, until] window summed from the store's
+        daily rollups, without any upstream call; None unless every source of
+        the user is fresh in the store and the window lies inside its synced
+        commit horizon (the caller then uses fetched data).
+        """
+        github, jira = ids.get("github"), ids.get("jira")
+        if self.store is None or not (github or jira):
+            return None
+        if (github and not self.store.is_fresh("github", github)) or (jira and not self.store.is_fresh("jira", jira)):
+            return None
+        if github and not self.store.covers(since):
+            return None
+
+        days = (
+            since.strftime("%Y-%m-%d") if since else None,
+            # `until` may be the next day's midnight (e.g. yesterday), which is not part of the period
+            (until - timedelta(microseconds=1)).strftime("%Y-%m-%d") if until else None,
+        )
+
+        counts = {"active_issues": 0}
+        if github:
+            counts.update(self.store.rollup_totals(github, ("commits", "prs_opened", "prs_merged"), *days))
+            if since is None and until is None:  # repos are not dated, like the upstream count
+                counts["repos"] = self.store.repos(github, limit=0)[1]
+        if jira:
+            counts.update(self.store.rollup_totals(jira, ("issues_opened", "issues_closed"), *days))
+            counts["active_issues"] = self.store.issues(jira, limit=0)[1]
+        return counts
+
+    @staticmethod
+    def _fmt(count, noun, qualifier=""):
+        if count == 0:
+            return f"• No {noun}s{qualifier}"
+        if count == 1:
+            return f"• 1 {noun}{qualifier}"
+        return f"• {count} {noun}s{qualifier}"
+
     @staticmethod
     def extract_count(section):
         """
@@ -33,7 +90,9 @@ class ActivitySummaryService:
             return 0
 
     @staticmethod
-    def generate(user: str, jira_data: dict, github_data: dict) -> str:
+    def generate(user: str, jira_data: dict, github_data: dict, counts: dict = None, period: str = None) -> str:
+        if counts is not None:
+            return ActivitySummaryService.generate_from_counts(user, counts, period)
 
         # JIRA
         try:
@@ -59,13 +118,7 @@ class ActivitySummaryService:
         except Exception:
             repo_total = 0
 
-        # Helpers
-        def fmt(count, noun):
-            if count == 0:
-                return f"• No {noun}s"
-            if count == 1:
-                return f"• 1 {noun}"
-            return f"• {count} {noun}s"
+        fmt = ActivitySummaryService._fmt
 
         # Build summary
         return (
@@ -75,3 +128,33 @@ class ActivitySummaryService:
             f"📂 **Pull Requests**\n{fmt(pr_total, 'active pull request')}\n\n"
             f"📦 **Repositories**\n{fmt(repo_total, 'repository')}"
         )
+
+    @staticmethod
+    def generate_from_counts(user: str, counts: dict, period: str = None) -> str:
+        """
+        Summary from a counts dict (rollup_counts or the count-only upstream
+        path): per-period activity plus the current open work. Counts that
+        are missing or None (not tracked, or failed) are left out, and so is
+        the repositories section when repos are not counted (a period).
+        """
+        fmt = ActivitySummaryService._fmt
+        label = PERIOD_LABELS.get(period)
+        heading = f"👤 **Activity Summary for {user.capitalize()}**" + (f" ({label})" if label else "")
+
+        def lines(*entries):
+            shown = [fmt(counts[key], *noun) for key, *noun in entries if counts.get(key) is not None]
+            return "\n".join(shown) or "• Unavailable"
+
+        jira = lines(("active_issues", "active issue"), ("issues_opened", "issue", " opened"),
+                     ("issues_closed", "issue", " closed"))
+        prs = lines(("prs_opened", "pull request", " opened"), ("prs_merged", "pull request", " merged"))
+
+        repos = f"\n\n📦 **Repositories**\n{lines(('repos', 'repository'))}" if "repos" in counts else ""
+
+        return (
+            f"{heading}\n\n"
+            f"🧩 **JIRA**\n{jira}\n\n"
+            f"💻 **Commits**\n{lines(('commits', 'commit'))}\n\n"
+            f"📂 **Pull Requests**\n{prs}"
+            f"{repos}"
+        )
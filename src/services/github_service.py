@@ -1,8 +1,14 @@
+import heapq
 import os
 from datetime import datetime, timedelta, timezone
-from src.integrations.github_client import GitHubClient
+from itertools import islice
+from src.integrations.github_client import AsyncGitHubClient, GitHubClient
 from src.api.utils.response_builder import success, failure
+from src.core.concurrency import Deadline, bounded_gather, bounded_map, current_deadline, fan_out, fan_out_async
+from src.core.config import settings
 from src.core.logger import get_logger
+from src.services.activity_store import get_activity_store
+from src.services.pagination import Snapshot, paged_response, resume, snapshot_page, snapshot_page_async, with_cursor
 
 logger = get_logger(__name__)
 
@@ -11,7 +17,17 @@ class GitHubService:
     """GitHub service for fetching user activity."""
     def __init__(self):
         self.client = GitHubClient()
+        self.async_client = AsyncGitHubClient()
         self.repo_name = os.environ.get("GITHUB_REPO_NAME", "autonomize-activity-monitor")
+        self.store = get_activity_store()
+
+    def _warm_store(self, username: str) -> bool:
+        """True if the activity store holds a recent sync of this user; otherwise calls go live."""
+        return self.store is not None and self.store.is_fresh("github", username)
+
+    def _warm_store_since(self, username: str, since) -> bool:
+        """Like _warm_store, for commit windows: the store only holds the synced horizon."""
+        return self._warm_store(username) and self.store.covers(since)
 
     # Converts period strings like "today" / "this_week" → (since, until)
     def resolve_period(self, period: str):
@@ -80,17 +96,8 @@ class GitHubService:
 
         return filtered
 
-    # Commit endpoint with filters and pagination
-    def get_user_commits(
-        self,
-        username: str,
-        limit: int = 10,
-        offset: int = 0,
-        period: str = None,
-        since: str = None,
-        until: str = None
-    ):
-        """Fetch commits from a repo with pagination."""
+    def _resolve_window(self, period: str = None, since=None, until=None):
+        """Resolve period / ISO strings into aware since/until datetimes."""
         if period:
             since, until = self.resolve_period(period)
 
@@ -100,66 +107,340 @@ class GitHubService:
         if isinstance(until, str):
             until = datetime.fromisoformat(until).replace(tzinfo=timezone.utc)
 
-        raw = self.client.get_recent_commits(username, self.repo_name)
-        if not raw["success"]:
-            return failure(raw["error"])
+        return since, until
 
-        all_commits = raw["data"]
+    COMMITS_PER_PAGE = 100
+
+    @staticmethod
+    def _parse_ts(ts):
+        try:
+            return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        except Exception:
+            return None
+
+    def _commit_dt(self, c):
+        return self._parse_ts(c.get("commit", {}).get("author", {}).get("date"))
+
+    def _commit_repos(self, username: str, repos_raw: dict, since=None) -> list[str]:
+        """
+        Repositories worth scanning for commits, most recently pushed first.
+        Repos last pushed before `since` had no activity in the window and are
+        never queried. Falls back to the configured repo if listing failed.
+        """
+        if not repos_raw["success"]:
+            logger.warning(f"Repo listing failed ({repos_raw['error']}); using {self.repo_name}")
+            return [f"{username}/{self.repo_name}"]
+
+        names = []
+        for repo in repos_raw["data"]:
+            pushed = self._parse_ts(repo.get("last_pushed"))
+            if since and pushed and pushed < since:
+                break  # sorted by pushed_at desc: everything after is idle too
+            names.append(repo.get("full_name") or f"{username}/{repo.get('name')}")
+
+        return names[: settings.github_commit_repo_limit]
+
+    def _fetch_commit_page(self, full_name: str, page: int, since=None, until=None, author=None):
+        owner, repo = full_name.split("/", 1)
+        return self.client.get_recent_commits(
+            owner, repo, limit=self.COMMITS_PER_PAGE, page=page, since=since, until=until, author=author
+        )
 
-        filtered = self.apply_date_filter(all_commits, since, until)
-        total = len(filtered)
+    async def _afetch_commit_page(self, full_name: str, page: int, since=None, until=None, author=None):
+        owner, repo = full_name.split("/", 1)
+        return await self.async_client.get_recent_commits(
+            owner, repo, limit=self.COMMITS_PER_PAGE, page=page, since=since, until=until, author=author
+        )
 
-        paginated = filtered[offset: offset + limit]
+    def _window_entries(self, full_name: str, raw: dict, since, until, tally: dict):
+        """
+        (timestamp, repo, commit) for one page in the window. `tally` counts
+        every in-window commit loaded so far and the repos with pages left.
+        """
+        tally["open"].discard(full_name)
+        if not raw["success"]:
+            logger.error(f"GitHub commits page failed for {full_name}: {raw['error']}")
+            return [], True
+
+        page = raw["data"]
+        entries = [(self._commit_dt(c), full_name, c) for c in self.apply_date_filter(page, since, until)]
+        tally["loaded"] += len(entries)
+
+        oldest = self._commit_dt(page[-1]) if page else None
+        passed_window = bool(since and oldest and oldest < since)
+        last = len(page) < self.COMMITS_PER_PAGE or passed_window
+        if not last:
+            tally["open"].add(full_name)
+        return entries, last
+
+    def _repo_commit_stream(
+        self, full_name: str, first_page: dict, since, until, tally: dict, paged: bool = True, author=None
+    ):
+        """Newest-first commits of one repo by `author`; later pages are fetched only when consumed."""
+        raw, page = first_page, 1
+        while True:
+            entries, last = self._window_entries(full_name, raw, since, until, tally)
+            yield from entries
+            if last or not paged:
+                return
+            page += 1
+            raw = self._fetch_commit_page(full_name, page, since, until, author)
+
+    async def _arepo_commit_stream(self, full_name: str, first_page: dict, since, until, tally: dict, author=None):
+        """Async variant of _repo_commit_stream."""
+        raw, page = first_page, 1
+        while True:
+            entries, last = self._window_entries(full_name, raw, since, until, tally)
+            for entry in entries:
+                yield entry
+            if last:
+                return
+            page += 1
+            raw = await self._afetch_commit_page(full_name, page, since, until, author)
+
+    @staticmethod
+    def _merge(streams):
+        """Lazy k-way merge of newest-first streams."""
+        return heapq.merge(*streams, key=lambda e: e[0], reverse=True)
+
+    @staticmethod
+    async def _amerge(streams):
+        """Async lazy k-way merge of newest-first streams."""
+        heap = []
+        for i, stream in enumerate(streams):
+            head = await anext(stream, None)
+            if head:
+                heapq.heappush(heap, (-head[0].timestamp(), i, head))
+
+        while heap:
+            _, i, entry = heapq.heappop(heap)
+            yield entry
+            head = await anext(streams[i], None)
+            if head:
+                heapq.heappush(heap, (-head[0].timestamp(), i, head))
+
+    @staticmethod
+    async def _atake(merged, count: int) -> list:
+        """Consume at most `count` entries of an async merge."""
+        taken = []
+        while len(taken) < count:
+            entry = await anext(merged, None)
+            if entry is None:
+                break
+            taken.append(entry)
+        return taken
+
+    def _merged_commits(self, username, names, first_pages, limit, offset, period, since, until, paged=True):
+        tally = {"loaded": 0, "open": set()}
+        streams = [
+            self._repo_commit_stream(name, raw, since, until, tally, paged, author=username)
+            for name, raw in zip(names, first_pages)
+        ]
+        merged = self._merge(streams)
+        entries = list(islice(merged, offset + limit))
+        rest = map(self._commit_item, merged)
+        return self._build_commits(username, entries, first_pages, tally, limit, offset, period, since, until, rest)
 
-        commits = [
-            {
-                "repo": f"{username}/{self.repo_name}",
-                "message": c.get("commit", {}).get("message"),
-                "timestamp": c.get("commit", {}).get("author", {}).get("date"),
-                "url": c.get("html_url"),
-                "sha": c.get("sha"),
-            }
-            for c in paginated
+    # Commit endpoint with filters and pagination
+    def get_user_commits(
+        self,
+        username: str,
+        limit: int = 10,
+        offset: int = 0,
+        period: str = None,
+        since: str = None,
+        until: str = None,
+        repos_raw: dict = None,
+        cursor: str = None
+    ):
+        """
+        Commits across the user's recently-pushed repos, merged newest first.
+        First pages are fetched concurrently; later pages only as far as offset+limit.
+        A `cursor` from a previous page continues that listing from memory.
+        """
+        snapshot_id, snapshot, offset = resume(cursor, offset)
+        if snapshot:
+            return snapshot_page(snapshot_id, snapshot, offset, limit)
+        since, until = self._resolve_window(period, since, until)
+        if self._warm_store_since(username, since):
+            return self._stored_commits(username, limit, offset, period, since, until)
+
+        repos_raw = repos_raw or self.client.get_recent_repos(username)
+        names = self._commit_repos(username, repos_raw, since)
+
+        first_pages = bounded_map(
+            lambda name: self._fetch_commit_page(name, 1, since, until, author=username),
+            names,
+            settings.github_commit_fetch_workers,
+        )
+        return self._merged_commits(username, names, first_pages, limit, offset, period, since, until)
+
+    async def get_user_commits_async(
+        self,
+        username: str,
+        limit: int = 10,
+        offset: int = 0,
+        period: str = None,
+        since: str = None,
+        until: str = None,
+        repos_raw: dict = None,
+        cursor: str = None
+    ):
+        """Async variant of get_user_commits."""
+        snapshot_id, snapshot, offset = resume(cursor, offset, is_async=True)
+        if snapshot:
+            return await snapshot_page_async(snapshot_id, snapshot, offset, limit)
+        since, until = self._resolve_window(period, since, until)
+        if self._warm_store_since(username, since):
+            return self._stored_commits(username, limit, offset, period, since, until)
+
+        repos_raw = repos_raw or await self.async_client.get_recent_repos(username)
+        names = self._commit_repos(username, repos_raw, since)
+
+        first_pages = await bounded_gather(
+            lambda name: self._afetch_commit_page(name, 1, since, until, author=username),
+            names,
+            settings.github_commit_fetch_workers,
+        )
+        tally = {"loaded": 0, "open": set()}
+        streams = [
+            self._arepo_commit_stream(name, raw, since, until, tally, author=username)
+            for name, raw in zip(names, first_pages)
         ]
+        merged = self._amerge(streams)
+        entries = await self._atake(merged, offset + limit)
+        rest = (self._commit_item(entry) async for entry in merged)
+        return self._build_commits(username, entries, first_pages, tally, limit, offset, period, since, until, rest)
+
+    def _stored_commits(self, username, limit, offset, period, since, until):
+        """Commits served from the activity store (one indexed range scan)."""
+        items, total, rest = self.store.commits(username, since, until, limit, offset)
+        return paged_response(
+            f"Commits retrieved for {username}.", items, total, limit, offset, rest,
+            meta={
+                "source": "store",
+                "period": period,
+                "since": since.isoformat() if since else None,
+                "until": until.isoformat() if until else None,
+            },
+        )
 
-        return success(
-            message=f"Commits retrieved for {username}.",
+    @staticmethod
+    def _commit_item(entry) -> dict:
+        _, repo, c = entry
+        return {
+            "repo": repo,
+            "message": c.get("commit", {}).get("message"),
+            "timestamp": c.get("commit", {}).get("author", {}).get("date"),
+            "url": c.get("html_url"),
+            "sha": c.get("sha"),
+        }
+
+    def _build_commits(self, username, entries, first_pages, tally, limit, offset, period, since, until, rest=None):
+        failed = [raw for raw in first_pages if not raw["success"]]
+        if failed and len(failed) == len(first_pages):
+            return self._failure(failed[0])
+
+        # While some repo still has unread pages, `total` is only a lower bound
+        total = tally["loaded"]
+        has_more = bool(tally["open"]) or total > offset + limit
+
+        loaded = [self._commit_item(entry) for entry in entries]
+        commits = loaded[offset: offset + limit]
+
+        window_meta = {
+            "repos_scanned": len(first_pages),
+            "period": period,
+            "since": since.isoformat() if since else None,
+            "until": until.isoformat() if until else None,
+        }
+        message = f"Commits retrieved for {username}."
+        response = success(
+            message=message,
             items=commits,
             meta={
                 "total": total,
                 "limit": limit,
                 "offset": offset,
                 "returned": len(commits),
-                "period": period,
-                "since": since.isoformat() if since else None,
-                "until": until.isoformat() if until else None,
+                "has_more": has_more,
+                **window_meta,
             }
         )
 
+        snapshot = Snapshot(message, loaded, source=rest, total=lambda: tally["loaded"], meta=window_meta)
+        return with_cursor(response, snapshot, offset, limit)
+
     # PR endpoint with pagination
-    def get_user_prs(self, username: str, limit: int = 10, offset: int = 0):
-        """Fetch PRs from a repo with pagination."""
-        raw = self.client.get_pull_requests(username, self.repo_name)
+    def get_user_prs(
+        self,
+        username: str,
+        limit: int = 10,
+        offset: int = 0,
+        period: str = None,
+        since: str = None,
+        until: str = None,
+        cursor: str = None
+    ):
+        """Fetch PRs from a repo with pagination, optionally created within the window."""
+        snapshot_id, snapshot, offset = resume(cursor, offset)
+        if snapshot:
+            return snapshot_page(snapshot_id, snapshot, offset, limit)
 
-        if not raw["success"]:
-            return failure(raw["error"])
+        since, until = self._resolve_window(period, since, until)
+        if self._warm_store(username):
+            return self._stored_prs(username, limit, offset, since, until)
 
-        all_prs = raw["data"].get("items", [])
-        total = len(all_prs)
+        raw = self.client.get_pull_requests(username, self.repo_name, created_since=since, created_until=until)
+        return self._build_prs(username, raw, limit, offset)
 
-        paginated = all_prs[offset: offset + limit]
+    async def get_user_prs_async(
+        self,
+        username: str,
+        limit: int = 10,
+        offset: int = 0,
+        period: str = None,
+        since: str = None,
+        until: str = None,
+        cursor: str = None
+    ):
+        """Async variant of get_user_prs."""
+        snapshot_id, snapshot, offset = resume(cursor, offset, is_async=True)
+        if snapshot:
+            return await snapshot_page_async(snapshot_id, snapshot, offset, limit)
+
+        since, until = self._resolve_window(period, since, until)
+        if self._warm_store(username):
+            return self._stored_prs(username, limit, offset, since, until)
 
-        prs = [
+        raw = await self.async_client.get_pull_requests(
+            username, self.repo_name, created_since=since, created_until=until
+        )
+        return self._build_prs(username, raw, limit, offset)
+
+    def _stored_prs(self, username, limit, offset, since=None, until=None):
+        items, total, rest = self.store.prs(username, self.repo_name, limit, offset, since, until)
+        return paged_response(f"PRs retrieved for {username}.", items, total, limit, offset, rest, meta={"source": "store"})
+
+    def _build_prs(self, username, raw, limit, offset):
+        if not raw["success"]:
+            return self._failure(raw)
+
+        all_prs = [
             {
                 "title": pr.get("title"),
                 "url": pr.get("html_url"),
                 "repo": self.repo_name,
             }
-            for pr in paginated
+            for pr in raw["data"].get("items", [])
         ]
+        total = len(all_prs)
 
-        return success(
-            message=f"PRs retrieved for {username}.",
+        prs = all_prs[offset: offset + limit]
+
+        message = f"PRs retrieved for {username}."
+        response = success(
+            message=message,
             items=prs,
             meta={
                 "total": total,
@@ -168,22 +449,49 @@ class GitHubService:
                 "returned": len(prs),
             }
         )
+        return with_cursor(response, Snapshot(message, all_prs), offset, limit)
 
     # Repository endpoint with pagination
-    def get_recent_repos(self, username: str, limit: int = 10, offset: int = 0):
+    def get_recent_repos(self, username: str, limit: int = 10, offset: int = 0, cursor: str = None):
         """Fetch recent repos for a user with pagination."""
+        snapshot_id, snapshot, offset = resume(cursor, offset)
+        if snapshot:
+            return snapshot_page(snapshot_id, snapshot, offset, limit)
+        if self._warm_store(username):
+            return self._stored_repos(username, limit, offset)
+
         raw = self.client.get_recent_repos(username)
+        return self._build_repos(username, raw, limit, offset)
+
+    async def get_recent_repos_async(self, username: str, limit: int = 10, offset: int = 0, cursor: str = None):
+        """Async variant of get_recent_repos."""
+        snapshot_id, snapshot, offset = resume(cursor, offset, is_async=True)
+        if snapshot:
+            return await snapshot_page_async(snapshot_id, snapshot, offset, limit)
+        if self._warm_store(username):
+            return self._stored_repos(username, limit, offset)
+
+        raw = await self.async_client.get_recent_repos(username)
+        return self._build_repos(username, raw, limit, offset)
+
+    def _stored_repos(self, username, limit, offset):
+        items, total, rest = self.store.repos(username, limit, offset)
+        return paged_response(
+            f"Recent repositories retrieved for {username}.", items, total, limit, offset, rest, meta={"source": "store"}
+        )
 
+    def _build_repos(self, username, raw, limit, offset):
         if not raw["success"]:
-            return failure(raw["error"])
+            return self._failure(raw)
 
         all_repos = raw["data"]
         total = len(all_repos)
 
         paginated = all_repos[offset: offset + limit]
 
-        return success(
-            message=f"Recent repositories retrieved for {username}.",
+        message = f"Recent repositories retrieved for {username}."
+        response = success(
+            message=message,
             items=paginated,
             meta={
                 "total": total,
@@ -192,19 +500,219 @@ class GitHubService:
                 "returned": len(paginated),
             }
         )
+        return with_cursor(response, Snapshot(message, all_repos), offset, limit)
+
+    # Count-only fast path: a few per_page=1 / total_count requests instead of full listings
+    def count_user_activity(self, username: str, period: str = None, since=None, until=None,
+                            deadline: Deadline = None):
+        """
+        {"commits", "prs", "repos"} counts for the window. Commits are counted
+        per recently-pushed repo from the Link rel="last" page, PRs from the
+        search total_count, repos from the user profile. The profile has no
+        history, so "repos" is only counted without a window.
+        """
+        since, until = self._resolve_window(period, since, until)
+        tasks = {
+            "commits": lambda: self._count_commits(username, since, until),
+            "prs": lambda: self.client.count_pull_requests(username, self.repo_name, since, until),
+        }
+        if since is None and until is None:
+            tasks["repos"] = lambda: self.client.count_repos(username)
+        counts = fan_out(
+            tasks,
+            deadline=deadline or current_deadline.get() or Deadline(settings.activity_deadline_seconds),
+            on_timeout=self._count_timeout,
+        )
+        return self._build_counts(username, counts, period)
+
+    async def count_user_activity_async(self, username: str, period: str = None, since=None, until=None,
+                                        deadline: Deadline = None):
+        """Async variant of count_user_activity."""
+        since, until = self._resolve_window(period, since, until)
+        tasks = {
+            "commits": lambda: self._acount_commits(username, since, until),
+            "prs": lambda: self.async_client.count_pull_requests(username, self.repo_name, since, until),
+        }
+        if since is None and until is None:
+            tasks["repos"] = lambda: self.async_client.count_repos(username)
+        counts = await fan_out_async(
+            tasks,
+            deadline=deadline or current_deadline.get() or Deadline(settings.activity_deadline_seconds),
+            on_timeout=self._count_timeout,
+        )
+        return self._build_counts(username, counts, period)
+
+    def _count_commits(self, username: str, since, until) -> dict:
+        # Only the repos the commit listing would scan, so both agree
+        repos_raw = self.client.get_recent_repos(username, per_page=settings.github_commit_repo_limit)
+        names = self._commit_repos(username, repos_raw, since)
+        counts = bounded_map(
+            lambda name: self.client.count_commits(*name.split("/", 1), since, until, author=username),
+            names,
+            settings.github_commit_fetch_workers,
+        )
+        return self._sum_counts(counts)
+
+    async def _acount_commits(self, username: str, since, until) -> dict:
+        repos_raw = await self.async_client.get_recent_repos(username, per_page=settings.github_commit_repo_limit)
+        names = self._commit_repos(username, repos_raw, since)
+        counts = await bounded_gather(
+            lambda name: self.async_client.count_commits(*name.split("/", 1), since, until, author=username),
+            names,
+            settings.github_commit_fetch_workers,
+        )
+        return self._sum_counts(counts)
+
+    @staticmethod
+    def _sum_counts(counts: list[dict]) -> dict:
+        failed = next((c for c in counts if not c["success"]), None)
+        return failed or {"success": True, "data": sum(c["data"] for c in counts)}
+
+    @staticmethod
+    def _count_timeout(name: str):
+        return {"success": False, "error": f"Timed out counting GitHub {name}.", "reason": "timeout"}
+
+    @staticmethod
+    def _build_counts(username: str, counts: dict, period: str = None):
+        """Counts envelope; a count that failed is None and listed in meta.degraded."""
+        degraded = {
+            name: "timeout" if raw.get("reason") == "timeout" else "error"
+            for name, raw in counts.items() if not raw["success"]
+        }
+        return success(
+            message=f"GitHub activity counts for {username}.",
+            items={name: raw["data"] if raw["success"] else None for name, raw in counts.items()},
+            meta={"period": period, "degraded": degraded}
+        )
 
     # Fusion endpoint used by /activity
-    def get_user_github_activity(self, username: str, limit: int = 10, offset: int = 0, period: str = None, since: str = None, until: str = None):
-        """Fuse commits, PRs, and repos for a user."""
-        commits = self.get_user_commits(username, limit, offset, period, since, until)
-        prs = self.get_user_prs(username, limit, offset)
-        repos = self.get_recent_repos(username, limit, offset)
+    def get_user_github_activity(
+        self,
+        username: str,
+        limit: int = 10,
+        offset: int = 0,
+        period: str = None,
+        since: str = None,
+        until: str = None,
+        deadline: Deadline = None
+    ):
+        """Fuse commits, PRs, and repos for a user (fetched concurrently)."""
+        deadline = deadline or current_deadline.get() or Deadline(settings.activity_deadline_seconds)
+
+        # A warm store covering the window answers every section locally, so skip the GraphQL round trip
+        window = self._resolve_window(period, since, until)
+        if self._graphql_eligible(limit, offset) and not self._warm_store_since(username, window[0]):
+            raw = self.client.get_activity_graphql(
+                username, window[0], window[1], self.COMMITS_PER_PAGE, pr_repo_name=self.repo_name
+            )
+            sections = self._graphql_sections(username, raw, limit, offset, period, *window)
+            if sections:
+                return success(
+                    message=f"GitHub activity retrieved for {username}.",
+                    items=sections
+                )
+
+        sections = fan_out(
+            {
+                "commits": lambda: self.get_user_commits(username, limit, offset, period, since, until),
+                "prs": lambda: self.get_user_prs(username, limit, offset, period, since, until),
+                "recent_repos": lambda: self.get_recent_repos(username, limit, offset),
+            },
+            deadline=deadline,
+            on_timeout=self._section_timeout,
+        )
 
         return success(
             message=f"GitHub activity retrieved for {username}.",
-            items={
-                "commits": commits,
-                "prs": prs,
-                "recent_repos": repos,
-            }
+            items=sections
         )
+
+    async def get_user_github_activity_async(
+        self,
+        username: str,
+        limit: int = 10,
+        offset: int = 0,
+        period: str = None,
+        since: str = None,
+        until: str = None,
+        deadline: Deadline = None
+    ):
+        """Async variant of get_user_github_activity."""
+        deadline = deadline or current_deadline.get() or Deadline(settings.activity_deadline_seconds)
+
+        # A warm store covering the window answers every section locally, so skip the GraphQL round trip
+        window = self._resolve_window(period, since, until)
+        if self._graphql_eligible(limit, offset) and not self._warm_store_since(username, window[0]):
+            raw = await self.async_client.get_activity_graphql(
+                username, window[0], window[1], self.COMMITS_PER_PAGE, pr_repo_name=self.repo_name
+            )
+            sections = self._graphql_sections(username, raw, limit, offset, period, *window)
+            if sections:
+                return success(
+                    message=f"GitHub activity retrieved for {username}.",
+                    items=sections
+                )
+
+        sections = await fan_out_async(
+            {
+                "commits": lambda: self.get_user_commits_async(username, limit, offset, period, since, until),
+                "prs": lambda: self.get_user_prs_async(username, limit, offset, period, since, until),
+                "recent_repos": lambda: self.get_recent_repos_async(username, limit, offset),
+            },
+            deadline=deadline,
+            on_timeout=self._section_timeout,
+        )
+
+        return success(
+            message=f"GitHub activity retrieved for {username}.",
+            items=sections
+        )
+
+    def _graphql_eligible(self, limit: int, offset: int) -> bool:
+        # Histories come back as one page per repo, the same as REST's first page
+        return settings.github_use_graphql and offset + limit <= self.COMMITS_PER_PAGE
+
+    def _graphql_sections(self, username, raw, limit, offset, period, since, until):
+        """
+        Build the same commits/prs/recent_repos envelopes as the REST path
+        from a single GraphQL payload. Returns None when the caller should
+        fall back to REST.
+        """
+        if not raw["success"]:
+            logger.warning(f"GitHub GraphQL path failed, falling back to REST: {raw['error']}")
+            return None
+
+        data = raw["data"]
+        repos_raw = {"success": True, "data": data["repos"]}
+
+        # Same repo selection and merge as REST, over histories already in the payload
+        names = self._commit_repos(username, repos_raw, since)
+
+        # History filters by node id, not login, so authors are filtered here; a page
+        # other authors crowded has an unknown number of the user's commits behind it
+        partial = set(data.get("partial_repos", [])) & set(names)
+        if partial:
+            logger.info(f"GitHub GraphQL history incomplete for {sorted(partial)}, falling back to REST")
+            return None
+
+        first_pages = [
+            {"success": True, "data": data["commits_by_repo"].get(name, [])}
+            for name in names
+        ]
+
+        return {
+            "commits": self._merged_commits(
+                username, names, first_pages, limit, offset, period, since, until, paged=False
+            ),
+            "prs": self._build_prs(username, {"success": True, "data": data["prs"]}, limit, offset),
+            "recent_repos": self._build_repos(username, {"success": True, "data": data["repos"]}, limit, offset),
+        }
+
+    @staticmethod
+    def _failure(raw: dict):
+        """Failure response for a client error envelope, keeping its reason (e.g. "timeout")."""
+        return failure(raw["error"], raw.get("reason"))
+
+    @staticmethod
+    def _section_timeout(name: str):
+        return failure(f"Timed out fetching GitHub {name}.", "timeout")
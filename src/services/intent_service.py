@@ -1,5 +1,5 @@
 import re
-from src.integrations.ai_client import AIClient
+from src.integrations.ai_client import AIClient, AsyncAIClient
 
 
 class IntentService:
@@ -51,11 +51,8 @@ class IntentService:
         return any(k in text for k in keywords)
 
     @staticmethod
-    def detect_intent(text: str) -> str:
-        """Determine intent with layered logic."""
-        if not text:
-            return "FULL_ACTIVITY"
-
+    def _detect_by_rules(text: str):
+        """Steps 1-3 (no AI). Returns None when the question is ambiguous."""
         text_lower = text.lower()
 
         # STEP 1 — Strongest signal: explicit source
@@ -82,6 +79,18 @@ class IntentService:
                 if re.search(pattern, text_lower):
                     return intent
 
+        return None
+
+    @staticmethod
+    def detect_intent(text: str) -> str:
+        """Determine intent with layered logic."""
+        if not text:
+            return "FULL_ACTIVITY"
+
+        intent = IntentService._detect_by_rules(text)
+        if intent:
+            return intent
+
         # STEP 4 — AI fallback (ambiguous queries)
         try:
             ai = AIClient()
@@ -93,3 +102,22 @@ class IntentService:
 
         # STEP 5 — Safe default
         return "FULL_ACTIVITY"
+
+    @staticmethod
+    async def detect_intent_async(text: str) -> str:
+        """Same as detect_intent, with a non-blocking AI fallback."""
+        if not text:
+            return "FULL_ACTIVITY"
+
+        intent = IntentService._detect_by_rules(text)
+        if intent:
+            return intent
+
+        try:
+            ai_intent = await AsyncAIClient().classify_intent(text)
+            if ai_intent:
+                return ai_intent
+        except Exception:
+            pass
+
+        return "FULL_ACTIVITY"
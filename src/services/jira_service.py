@@ -1,45 +1,420 @@
+import time
+from itertools import islice
+
 from src.api.utils.response_builder import success, failure
+from src.core.cache import LRUCache
+from src.core.concurrency import bounded_gather, bounded_map
+from src.core.config import settings
 from src.core.user_resolver import UserResolver
-from src.integrations.jira_client import JiraClient
+from src.integrations.jira_client import AsyncJiraClient, JiraClient
 from src.core.logger import get_logger
+from src.services.activity_store import get_activity_store
+from src.services.pagination import Snapshot, paged_response, resume, snapshot_page, snapshot_page_async, with_cursor
 
 logger = get_logger(__name__)
 
+
+class _IssueWindow:
+    """
+    Consumes a paged issue stream and keeps only the requested
+    offset/limit slice, so memory stays bounded by one page.
+    """
+
+    def __init__(self, offset: int, limit: int):
+        self.offset = offset
+        self.limit = limit
+        self.items = []
+        self.rest = []  # issues after the slice on the last page read
+        self.seen = 0
+        self.exhausted = True
+        self.error = None
+
+    @property
+    def page_size(self) -> int:
+        return max(1, min(self.offset + self.limit, settings.jira_page_size))
+
+    def add(self, page: dict) -> bool:
+        """Absorb one page; returns False once no further page is needed."""
+        if "error" in page:
+            self.error = page["error"]
+            return False
+
+        issues = page.get("issues", [])
+        start = max(self.offset - self.seen, 0)
+        end = start + self.limit - len(self.items)
+        self.items.extend(issues[start: end])
+        self.rest = issues[end:]
+        self.seen += len(issues)
+        self.exhausted = not page.get("next_page_token")
+
+        return not self.exhausted and self.seen < self.offset + self.limit
+
+    @property
+    def filled(self) -> bool:
+        """True once later pages cannot change the slice (or the stream failed)."""
+        return bool(self.error) or self.seen >= self.offset + self.limit
+
+
 class JiraService:
     """Handles communication with the JIRA Cloud REST API."""
+
+    # Normalized issue details per (issue_key, changelog variant), stored with
+    # the issue's `updated` timestamp as version; shared by all instances.
+    details_cache = LRUCache(settings.jira_details_cache_size)
+    # issue_key -> (updated, seen_at) taken from search results we already have
+    version_hints = LRUCache(settings.jira_details_cache_size)
+
     def __init__(self):
         self.client = JiraClient()
+        self.async_client = AsyncJiraClient()
+        self.store = get_activity_store()
+
+    def get_user_issues(self, account_id: str, limit: int = 10, offset: int = 0, cursor: str = None):
+        """
+        Fetch issues for a user, paging only as far as offset + limit. A
+        `cursor` continues the same search from where the last page stopped.
+        """
+        snapshot_id, snapshot, offset = resume(cursor, offset)
+        if snapshot:
+            return snapshot_page(snapshot_id, snapshot, offset, limit)
+        if self._warm_store(account_id):
+            return self._stored_user_issues(account_id, limit, offset)
+
+        window = _IssueWindow(offset, limit)
+        pages = self.client.iter_user_activity(account_id, page_size=window.page_size)
+        for page in pages:
+            if not window.add(page):
+                break
+
+        count = None
+        if not window.error and not window.exhausted:
+            count = self.client.count_user_activity(account_id)
+        return self._build_user_issues(account_id, window, count, continuation=self._remaining_issues(pages))
+
+    async def get_user_issues_async(self, account_id: str, limit: int = 10, offset: int = 0, cursor: str = None):
+        """Async variant of get_user_issues."""
+        snapshot_id, snapshot, offset = resume(cursor, offset, is_async=True)
+        if snapshot:
+            return await snapshot_page_async(snapshot_id, snapshot, offset, limit)
+        if self._warm_store(account_id):
+            return self._stored_user_issues(account_id, limit, offset)
+
+        window = _IssueWindow(offset, limit)
+        pages = self.async_client.iter_user_activity(account_id, page_size=window.page_size)
+        async for page in pages:
+            if not window.add(page):
+                break
 
-    def get_user_issues(self, account_id: str, limit: int = 10, offset: int = 0):
-        """Fetch issues for a user."""
-        data = self.client.get_user_activity(account_id)
+        count = None
+        if not window.error and not window.exhausted:
+            count = await self.async_client.count_user_activity(account_id)
+        return self._build_user_issues(
+            account_id, window, count, continuation=self._aremaining_issues(pages)
+        )
+
+    def count_user_issues(self, account_id: str):
+        """Number of the user's active issues from Jira's approximate count (no issues fetched)."""
+        return self._build_issue_count(account_id, self.client.count_user_activity(account_id))
+
+    async def count_user_issues_async(self, account_id: str):
+        """Async variant of count_user_issues."""
+        return self._build_issue_count(account_id, await self.async_client.count_user_activity(account_id))
+
+    @staticmethod
+    def _build_issue_count(account_id: str, count: dict):
         member_name = UserResolver.resolve_reverse(account_id) or "This user"
+        if "error" in count:
+            return failure(f"Failed to count issues for {member_name}.", count["error"])
+        return success(message=f"{member_name} has {count['count']} active issue(s).", items=count["count"])
 
-        if "error" in data:
-            return failure(f"Failed to fetch issues for {member_name}.", data["error"])
+    @staticmethod
+    def _remaining_issues(pages):
+        """Issues of the search pages not read yet (fetched on demand)."""
+        for page in pages:
+            if "error" in page:
+                return
+            yield from page.get("issues", [])
 
-        issues = data.get("issues", [])
-        total = len(issues)
+    @staticmethod
+    async def _aremaining_issues(pages):
+        async for page in pages:
+            if "error" in page:
+                return
+            for issue in page.get("issues", []):
+                yield issue
+
+    def get_team_issues(self, account_ids: list[str], limit: int = 10, offset: int = 0):
+        """
+        Issues for several users from batched `assignee in (...)` queries,
+        so N users cost one round trip per chunk instead of N. A chunk stops
+        paging as soon as each of its users holds offset + limit issues, so
+        a user's `total` is only a lower bound while the query has more pages.
+        """
+        windows = {a: _IssueWindow(offset, limit) for a in dict.fromkeys(account_ids)}
+        for chunk in self.client.chunks(list(windows)):
+            for page in self.client.iter_team_activity(chunk):
+                self._absorb_team_page(windows, page)
+                if all(windows[a].filled for a in chunk):
+                    break
+        return self._build_team_issues(windows)
+
+    async def get_team_issues_async(self, account_ids: list[str], limit: int = 10, offset: int = 0):
+        """Async variant of get_team_issues."""
+        windows = {a: _IssueWindow(offset, limit) for a in dict.fromkeys(account_ids)}
+        for chunk in self.async_client.chunks(list(windows)):
+            pages = self.async_client.iter_team_activity(chunk)
+            async for page in pages:
+                self._absorb_team_page(windows, page)
+                if all(windows[a].filled for a in chunk):
+                    break
+            await pages.aclose()
+        return self._build_team_issues(windows)
+
+    @staticmethod
+    def _absorb_team_page(windows: dict, page: dict):
+        """Feed each user's share of a partitioned page to their window."""
+        for account_id in page["account_ids"]:
+            if "error" in page:
+                windows[account_id].add(page)
+            else:
+                windows[account_id].add({
+                    "issues": page["issues_by_user"].get(account_id, []),
+                    "next_page_token": page.get("next_page_token"),
+                })
 
+    def _build_team_issues(self, windows: dict):
+        """One per-user response (same shape as get_user_issues) keyed by accountId."""
+        items = {account_id: self._build_user_issues(account_id, window) for account_id, window in windows.items()}
+        failed = [a for a, res in items.items() if not res["success"]]
+
+        return success(
+            message=f"Fetched issues for {len(items) - len(failed)} of {len(items)} user(s).",
+            items=items,
+            meta={"users": len(items), "failed": failed}
+        )
+
+    def _warm_store(self, account_id: str) -> bool:
+        """True if the activity store holds a recent sync of this user's issues."""
+        return self.store is not None and self.store.is_fresh("jira", account_id)
+
+    def _stored_user_issues(self, account_id: str, limit: int, offset: int):
+        """Active issues served from the activity store instead of a live search."""
+        member_name = UserResolver.resolve_reverse(account_id) or "This user"
+        items, total, rest = self.store.issues(account_id, limit, offset)
         if total == 0:
             return success(message=f"No active issues found for {member_name}.", items=[], meta={"total": 0})
 
-        paginated = issues[offset: offset + limit]
+        # The rows are as old as the last sync, so their hints age from then
+        self._remember_versions(items, age=self.store.sync_age("jira", account_id) or 0.0)
+        return paged_response(
+            f"{member_name} has {total} active issue(s).", items, total, limit, offset, rest, meta={"source": "store"}
+        )
 
-        return success(
-            message=f"{member_name} has {total} active issue(s).",
-            items=paginated,
+    def _build_user_issues(self, account_id: str, window: _IssueWindow, count: dict = None, continuation=None):
+        """
+        Shape the paged window into the response. `total` is exact once the
+        stream was exhausted, otherwise Jira's approximate count (never less
+        than what we have already seen). Without a count an unfinished stream
+        only gives a lower bound, flagged in `total_is_lower_bound`. With a
+        `continuation` of the search, a `next_cursor` is attached when more
+        issues follow.
+        """
+        member_name = UserResolver.resolve_reverse(account_id) or "This user"
+
+        if window.error:
+            return failure(f"Failed to fetch issues for {member_name}.", window.error)
+
+        total = window.seen
+        lower_bound = not window.exhausted
+        if count and "error" not in count:
+            total = max(total, count["count"])
+            lower_bound = False
+        elif count:
+            logger.warning(f"JIRA count unavailable for {account_id}; total is a lower bound")
+
+        if total == 0:
+            return success(message=f"No active issues found for {member_name}.", items=[], meta={"total": 0})
+
+        self._remember_versions(window.items)
+
+        message = f"{member_name} has {'at least ' if lower_bound else ''}{total} active issue(s)."
+        response = success(
+            message=message,
+            items=window.items,
             meta={
                 "total": total,
-                "limit": limit,
-                "offset": offset,
-                "returned": len(paginated)
+                "total_is_lower_bound": lower_bound,
+                "limit": window.limit,
+                "offset": window.offset,
+                "returned": len(window.items),
+                "has_more": not window.exhausted or window.offset + window.limit < total,
             }
         )
+        if continuation is None:
+            return response
+
+        snapshot = Snapshot(
+            message,
+            window.items + window.rest,
+            source=None if window.exhausted else continuation,
+            start=window.offset,
+            total=total,
+        )
+        return with_cursor(response, snapshot, window.offset, window.limit)
+
+    def get_issue_details(self, issue_key: str, changelog: bool = False, changelog_limit: int = 100):
+        """
+        Fetch details of a specific JIRA issue. Fields only unless `changelog`
+        is set, in which case up to `changelog_limit` entries are paged in.
+        A cached copy is served while the issue's `updated` is unchanged.
+        """
+        variant = changelog_limit if changelog else 0
+        entry = self.details_cache.get((issue_key, variant))
+        if entry:
+            version = self._hinted_version(issue_key)
+            if version is None:
+                version = self._version_of(self.client.get_issue_version(issue_key))
+            if version == entry["updated"]:
+                return entry["response"]
 
-    def get_issue_details(self, issue_key: str):
-        """Fetch details of a specific JIRA issue."""
         data = self.client.get_issue_details(issue_key)
+        if changelog and "error" not in data:
+            # Client results may be shared with coalesced callers: copy, don't mutate
+            data = {**data, "changelog": self._changelog(issue_key, changelog_limit)}
+        return self._store_details(issue_key, variant, data)
+
+    async def get_issue_details_async(self, issue_key: str, changelog: bool = False, changelog_limit: int = 100):
+        """Async variant of get_issue_details."""
+        variant = changelog_limit if changelog else 0
+        entry = self.details_cache.get((issue_key, variant))
+        if entry:
+            version = self._hinted_version(issue_key)
+            if version is None:
+                version = self._version_of(await self.async_client.get_issue_version(issue_key))
+            if version == entry["updated"]:
+                return entry["response"]
+
+        data = await self.async_client.get_issue_details(issue_key)
+        if changelog and "error" not in data:
+            data = {**data, "changelog": await self._changelog_async(issue_key, changelog_limit)}
+        return self._store_details(issue_key, variant, data)
+
+    def get_issues_details(self, issue_keys: list[str], changelog: bool = False, changelog_limit: int = 100):
+        """
+        Details for many issues: bulk-fetched fields, changelogs fetched
+        concurrently on request. Keys whose search hint matches the cached
+        version are not fetched at all.
+        """
+        keys = list(dict.fromkeys(issue_keys))
+        variant = changelog_limit if changelog else 0
+        cached = self._hinted_hits(keys, variant)
+        missing = [k for k in keys if k not in cached]
+
+        data = self.client.get_issues_details(missing) if missing else {"issues": {}, "errors": {}}
+
+        if changelog:
+            found = [k for k in missing if k in data["issues"]]
+            logs = bounded_map(lambda k: self._changelog(k, changelog_limit), found, settings.jira_details_workers)
+            issues = dict(data["issues"])
+            for key, log in zip(found, logs):
+                issues[key] = {**issues[key], "changelog": log}
+            data = {**data, "issues": issues}
+
+        return self._build_issues_details(keys, variant, data, cached)
+
+    async def get_issues_details_async(self, issue_keys: list[str], changelog: bool = False, changelog_limit: int = 100):
+        """Async variant of get_issues_details."""
+        keys = list(dict.fromkeys(issue_keys))
+        variant = changelog_limit if changelog else 0
+        cached = self._hinted_hits(keys, variant)
+        missing = [k for k in keys if k not in cached]
+
+        data = await self.async_client.get_issues_details(missing) if missing else {"issues": {}, "errors": {}}
+
+        if changelog:
+            found = [k for k in missing if k in data["issues"]]
+            logs = await bounded_gather(
+                lambda k: self._changelog_async(k, changelog_limit), found, settings.jira_details_workers
+            )
+            issues = dict(data["issues"])
+            for key, log in zip(found, logs):
+                issues[key] = {**issues[key], "changelog": log}
+            data = {**data, "issues": issues}
+
+        return self._build_issues_details(keys, variant, data, cached)
+
+    @staticmethod
+    def _version_of(data: dict):
+        return None if "error" in data else data.get("fields", {}).get("updated")
+
+    def _hinted_version(self, issue_key: str):
+        """`updated` seen in a recent search result, if still within JIRA_VERSION_HINT_TTL."""
+        hint = self.version_hints.peek(issue_key)
+        if hint and time.monotonic() - hint[1] <= settings.jira_version_hint_ttl:
+            return hint[0]
+        return None
+
+    @classmethod
+    def _remember_versions(cls, issues: list, age: float = 0.0):
+        """Note each issue's `updated` as observed `age` seconds ago; a more recent hint is kept."""
+        seen = time.monotonic() - age
+        for issue in issues:
+            if issue.get("key") and issue.get("updated"):
+                hint = cls.version_hints.peek(issue["key"])
+                if hint is None or hint[1] <= seen:
+                    cls.version_hints.set(issue["key"], (issue["updated"], seen))
+
+    def _hinted_hits(self, keys: list[str], variant: int) -> dict:
+        """Cached responses for keys whose hinted version matches, without any request."""
+        hits = {}
+        for key in keys:
+            version = self._hinted_version(key)
+            entry = self.details_cache.peek((key, variant))
+            if version and entry and entry["updated"] == version:
+                self.details_cache.get((key, variant))  # count the hit and refresh recency
+                hits[key] = entry["response"]
+        return hits
+
+    def _store_details(self, issue_key: str, variant: int, data: dict):
+        """Normalize raw details and cache successful results under their version."""
+        response = self._build_issue_details(issue_key, data)
+        version = None if "error" in data else data.get("fields", data).get("updated")
+        if response["success"] and version:
+            self.details_cache.set((issue_key, variant), {"updated": version, "response": response})
+        return response
+
+    def _changelog(self, issue_key: str, limit: int) -> list:
+        """First `limit` changelog entries; later pages are never requested."""
+        return list(islice(self.client.iter_changelog(issue_key), limit))
+
+    async def _changelog_async(self, issue_key: str, limit: int) -> list:
+        entries = []
+        if limit <= 0:
+            return entries
+
+        async for entry in self.async_client.iter_changelog(issue_key):
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
+        return entries
+
+    def _build_issues_details(self, keys: list[str], variant: int, data: dict, cached: dict):
+        """Per-key detail responses in request order."""
+        items = [
+            cached.get(key)
+            or self._store_details(key, variant, data["issues"].get(key) or {"error": data["errors"].get(key)})
+            for key in keys
+        ]
+        failed = [key for key, item in zip(keys, items) if not item["success"]]
+
+        return success(
+            message=f"Fetched {len(keys) - len(failed)} of {len(keys)} issue(s).",
+            items=items,
+            meta={"requested": len(keys), "failed": failed}
+        )
+
+    def _build_issue_details(self, issue_key: str, data: dict):
+        """Normalize raw issue details into the response shape."""
         if "error" in data:
             return failure(f"Failed to fetch issue {issue_key}.", data["error"])
 
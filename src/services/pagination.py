@@ -0,0 +1,263 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional, Union
+
+from src.api.utils.response_builder import success
+from src.core.config import settings
+
+# False inside internal fetches (e.g. the /activity fan-out) whose pages are
+# never continued by their caller: those responses open no snapshot.
+cursors_enabled: ContextVar[bool] = ContextVar("cursors_enabled", default=True)
+
+
+@contextmanager
+def without_cursors():
+    """Build pages in the enclosed calls without opening snapshots (`next_cursor` is None)."""
+    token = cursors_enabled.set(False)
+    try:
+        yield
+    finally:
+        cursors_enabled.reset(token)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    raw = json.dumps({"s": snapshot_id, "o": offset}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return str(data["s"]), int(data["o"])
+    except Exception as e:
+        raise InvalidCursor("Malformed pagination cursor.") from e
+
+
+class Snapshot:
+    """
+    Server-side continuation of one paginated listing.
+
+    `items` are the shaped results loaded so far, the first one being at
+    position `start`; `source` (a sync or async iterator) yields the rest
+    lazily, so a later page costs at most the next upstream page.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        items: list,
+        source=None,
+        start: int = 0,
+        total: Union[int, Callable[[], int], None] = None,
+        meta: dict = None,
+    ):
+        self.message = message
+        self.items = list(items)
+        self.source = source
+        self.start = start
+        self._total = total
+        self.meta = meta or {}
+        self._lock = threading.Lock()
+        self._alock: Optional[asyncio.Lock] = None
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.items)
+
+    def total(self) -> int:
+        """Upstream total if known, else what has been loaded (a lower bound while `source` is open)."""
+        known = self._total() if callable(self._total) else self._total
+        return max(known or 0, self.end)
+
+    def _slice(self, offset: int, limit: int) -> tuple[list, bool]:
+        i = offset - self.start
+        return self.items[i: i + limit], self.end > offset + limit
+
+    def page(self, offset: int, limit: int) -> tuple[list, bool]:
+        """Items at [offset, offset+limit) and whether more follow (loads one item ahead)."""
+        with self._lock:
+            while self.source is not None and self.end <= offset + limit:
+                try:
+                    self.items.append(next(self.source))
+                except StopIteration:
+                    self.source = None
+            return self._slice(offset, limit)
+
+    @property
+    def is_async(self) -> bool:
+        return hasattr(self.source, "__anext__")
+
+    async def apage(self, offset: int, limit: int) -> tuple[list, bool]:
+        """Async variant of page(); accepts sync sources too."""
+        if not self.is_async:
+            return self.page(offset, limit)
+
+        self._alock = self._alock or asyncio.Lock()
+        async with self._alock:
+            while self.source is not None and self.end <= offset + limit:
+                try:
+                    self.items.append(await anext(self.source))
+                except StopAsyncIteration:
+                    self.source = None
+            return self._slice(offset, limit)
+
+
+class CursorStore:
+    """
+    Short-lived snapshots referenced by opaque cursors. Bounded by the items
+    they retain rather than their number, since one snapshot can hold a
+    user's whole listing: the least recently used ones are evicted first.
+    """
+
+    def __init__(self, max_items: int, ttl: float):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._snapshots: OrderedDict[str, tuple[Snapshot, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def open(self, snapshot: Snapshot) -> str:
+        snapshot_id = uuid.uuid4().hex[:16]
+        with self._lock:
+            self._snapshots[snapshot_id] = (snapshot, time.monotonic() + self.ttl)
+            self._evict()
+        return snapshot_id
+
+    def get(self, snapshot_id: str) -> Optional[Snapshot]:
+        now = time.monotonic()
+        with self._lock:
+            snapshot, expires_at = self._snapshots.get(snapshot_id, (None, 0))
+            if snapshot is None or expires_at <= now:
+                self._snapshots.pop(snapshot_id, None)
+                self.misses += 1
+                return None
+
+            # Sliding expiry while paging; the snapshot may have grown since it was stored
+            self._snapshots[snapshot_id] = (snapshot, now + self.ttl)
+            self._snapshots.move_to_end(snapshot_id)
+            self.hits += 1
+            self._evict()
+            return snapshot
+
+    def _retained(self) -> int:
+        return sum(len(snapshot.items) for snapshot, _ in self._snapshots.values())
+
+    def _evict(self):
+        """Drop expired snapshots, then the oldest until the rest fit (the newest always stays)."""
+        now = time.monotonic()
+        for snapshot_id in [i for i, (_, expires_at) in self._snapshots.items() if expires_at <= now]:
+            del self._snapshots[snapshot_id]
+
+        retained = self._retained()
+        while retained > self.max_items and len(self._snapshots) > 1:
+            _, (snapshot, _) = self._snapshots.popitem(last=False)
+            retained -= len(snapshot.items)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._snapshots),
+                "items": self._retained(),
+                "max_items": self.max_items,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+cursor_store = CursorStore(settings.cursor_snapshot_max_items, settings.cursor_snapshot_ttl)
+
+
+def resume(cursor: Optional[str], offset: int, is_async: bool = False) -> tuple[Optional[str], Optional[Snapshot], int]:
+    """
+    Resolve a request's cursor to (snapshot_id, snapshot, offset). Without a
+    cursor, or once its snapshot expired, the snapshot is None and the
+    caller re-fetches from the offset (the cursor's offset if it had one).
+    Sync callers cannot continue an async source and re-fetch as well.
+    """
+    if not cursor:
+        return None, None, offset
+
+    snapshot_id, offset = decode_cursor(cursor)
+    snapshot = cursor_store.get(snapshot_id)
+    if snapshot is not None and (offset < snapshot.start or (snapshot.is_async and not is_async)):
+        snapshot = None
+    return snapshot_id, snapshot, offset
+
+
+def _page_response(snapshot_id: str, snapshot: Snapshot, items: list, has_more: bool, offset: int, limit: int):
+    return success(
+        message=snapshot.message,
+        items=items,
+        meta={
+            **snapshot.meta,
+            "total": snapshot.total(),
+            "limit": limit,
+            "offset": offset,
+            "returned": len(items),
+            "has_more": has_more,
+            "next_cursor": encode_cursor(snapshot_id, offset + len(items)) if has_more else None,
+        }
+    )
+
+
+def snapshot_page(snapshot_id: str, snapshot: Snapshot, offset: int, limit: int):
+    """Serve a page from a snapshot (sync source)."""
+    items, has_more = snapshot.page(offset, limit)
+    return _page_response(snapshot_id, snapshot, items, has_more, offset, limit)
+
+
+async def snapshot_page_async(snapshot_id: str, snapshot: Snapshot, offset: int, limit: int):
+    """Serve a page from a snapshot (async source)."""
+    items, has_more = await snapshot.apage(offset, limit)
+    return _page_response(snapshot_id, snapshot, items, has_more, offset, limit)
+
+
+def with_cursor(response: dict, snapshot: Snapshot, offset: int, limit: int) -> dict:
+    """
+    Add `next_cursor` to a freshly built page, opening a snapshot only when
+    there is something after it and the caller can continue it.
+    """
+    if not response.get("success"):
+        return response
+
+    meta = response["data"]["meta"]
+    has_more = meta.get("has_more", offset + limit < meta.get("total", 0))
+    resumable = has_more and cursors_enabled.get()
+    meta["next_cursor"] = encode_cursor(cursor_store.open(snapshot), offset + limit) if resumable else None
+    return response
+
+
+def paged_response(message: str, items: list, total: int, limit: int, offset: int, rest=None, meta: dict = None) -> dict:
+    """
+    Page response for a listing whose `total` is known up front (e.g. read
+    from the activity store); `rest` lazily yields what follows the page.
+    """
+    meta = meta or {}
+    response = success(
+        message=message,
+        items=items,
+        meta={
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "returned": len(items),
+            "has_more": offset + limit < total,
+            **meta,
+        }
+    )
+    return with_cursor(response, Snapshot(message, items, source=rest, start=offset, total=total, meta=meta), offset, limit)
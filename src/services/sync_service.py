@@ -0,0 +1,176 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from itertools import takewhile
+
+from src.core.config import settings
+from src.core.logger import get_logger
+from src.core.user_resolver import UserResolver
+from src.integrations.rate_limiter import background_priority
+from src.services.activity_store import ActivityStore, get_activity_store, utc_iso
+from src.services.github_service import GitHubService
+from src.services.jira_service import JiraService
+
+logger = get_logger(__name__)
+
+PRS_PER_PAGE = 100
+SEARCH_RESULT_LIMIT = 1000  # GitHub search never returns more than this
+
+
+class SyncService:
+    """
+    Incremental sync of upstream activity into the ActivityStore. Every
+    source resumes from its own cursor, so a periodic run only fetches what
+    changed since the previous one:
+
+    - repos: one listing request; cursor = newest `pushed_at`
+    - commits: only repos pushed since that cursor, each read from its last
+      seen SHA (cursor {"sha", "at"} per repo)
+    - PRs: the user's PR search, every page of it
+    - Jira: `updated >= cursor` JQL over all of the user's issues
+
+    A source that fails keeps its old cursor and is retried on the next run.
+    """
+
+    def __init__(self, store: ActivityStore = None):
+        self.store = store or get_activity_store()
+        self.github = GitHubService()
+        self.jira = JiraService()
+
+    def sync_all(self) -> dict:
+        """Sync every configured user at background rate-limit priority; returns records written per user."""
+        with background_priority():
+            return {name: self.sync_user(name) for name in UserResolver.MAP}
+
+    def sync_user(self, name: str) -> int:
+        ids = UserResolver.resolve(name) or {}
+        written = 0
+        if ids.get("github"):
+            written += self.sync_github(ids["github"])
+        if ids.get("jira"):
+            written += self.sync_jira(ids["jira"])
+        return written
+
+    # ---- GitHub ----------------------------------------------------------
+    def sync_github(self, username: str) -> int:
+        raw = self.github.client.get_recent_repos(username)
+        if not raw["success"]:
+            logger.warning(f"Sync of GitHub repos for {username} failed: {raw['error']}")
+            return 0
+
+        repos = raw["data"]
+        written = self.store.upsert_repos(username, repos)
+
+        # Repos not pushed since the last sync cannot have new commits
+        pushed_cursor = self.store.cursor("github.repos", username)
+        active = [
+            r["full_name"] for r in repos[: settings.github_commit_repo_limit]
+            if r.get("full_name") and (not pushed_cursor or (utc_iso(r.get("last_pushed")) or "") > pushed_cursor)
+        ]
+
+        complete = True
+        for full_name in active:
+            count, ok = self._sync_repo_commits(username, full_name)
+            written += count
+            complete = complete and ok
+
+        prs = self._sync_prs(username)
+        written += prs or 0
+
+        if complete and prs is not None:
+            newest = max((utc_iso(r.get("last_pushed")) or "" for r in repos), default="") or pushed_cursor
+            self.store.mark_synced("github.repos", username, newest)
+            self.store.mark_synced("github", username)
+        return written
+
+    def _sync_repo_commits(self, username: str, full_name: str) -> tuple[int, bool]:
+        """Commits of one repo newer than its cursor; returns (written, completed)."""
+        cursor = self.store.cursor("github.commits", full_name) or {}
+        since = cursor.get("at") or datetime.now(timezone.utc) - timedelta(days=settings.activity_store_history_days)
+
+        newest, written, page = None, 0, 1
+        while True:
+            raw = self.github._fetch_commit_page(full_name, page, since=since, author=username)
+            if not raw["success"]:
+                logger.warning(f"Sync of {full_name} commits failed: {raw['error']}")
+                return written, False
+
+            commits = raw["data"]
+            fresh = list(takewhile(lambda c: c.get("sha") != cursor.get("sha"), commits))
+            records = [GitHubService._commit_item((None, full_name, c)) for c in fresh]
+            written += self.store.upsert_commits(username, records)
+            newest = newest or (records[0] if records else None)
+
+            if len(fresh) < len(commits) or len(commits) < GitHubService.COMMITS_PER_PAGE:
+                break
+            page += 1
+
+        if newest:
+            self.store.mark_synced("github.commits", full_name, {"sha": newest["sha"], "at": newest["timestamp"]})
+        return written, True
+
+    def _pr_record(self, pr: dict) -> dict:
+        return {
+            "title": pr.get("title"),
+            "url": pr.get("html_url"),
+            "repo": self.github.repo_name,
+            "state": pr.get("state"),
+            "created_at": pr.get("created_at"),
+            "merged_at": (pr.get("pull_request") or {}).get("merged_at"),
+            "closed_at": pr.get("closed_at"),
+        }
+
+    def _sync_prs(self, username: str):
+        """Upsert every page of the user's PRs; None if the search failed."""
+        written, page = 0, 1
+        while True:
+            raw = self.github.client.get_pull_requests(username, self.github.repo_name,
+                                                       page=page, per_page=PRS_PER_PAGE)
+            if not raw["success"]:
+                logger.warning(f"Sync of PRs for {username} failed: {raw['error']}")
+                return None
+
+            items = raw["data"].get("items", [])
+            written += self.store.upsert_prs(username, [self._pr_record(pr) for pr in items])
+            if len(items) < PRS_PER_PAGE or page * PRS_PER_PAGE >= SEARCH_RESULT_LIMIT:
+                return written
+            page += 1
+
+    # ---- Jira ------------------------------------------------------------
+    @staticmethod
+    def _jql_since(cursor: str):
+        """
+        JQL dates are read in the Jira user's time zone, so resume a day
+        before the UTC cursor; re-reading a few issues is harmless (upserts).
+        """
+        if not cursor:
+            return None
+        at = datetime.strptime(cursor, "%Y-%m-%dT%H:%M:%SZ") - timedelta(days=1)
+        return at.strftime("%Y-%m-%d %H:%M")
+
+    def sync_jira(self, account_id: str) -> int:
+        cursor = self.store.cursor("jira.issues", account_id)
+        latest, written = cursor, 0
+
+        for page in self.jira.client.iter_user_updates(account_id, self._jql_since(cursor)):
+            if "error" in page:
+                logger.warning(f"Sync of JIRA issues for {account_id} failed: {page['error']}")
+                return written
+
+            written += self.store.upsert_issues(account_id, page["issues"])
+            latest = max([latest or ""] + [utc_iso(i.get("updated")) or "" for i in page["issues"]]) or None
+
+        self.store.mark_synced("jira.issues", account_id, latest)
+        self.store.mark_synced("jira", account_id)
+        return written
+
+
+async def run_periodic_sync(store: ActivityStore, interval: float):
+    """Keep the store fresh: sync everyone every `interval` seconds (off the event loop)."""
+    sync = SyncService(store)
+    while True:
+        try:
+            written = await asyncio.to_thread(sync.sync_all)
+            logger.info(f"Activity store sync wrote {written}")
+        except Exception as e:
+            logger.warning(f"Activity store sync failed: {e}")
+        await asyncio.sleep(interval)
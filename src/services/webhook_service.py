@@ -0,0 +1,251 @@
+import hashlib
+import hmac
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.api.utils.response_builder import success
+from src.core.config import settings
+from src.core.logger import get_logger
+from src.core.user_resolver import UserResolver
+from src.integrations.jira_client import JiraClient
+from src.services.activity_service import ActivityService
+from src.services.activity_store import get_activity_store, utc_iso
+from src.services.jira_service import JiraService
+
+logger = get_logger(__name__)
+
+JIRA_ISSUE_EVENTS = ("jira:issue_created", "jira:issue_updated")
+
+
+def verify_signature(secret: str, body: bytes, header: Optional[str]) -> bool:
+    """Check a `sha256=<hex>` HMAC header (GitHub X-Hub-Signature-256, Jira X-Hub-Signature)."""
+    if not secret or not header or not header.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, header.removeprefix("sha256="))
+
+
+def _changes() -> dict:
+    """
+    Normalized records per kind, keyed by the user they belong to;
+    `unassigned` holds {"key"} of issues taken away from that user.
+    """
+    return {"commits": {}, "prs": {}, "repos": {}, "issues": {}, "unassigned": {}}
+
+
+def _pushed_at(value) -> Optional[str]:
+    # Push payloads send repository.pushed_at as epoch seconds, other events as ISO
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return value
+
+
+def normalize_github(event: str, payload: dict) -> Optional[dict]:
+    """
+    Map a `push` or `pull_request` event onto the records GitHubService emits
+    (commit items, repo dicts, PRs); None for events we do not track.
+    """
+    repo = payload.get("repository") or {}
+    owner = (repo.get("owner") or {}).get("login") or (repo.get("owner") or {}).get("name")
+    changes = _changes()
+
+    if event == "push" and owner:
+        # Filed under their author like the author-filtered listings; commits already
+        # pushed elsewhere (distinct: false) and ones without a GitHub login are skipped
+        for c in payload.get("commits", []):
+            author = (c.get("author") or {}).get("username")
+            if not author or c.get("distinct") is False:
+                continue
+            changes["commits"].setdefault(author, []).append({
+                "repo": repo.get("full_name"),
+                "message": c.get("message"),
+                "timestamp": utc_iso(c.get("timestamp")),
+                "url": c.get("url"),
+                "sha": c.get("id"),
+            })
+        changes["repos"][owner] = [{
+            "name": repo.get("name"),
+            "full_name": repo.get("full_name"),
+            "url": repo.get("html_url"),
+            "description": repo.get("description"),
+            "last_pushed": _pushed_at(repo.get("pushed_at")),
+            "stars": repo.get("stargazers_count"),
+            "forks": repo.get("forks_count"),
+        }]
+        return changes
+
+    if event == "pull_request" and payload.get("pull_request"):
+        pr = payload["pull_request"]
+        author = (pr.get("user") or {}).get("login")
+        changes["prs"][author] = [{
+            "title": pr.get("title"),
+            "url": pr.get("html_url"),
+            "repo": repo.get("name"),
+            "state": pr.get("state"),
+            "created_at": pr.get("created_at"),
+            "merged_at": pr.get("merged_at"),
+            "closed_at": pr.get("closed_at"),
+        }]
+        return changes
+
+    return None
+
+
+def normalize_jira(payload: dict) -> Optional[dict]:
+    """
+    Map an issue created/updated event of JIRA_PROJECT_KEY onto JiraClient's
+    issue rows; None for other events and projects. When the changelog shows
+    the assignee changed, the previous one loses the issue.
+    """
+    issue = payload.get("issue")
+    if payload.get("webhookEvent") not in JIRA_ISSUE_EVENTS or not issue:
+        return None
+
+    fields = issue.get("fields", {})
+    project = (fields.get("project") or {}).get("key") or str(issue.get("key", "")).partition("-")[0]
+    if project != settings.jira_project_key:
+        return None
+
+    changes = _changes()
+    assignee = (fields.get("assignee") or {}).get("accountId")
+    if assignee:
+        changes["issues"][assignee] = [JiraClient._sync_row(issue)]
+
+    for item in (payload.get("changelog") or {}).get("items", []):
+        previous = item.get("from")
+        if item.get("field") == "assignee" and previous and previous != assignee:
+            changes["unassigned"][previous] = [{"key": issue.get("key")}]
+
+    return changes if changes["issues"] or changes["unassigned"] else None
+
+
+class WebhookProcessor:
+    """
+    Applies webhook changes off the request path. Handlers only verify,
+    normalize and enqueue; a background thread drains the queue in batches
+    (up to WEBHOOK_BATCH_SIZE events or WEBHOOK_BATCH_WAIT seconds), so a
+    burst of pushes turns into a few bulk store writes and one cache
+    invalidation per affected user.
+    """
+
+    def __init__(self, maxsize: int = None):
+        self._queue = queue.Queue(maxsize=maxsize or settings.webhook_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.received = 0
+        self.dropped = 0
+        self.batches = 0
+        self.applied = 0
+
+    def submit(self, source: str, event: str, changes: Optional[dict]):
+        """Queue normalized `changes`; returns the response for the webhook sender."""
+        if changes is None:
+            return success(message=f"Ignored {source} event '{event}'.", items=[], meta={"queued": False})
+
+        try:
+            self._queue.put_nowait(changes)
+        except queue.Full:
+            self.dropped += 1
+            return None  # caller answers 503 so the sender retries later
+
+        self.received += 1
+        self._ensure_worker()
+        return success(message=f"Queued {source} event '{event}'.", items=[], meta={"queued": True})
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, daemon=True, name="webhook-worker")
+                self._worker.start()
+
+    def _next_batch(self, block: bool = True) -> list[dict]:
+        batch = []
+        try:
+            batch.append(self._queue.get(block=block))
+        except queue.Empty:
+            return batch
+
+        deadline = time.monotonic() + settings.webhook_batch_wait
+        while len(batch) < settings.webhook_batch_size:
+            try:
+                batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic()) if block else 0))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                self.apply(batch)
+            except Exception as e:
+                logger.error(f"Applying {len(batch)} webhook event(s) failed: {e}")
+
+    def flush(self):
+        """Apply everything queued right now on the calling thread."""
+        while batch := self._next_batch(block=False):
+            self.apply(batch)
+
+    def apply(self, batch: list[dict]):
+        merged = _changes()
+        for changes in batch:
+            self._supersede(merged, changes)
+            for kind, by_user in changes.items():
+                for user, records in by_user.items():
+                    merged[kind].setdefault(user, []).extend(records)
+
+        store = get_activity_store()
+        if store is not None:
+            for user, commits in merged["commits"].items():
+                store.upsert_commits(user, commits)
+            for user, prs in merged["prs"].items():
+                store.upsert_prs(user, prs)
+            for user, repos in merged["repos"].items():
+                store.upsert_repos(user, repos)
+            for account_id, issues in merged["issues"].items():
+                store.upsert_issues(account_id, issues)
+            for account_id, issues in merged["unassigned"].items():
+                store.remove_issues(account_id, [i["key"] for i in issues])
+
+        self._invalidate(merged)
+        self.batches += 1
+        self.applied += len(batch)
+
+    @staticmethod
+    def _supersede(merged: dict, changes: dict):
+        """Drop what earlier events of the batch said about the issues `changes` touches (the last event wins)."""
+        keys = {i["key"] for kind in ("issues", "unassigned") for rows in changes.get(kind, {}).values() for i in rows}
+        if not keys:
+            return
+        for kind in ("issues", "unassigned"):
+            for account_id, rows in merged[kind].items():
+                merged[kind][account_id] = [i for i in rows if i["key"] not in keys]
+
+    @staticmethod
+    def _invalidate(merged: dict):
+        """Forget cached answers of every affected user and note new Jira issue versions."""
+        github_users = set(merged["commits"]) | set(merged["prs"]) | set(merged["repos"])
+        names = {name for name, ids in UserResolver.MAP.items() if ids.get("github") in github_users}
+        names |= {UserResolver.resolve_reverse(a) for a in (*merged["issues"], *merged["unassigned"])} - {None}
+
+        dropped = ActivityService.response_cache.discard_where(lambda key: key[0] in names)
+        if dropped:
+            logger.info(f"Webhooks invalidated {dropped} cached answer(s) for {sorted(names)}")
+
+        # Cached issue details whose version no longer matches are refetched on next read
+        JiraService._remember_versions([row for rows in merged["issues"].values() for row in rows])
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "received": self.received,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "applied": self.applied,
+        }
+
+
+webhook_processor = WebhookProcessor()
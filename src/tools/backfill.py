@@ -0,0 +1,333 @@
+"""
+Historical backfill of the activity store.
+
+    python -m src.tools.backfill [--users abhishek ...] [--workers 4] [--since-days N] [--restart]
+
+Walks every user in UserResolver.MAP (or the ones given), lists their repos
+and splits the work into units - one per repo's commits, one per user's PRs
+and one per Jira account - that run across a process pool. Each unit pages
+through the full history (or the last --since-days: commits and PRs created,
+issues updated in that window), bulk-upserts every page and checkpoints
+after it in the store's sync_state, so an interrupted run picks up where it
+stopped (pass --restart to start over). Workers report every page to the
+parent, which prints a status line at least every STATUS_INTERVAL seconds.
+Workers call GitHub at background priority: they share the per-token
+X-RateLimit budgets, stay clear of the interactive reserve and honour
+Retry-After, while the local search and Jira throttles are split evenly
+between processes.
+"""
+import argparse
+import multiprocessing
+import queue
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Callable, NamedTuple, Optional
+
+from src.core.config import settings
+from src.core.logger import get_logger
+from src.core.user_resolver import UserResolver
+from src.integrations.github_client import GitHubClient
+from src.integrations.jira_client import JiraClient
+from src.integrations.rate_limiter import TokenBucket, background_priority
+from src.integrations.token_pool import TokenPool
+from src.services.activity_store import ActivityStore, utc_iso
+from src.services.github_service import GitHubService
+from src.services.sync_service import PRS_PER_PAGE, SEARCH_RESULT_LIMIT, SyncService
+
+logger = get_logger(__name__)
+
+STATUS_INTERVAL = 10.0  # seconds between status lines while units are running
+
+
+class Unit(NamedTuple):
+    kind: str  # "commits" | "prs" | "jira"
+    user: str  # GitHub username or Jira account id
+    repo: Optional[str] = None  # full_name, for "commits"
+
+
+class Result(NamedTuple):
+    unit: Unit
+    written: int
+    error: Optional[str] = None
+
+
+class Backfill:
+    """
+    Full-history fetchers for one process. Checkpoints live under
+    `backfill.<kind>` in sync_state; pages are re-read rather than skipped
+    when new activity shifts them, which the upserts make harmless.
+    `progress` is called with the records written by every page.
+    """
+
+    def __init__(
+        self,
+        store: ActivityStore,
+        since: str = None,
+        jira_requests_per_second: float = None,
+        progress: Callable[[int], None] = None,
+    ):
+        self.store = store
+        self.since = since  # window start for every unit; None = full history
+        self.progress = progress or (lambda records: None)
+        self.github = GitHubService()
+        self.github.store = None  # always hit upstream
+        self.jira = JiraClient()
+        rate = jira_requests_per_second or settings.backfill_jira_requests_per_second
+        self.jira_bucket = TokenBucket(rate, max(1, int(rate)))
+
+    def run(self, unit: Unit) -> int:
+        """Backfill one unit; returns records written. Raises RuntimeError on upstream failure."""
+        with background_priority():
+            if unit.kind == "commits":
+                return self.commits(unit.user, unit.repo)
+            if unit.kind == "prs":
+                return self.prs(unit.user)
+            if unit.kind == "jira":
+                return self.issues(unit.user)
+        raise ValueError(f"Unknown backfill unit {unit.kind!r}")
+
+    def commits(self, username: str, full_name: str) -> int:
+        since = self.since
+        checkpoint = self.store.cursor("backfill.commits", full_name) or {}
+        if checkpoint.get("since") != since:
+            checkpoint = {}  # a different window invalidates the page numbers
+        if checkpoint.get("done"):
+            return 0
+
+        page, written = checkpoint.get("page", 0) + 1, 0
+        while True:
+            raw = self.github._fetch_commit_page(full_name, page, since=since, author=username)
+            if not raw["success"]:
+                raise RuntimeError(raw["error"])
+
+            records = [GitHubService._commit_item((None, full_name, c)) for c in raw["data"]]
+            stored = self.store.upsert_commits(username, records)
+            written += stored
+            self.progress(stored)
+
+            # Hand the newest commit to the incremental sync unless it already tracks the repo
+            if page == 1 and records and self.store.cursor("github.commits", full_name) is None:
+                self.store.mark_synced("github.commits", full_name,
+                                       {"sha": records[0]["sha"], "at": records[0]["timestamp"]})
+
+            done = len(raw["data"]) < GitHubService.COMMITS_PER_PAGE
+            self.store.mark_synced("backfill.commits", full_name, {"page": page, "since": since, "done": done})
+            if done:
+                return written
+            page += 1
+
+    def prs(self, username: str) -> int:
+        since = self.since
+        checkpoint = self.store.cursor("backfill.prs", username) or {}
+        if checkpoint.get("since") != since:
+            checkpoint = {}
+        if checkpoint.get("done"):
+            return 0
+
+        sync = SyncService(self.store)
+        page, written = checkpoint.get("page", 0) + 1, 0
+        while True:
+            raw = self.github.client.get_pull_requests(username, self.github.repo_name,
+                                                       page=page, per_page=PRS_PER_PAGE, created_since=since)
+            if not raw["success"]:
+                raise RuntimeError(raw["error"])
+
+            items = raw["data"].get("items", [])
+            stored = self.store.upsert_prs(username, [sync._pr_record(pr) for pr in items])
+            written += stored
+            self.progress(stored)
+
+            done = len(items) < PRS_PER_PAGE or page * PRS_PER_PAGE >= SEARCH_RESULT_LIMIT
+            self.store.mark_synced("backfill.prs", username, {"page": page, "since": since, "done": done})
+            if done:
+                return written
+            page += 1
+
+    def issues(self, account_id: str) -> int:
+        since = self.since
+        checkpoint = self.store.cursor("backfill.jira", account_id) or {}
+        if checkpoint.get("since") != since:
+            checkpoint = {}
+        if checkpoint.get("done"):
+            return 0
+
+        # Updates come oldest first, so the latest `updated` seen is the resume point
+        latest, written = checkpoint.get("updated"), 0
+        self._throttle_jira()
+        for page in self.jira.iter_user_updates(account_id, SyncService._jql_since(latest or since)):
+            if "error" in page:
+                raise RuntimeError(page["error"])
+
+            stored = self.store.upsert_issues(account_id, page["issues"])
+            written += stored
+            self.progress(stored)
+            latest = max([latest or ""] + [utc_iso(i.get("updated")) or "" for i in page["issues"]]) or None
+            self.store.mark_synced("backfill.jira", account_id, {"updated": latest, "since": since, "done": False})
+            self._throttle_jira()  # before the generator requests the next page
+
+        self.store.mark_synced("backfill.jira", account_id, {"updated": latest, "since": since, "done": True})
+        if since is not None:
+            return written  # older active issues are missing: leave the store cold for this user
+
+        if self.store.cursor("jira.issues", account_id) is None:
+            self.store.mark_synced("jira.issues", account_id, latest)
+        self.store.mark_synced("jira", account_id)
+        return written
+
+    def _throttle_jira(self):
+        wait = self.jira_bucket.wait_time()
+        while wait:
+            time.sleep(wait)
+            wait = self.jira_bucket.wait_time()
+
+
+# ---- process pool -------------------------------------------------------
+_worker: dict = {}
+
+
+def _init_worker(store_path: str, workers: int, since: Optional[str], progress: multiprocessing.Queue):
+    """
+    Per-process setup: its own store connection, clients and share of the
+    local throttles; page counts go to the parent through `progress`.
+    """
+    settings.github_search_per_minute = max(1, settings.github_search_per_minute // workers)
+    GitHubClient.token_pool = TokenPool.from_settings()
+    _worker["backfill"] = Backfill(ActivityStore(store_path), since,
+                                   settings.backfill_jira_requests_per_second / workers, progress.put)
+
+
+def _run_unit(unit: Unit) -> Result:
+    try:
+        return Result(unit, _worker["backfill"].run(unit))
+    except Exception as e:
+        return Result(unit, 0, str(e))
+
+
+class Throughput:
+    """Running records/sec since the backfill started."""
+
+    def __init__(self):
+        self.records = 0
+        self.started = time.monotonic()
+
+    def add(self, records: int):
+        self.records += records
+
+    def drain(self, progress: multiprocessing.Queue):
+        """Count every page reported by the workers so far."""
+        while True:
+            try:
+                self.add(progress.get_nowait())
+            except queue.Empty:
+                return
+
+    @property
+    def rate(self) -> float:
+        return self.records / max(time.monotonic() - self.started, 1e-6)
+
+
+def plan(store: ActivityStore, names: list[str]) -> tuple[list[Unit], dict]:
+    """Work units for `names` plus each GitHub user's repos (stored as we go)."""
+    client = GitHubClient()
+    units, repos = [], {}
+    for name in names:
+        ids = UserResolver.resolve(name) or {}
+        username, account_id = ids.get("github"), ids.get("jira")
+        if username:
+            with background_priority():
+                raw = client.get_recent_repos(username)
+            if raw["success"]:
+                repos[username] = raw["data"]
+                store.upsert_repos(username, raw["data"])
+                units += [Unit("commits", username, r["full_name"]) for r in raw["data"] if r.get("full_name")]
+            else:
+                print(f"! repos of {username}: {raw['error']}", file=sys.stderr)
+            units.append(Unit("prs", username))
+        if account_id:
+            units.append(Unit("jira", account_id))
+    return units, repos
+
+
+def _describe(unit: Unit) -> str:
+    return f"{unit.kind} {unit.repo or unit.user}"
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.tools.backfill", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--users", nargs="+", default=list(UserResolver.MAP), help="names from UserResolver.MAP")
+    parser.add_argument("--workers", type=int, default=settings.backfill_workers)
+    parser.add_argument("--since-days", type=int,
+                        help="only commits and PRs created / issues updated in the last N days (default: all)")
+    parser.add_argument("--store", default=settings.activity_store_path, help="SQLite path (ACTIVITY_STORE_PATH)")
+    parser.add_argument("--restart", action="store_true", help="ignore saved checkpoints")
+    args = parser.parse_args(argv)
+
+    if not args.store:
+        parser.error("set ACTIVITY_STORE_PATH or pass --store")
+    unknown = [name for name in args.users if not UserResolver.resolve(name)]
+    if unknown:
+        parser.error(f"unknown users: {', '.join(unknown)}")
+
+    store = ActivityStore(args.store)
+    store.ensure_rollups()  # here rather than in every worker
+    if args.restart:
+        for source in ("backfill.commits", "backfill.prs", "backfill.jira"):
+            store.forget(source)
+
+    since = None
+    if args.since_days:
+        since = (datetime.now(timezone.utc) - timedelta(days=args.since_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    units, repos = plan(store, args.users)
+    print(f"Backfilling {len(units)} unit(s) for {', '.join(args.users)} with {args.workers} worker(s)")
+
+    throughput, failed = Throughput(), set()
+    context = multiprocessing.get_context("spawn")  # fresh clients and sessions per process
+    progress = context.Queue()
+    pool = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(args.store, args.workers, since, progress),
+    )
+    try:
+        pending, done = {pool.submit(_run_unit, unit) for unit in units}, 0
+        while pending:
+            finished, pending = wait(pending, timeout=STATUS_INTERVAL, return_when=FIRST_COMPLETED)
+            throughput.drain(progress)
+            if not finished:
+                print(f"[{done}/{len(units)}] {len(pending)} unit(s) running: {throughput.records} record(s), "
+                      f"{throughput.rate:.1f} records/s", flush=True)
+
+            for future in finished:
+                done += 1
+                result = future.result()
+                if result.error:
+                    failed.add(result.unit.user)
+                    print(f"[{done}/{len(units)}] {_describe(result.unit)} failed: {result.error}", file=sys.stderr)
+                else:
+                    print(f"[{done}/{len(units)}] {_describe(result.unit)}: {result.written} record(s), "
+                          f"{throughput.records} total, {throughput.rate:.1f} records/s", flush=True)
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        print(f"Interrupted after {throughput.records} record(s); rerun to resume.", file=sys.stderr)
+        return 130
+    pool.shutdown()
+    throughput.drain(progress)
+
+    # Fully backfilled users start out warm for the API and the incremental sync
+    for username, user_repos in repos.items():
+        if username not in failed and since is None:
+            newest = max((utc_iso(r.get("last_pushed")) or "" for r in user_repos), default="") or None
+            store.mark_synced("github.repos", username, newest)
+            store.mark_synced("github", username)
+
+    print(f"Done: {throughput.records} record(s) in {time.monotonic() - throughput.started:.1f}s "
+          f"({throughput.rate:.1f} records/s), {len(failed)} user(s) with failures")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
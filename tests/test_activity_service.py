@@ -3,6 +3,7 @@ from src.services.activity_service import ActivityService
 
 @pytest.fixture
 def activity_service(mocker):
+    ActivityService.response_cache.clear()
     svc = ActivityService()
     return svc
 
@@ -25,3 +26,142 @@ def test_activity_unknown_user(mocker, activity_service):
     mocker.patch("src.services.query_parser_service.QueryParserService.extract_user", return_value=None)
     res = activity_service.get_activity("Who is Abhishek?")
     assert res["success"] is False
+
+def test_activity_async_jira_intent(mocker, activity_service):
+    import asyncio
+
+    mocker.patch("src.services.query_parser_service.QueryParserService.extract_user", return_value="abhishek")
+    mocker.patch("src.core.user_resolver.UserResolver.resolve", return_value={"jira": "5b4", "github": "Abhishek-0673"})
+    jira = {"success": True, "data": {"items": [{"key": "SCRUM-1"}], "meta": {"total": 1}}}
+    mocker.patch.object(activity_service.jira, "get_user_issues_async", new_callable=mocker.AsyncMock, return_value=jira)
+    mocker.patch.object(activity_service.github, "get_user_github_activity_async", new_callable=mocker.AsyncMock,
+                        return_value={"success": True, "data": {"items": {}}})
+
+    res = asyncio.run(activity_service.get_activity_async("Show Abhishek's jira tickets", limit=5, offset=0))
+
+    assert res["success"] is True
+    assert res["data"]["items"]["jira"] == jira
+
+
+def test_activity_fetches_only_what_the_intent_needs(mocker, activity_service):
+    mocker.patch("src.services.query_parser_service.QueryParserService.extract_user", return_value="abhishek")
+    mocker.patch("src.core.user_resolver.UserResolver.resolve", return_value={"jira": "5b4", "github": "Abhishek-0673"})
+    mocker.patch("src.services.intent_service.IntentService.detect_intent", return_value="GITHUB_PRS")
+    prs = {"success": True, "data": {"items": [{"title": "PR"}], "meta": {"total": 1}}}
+    get_prs = mocker.patch.object(activity_service.github, "get_user_prs", return_value=prs)
+    jira = mocker.patch.object(activity_service.jira, "get_user_issues")
+    fused = mocker.patch.object(activity_service.github, "get_user_github_activity")
+    summary = mocker.patch.object(activity_service.summarizer, "generate")
+
+    res = activity_service.get_activity("Any open PRs from Abhishek?", limit=5, offset=0)
+
+    assert res["data"]["items"] == {"prs": prs}
+    get_prs.assert_called_once_with("Abhishek-0673", 5, 0, "default")
+    jira.assert_not_called()
+    fused.assert_not_called()
+    summary.assert_not_called()
+
+
+def test_activity_cache_serves_hits_and_refreshes_stale(mocker, activity_service):
+    mocker.patch("src.services.query_parser_service.QueryParserService.extract_user", return_value="Abhishek")
+    mocker.patch("src.core.user_resolver.UserResolver.resolve", return_value={"jira": "5b4", "github": "Abhishek-0673"})
+    mocker.patch("src.services.intent_service.IntentService.detect_intent", return_value="JIRA_ISSUES")
+    jira = mocker.patch.object(activity_service.jira, "get_user_issues",
+                               return_value={"success": True, "data": {"items": [], "meta": {"total": 0}}})
+    refresh = mocker.patch.object(activity_service, "_refresh_in_background")
+    before = ActivityService.response_cache.stats()
+
+    first = activity_service.get_activity("What is Abhishek doing?")
+    assert activity_service.get_activity("what's abhishek up to?") is first
+    assert jira.call_count == 1
+    refresh.assert_not_called()
+
+    # Past its TTL but within the stale window: served as-is, refreshed in the background
+    mocker.patch("src.core.cache.time.monotonic", return_value=10 ** 9)
+    ActivityService.response_cache.set(("abhishek", "JIRA_ISSUES", "default", 5, 0), first, ttl=-1, stale_ttl=10)
+    assert activity_service.get_activity("What is Abhishek doing?") is first
+    refresh.assert_called_once()
+
+    stats = ActivityService.response_cache.stats()
+    assert [stats[k] - before[k] for k in ("hits", "stale_hits", "misses")] == [1, 1, 1]
+
+
+def test_activity_batch_dedupes_and_keeps_order(mocker, activity_service):
+    import asyncio
+
+    mocker.patch("src.services.query_parser_service.QueryParserService.extract_user",
+                 side_effect=lambda q: "nobody" if "nobody" in q else "abhishek")
+    mocker.patch("src.core.user_resolver.UserResolver.resolve",
+                 side_effect=lambda name: None if name == "nobody" else {"jira": "5b4", "github": "Abhishek-0673"})
+    mocker.patch("src.services.intent_service.IntentService.detect_intent_async",
+                 new_callable=mocker.AsyncMock, return_value="JIRA_ISSUES")
+    jira = mocker.patch.object(activity_service.jira, "get_user_issues_async", new_callable=mocker.AsyncMock,
+                               return_value={"success": True, "data": {"items": [], "meta": {"total": 0}}})
+
+    res = asyncio.run(activity_service.get_activity_batch_async(
+        questions=["Abhishek's jira tickets", "What is nobody doing?", "jira issues for abhishek"],
+    ))
+
+    items = res["data"]["items"]
+    assert [i["message"] for i in items] == [
+        "JIRA issues for abhishek", "No accountId configured for 'nobody'.", "JIRA issues for abhishek",
+    ]
+    assert jira.await_count == 1
+    assert res["data"]["meta"]["fetched"] == 1
+
+
+def test_stream_activity_emits_sections_then_complete(mocker, activity_service):
+    import asyncio
+
+    mocker.patch("src.services.query_parser_service.QueryParserService.extract_user", return_value="abhishek")
+    mocker.patch("src.core.user_resolver.UserResolver.resolve", return_value={"jira": "5b4", "github": "Abhishek-0673"})
+    mocker.patch("src.services.intent_service.IntentService.detect_intent_async",
+                 new_callable=mocker.AsyncMock, return_value="FULL_ACTIVITY")
+    section = {"success": True, "data": {"items": [], "meta": {"total": 0}}}
+    for svc, name in [(activity_service.jira, "get_user_issues_async"),
+                      (activity_service.github, "get_user_commits_async"),
+                      (activity_service.github, "get_user_prs_async"),
+                      (activity_service.github, "get_recent_repos_async")]:
+        mocker.patch.object(svc, name, new_callable=mocker.AsyncMock, return_value=section)
+
+    async def collect():
+        return [e async for e in activity_service.stream_activity_async("What is Abhishek doing?")]
+
+    events = asyncio.run(collect())
+
+    assert sorted(e["section"] for e in events[:4]) == ["commits", "jira", "prs", "recent_repos"]
+    assert events[4]["section"] == "summary"
+    assert events[5]["event"] == "complete"
+    items = events[5]["data"]["data"]["items"]
+    assert set(items["github"]["data"]["items"]) == {"commits", "prs", "recent_repos"}
+    assert items["summary"] == events[4]["data"]
+
+    # A cache hit streams the same section names as the live run
+    cached = asyncio.run(collect())
+    assert [e["section"] for e in cached[:5]] == ["jira", "commits", "prs", "recent_repos", "summary"]
+    assert cached[5]["data"] is events[5]["data"]
+    assert list(activity_service._stream_sections({"repos": section})) == [("recent_repos", section)]
+
+
+def test_activity_deadline_returns_partial_with_degraded_sources(mocker, activity_service):
+    import time
+    from src.core.concurrency import Deadline
+
+    mocker.patch("src.services.query_parser_service.QueryParserService.extract_user", return_value="abhishek")
+    mocker.patch("src.core.user_resolver.UserResolver.resolve", return_value={"jira": "5b4", "github": "Abhishek-0673"})
+    mocker.patch("src.services.intent_service.IntentService.detect_intent", return_value="FULL_ACTIVITY")
+    mocker.patch.object(activity_service.jira, "get_user_issues",
+                        side_effect=lambda *a: time.sleep(1) or {"success": True})
+    github = {"success": True, "data": {"items": {
+        "commits": {"success": True, "data": {"items": [], "meta": {"total": 0}}},
+        "prs": {"success": False, "message": "Timed out fetching GitHub prs.", "error": "timeout"},
+    }}}
+    mocker.patch.object(activity_service.github, "get_user_github_activity", return_value=github)
+
+    res = activity_service.get_activity("What is Abhishek doing?", deadline=Deadline(0.2))
+
+    assert res["success"] is True
+    assert res["data"]["items"]["jira"]["error"] == "timeout"
+    assert res["data"]["meta"]["degraded"] == {"jira": "timeout", "github.prs": "timeout"}
+    # Partial answers are never cached
+    assert len(ActivityService.response_cache) == 0
@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from src.core.config import settings
+from src.core.user_resolver import UserResolver
+from src.services.activity_store import ActivityStore
+from src.services.github_service import GitHubService
+from src.services.jira_service import JiraService
+from src.services.sync_service import SyncService
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ActivityStore(str(tmp_path / "activity.db"))
+
+
+@pytest.fixture
+def sync(store):
+    return SyncService(store)
+
+
+# Synced commits sit a few days back, well inside ACTIVITY_STORE_HISTORY_DAYS
+BASE = datetime.now(timezone.utc).replace(hour=10, minute=0, second=0, microsecond=0) - timedelta(days=10)
+
+
+def commit(sha, day):
+    date = (BASE + timedelta(days=day)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {"sha": sha, "html_url": f"http://gh/c/{sha}", "commit": {"message": f"msg {sha}", "author": {"date": date}}}
+
+
+def repos(pushed):
+    return {"success": True, "data": [{"name": "repo1", "full_name": "user1/repo1", "last_pushed": pushed}]}
+
+
+def test_github_sync_resumes_from_last_sha_and_store_serves_reads(mocker, store, sync):
+    gh = sync.github.client
+    mocker.patch.object(gh, "get_pull_requests", return_value={"success": True, "data": {"items": [
+        {"title": "PR 1", "html_url": "http://gh/pr/1", "state": "open", "created_at": "2026-10-02T00:00:00Z"},
+    ]}})
+    mocker.patch.object(gh, "get_recent_repos", return_value=repos("2026-10-02T10:00:00Z"))
+    get_commits = mocker.patch.object(gh, "get_recent_commits",
+                                      return_value={"success": True, "data": [commit("b", 2), commit("a", 1)]})
+
+    assert sync.sync_github("user1") == 4  # repo + 2 commits + PR
+
+    # Next run: one new commit on top of the last seen SHA
+    gh.get_recent_repos.return_value = repos("2026-10-03T10:00:00Z")
+    get_commits.return_value = {"success": True, "data": [commit("c", 3), commit("b", 2)]}
+    sync.sync_github("user1")
+    assert get_commits.call_args.kwargs["since"] == commit("b", 2)["commit"]["author"]["date"]
+
+    # Nothing pushed since: the repo's commits are not even requested
+    sync.sync_github("user1")
+    assert get_commits.call_count == 2
+
+    svc = GitHubService()
+    svc.store = store
+    live = mocker.patch.object(svc.client, "get_recent_commits")
+    since = BASE.strftime("%Y-%m-%dT%H:%M:%S")
+    res = svc.get_user_commits("user1", limit=2, offset=0, since=since)
+
+    live.assert_not_called()
+    assert [c["sha"] for c in res["data"]["items"]] == ["c", "b"]
+    assert res["data"]["meta"]["total"] == 3 and res["data"]["meta"]["source"] == "store"
+
+    nxt = svc.get_user_commits("user1", limit=2, cursor=res["data"]["meta"]["next_cursor"])
+    assert [c["sha"] for c in nxt["data"]["items"]] == ["a"]
+
+
+def test_windows_outside_the_synced_horizon_go_live(mocker, store):
+    store.upsert_commits("user1", [GitHubService._commit_item((None, "user1/repo1", commit("a", 1)))])
+    store.mark_synced("github", "user1")
+    svc = GitHubService()
+    svc.store = store
+    mocker.patch.object(svc.client, "get_recent_repos", return_value=repos(commit("a", 1)["commit"]["author"]["date"]))
+    live = mocker.patch.object(svc.client, "get_recent_commits", return_value={"success": True, "data": []})
+
+    older = datetime.now(timezone.utc) - timedelta(days=settings.activity_store_history_days + 1)
+    for window in ({}, {"since": older.strftime("%Y-%m-%dT%H:%M:%S")}):
+        res = svc.get_user_commits("user1", **window)
+        assert "source" not in res["data"]["meta"]
+    assert live.call_count == 2
+
+
+def test_pr_sync_pages_through_the_search(mocker, sync):
+    def page(n):
+        return {"success": True, "data": {"items": [
+            {"title": f"PR {n}-{i}", "html_url": f"http://gh/pr/{n}-{i}", "state": "open",
+             "created_at": "2026-10-02T00:00:00Z"} for i in range(n)
+        ]}}
+    search = mocker.patch.object(sync.github.client, "get_pull_requests", side_effect=[page(100), page(3)])
+
+    assert sync._sync_prs("user1") == 103
+    assert [c.kwargs["page"] for c in search.call_args_list] == [1, 2]
+
+
+def test_jira_sync_uses_updated_cursor_and_drops_done_issues(mocker, store, sync):
+    def issue(key, category, updated):
+        return {"key": key, "fields": {"summary": key, "status": {"name": category, "statusCategory": {"key": category}},
+                                       "updated": updated}}
+
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {"issues": [issue("SCRUM-1", "new", "2026-10-01T10:00:00.000+0530"),
+                                             issue("SCRUM-2", "indeterminate", "2026-10-02T10:00:00.000+0530")],
+                                  "isLast": True}
+    post = mocker.patch.object(sync.jira.client.session, "post", return_value=response)
+    sync.sync_jira("acc-1")
+    assert "updated >=" not in post.call_args.kwargs["json"]["jql"]
+
+    response.json.return_value = {"issues": [issue("SCRUM-1", "done", "2026-10-03T10:00:00.000+0530")], "isLast": True}
+    sync.sync_jira("acc-1")
+    assert 'updated >= "2026-10-01 04:30"' in post.call_args.kwargs["json"]["jql"]
+
+    svc = JiraService()
+    svc.store = store
+    mocker.patch.object(UserResolver, "resolve_reverse", return_value="abhishek")
+    live = mocker.patch.object(svc.client, "get_user_activity")
+    res = svc.get_user_issues("acc-1")
+
+    live.assert_not_called()
+    assert [i["key"] for i in res["data"]["items"]] == ["SCRUM-2"]
+
+
+def test_concurrent_upserts_of_the_same_rows_count_each_row_once(store):
+    from src.core.concurrency import bounded_map
+
+    commits = [{"repo": "user1/repo1", "sha": f"c{n}", "timestamp": f"2026-10-{n % 28 + 1:02d}T10:00:00Z"}
+               for n in range(200)]
+    prs = [{"title": f"PR {n}", "url": f"http://gh/pr/{n}", "created_at": "2026-10-02T10:00:00Z",
+            "merged_at": "2026-10-03T10:00:00Z"} for n in range(50)]
+
+    def writer(i):
+        store.upsert_commits("user1", commits[i % 4::4] + commits)
+        store.upsert_prs("user1", prs)
+
+    bounded_map(writer, range(16), max_workers=8)
+
+    metrics = ("commits", "prs_opened", "prs_merged")
+    assert store.rollup_totals("user1", metrics) == {"commits": 200, "prs_opened": 50, "prs_merged": 50}
+
+
+def test_cold_store_falls_back_to_live_calls(mocker, store):
+    svc = GitHubService()
+    svc.store = store
+    live = mocker.patch.object(svc.client, "get_recent_repos", return_value=repos("2026-10-02T10:00:00Z"))
+
+    res = svc.get_recent_repos("user1")
+
+    live.assert_called_once()
+    assert "source" not in res["data"]["meta"]
+
+
+def test_rollups_track_upserts_without_double_counting(store):
+    pr = {"title": "PR 1", "url": "http://gh/pr/1", "state": "open", "created_at": "2026-10-02T10:00:00Z"}
+    store.upsert_prs("user1", [pr])
+    store.upsert_prs("user1", [pr])  # re-synced unchanged
+    store.upsert_prs("user1", [{**pr, "state": "closed", "merged_at": "2026-10-04T09:00:00Z"}])
+    store.upsert_commits("user1", [{"repo": "user1/repo1", "sha": s, "timestamp": f"2026-10-0{d}T10:00:00Z"}
+                                   for s, d in (("a", 1), ("b", 3), ("a", 1))])
+
+    metrics = ("commits", "prs_opened", "prs_merged")
+    assert store.rollup_totals("user1", metrics) == {"commits": 2, "prs_opened": 1, "prs_merged": 1}
+    assert store.rollup_totals("user1", metrics, "2026-10-03", "2026-10-03") == {
+        "commits": 1, "prs_opened": 0, "prs_merged": 0}
+
+    before = store._query("SELECT * FROM daily_rollups ORDER BY subject, metric, day")
+    store.rebuild_rollups()
+    assert [tuple(r) for r in store._query("SELECT * FROM daily_rollups ORDER BY subject, metric, day")] == \
+        [tuple(r) for r in before]
@@ -1,3 +1,8 @@
+import asyncio
+from datetime import datetime, timezone
+
+from src.services.activity_service import ActivityService
+from src.services.activity_store import ActivityStore
 from src.services.activity_summary_service import ActivitySummaryService
 
 def make_jira_resp(count):
@@ -31,3 +36,109 @@ def test_summary_counts():
     assert "Pull Requests" in s
     assert "Repositories" in s
 
+
+
+def test_summary_route_uses_fresh_rollups_without_upstream_calls(mocker, tmp_path):
+    store = ActivityStore(str(tmp_path / "activity.db"))
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    store.upsert_commits("user1", [{"repo": "user1/r", "sha": "a", "timestamp": now}])
+    store.upsert_issues("acc-1", [{"key": "S-1", "updated": now, "created": now}])
+    store.mark_synced("github", "user1")
+    store.mark_synced("jira", "acc-1")
+
+    svc = ActivityService()
+    svc.summarizer.store = store
+    mocker.patch("src.services.activity_service.UserResolver.resolve", return_value={"github": "user1", "jira": "acc-1"})
+    live = mocker.patch.object(svc.github, "count_user_activity_async")
+
+    res = asyncio.run(svc.get_summary_async("abhishek", period="today"))
+
+    live.assert_not_called()
+    assert res["data"]["meta"]["source"] == "rollups"
+    counts = res["data"]["items"]["counts"]
+    assert counts["commits"] == 1 and counts["issues_opened"] == 1 and counts["active_issues"] == 1
+    assert "1 commit" in res["data"]["items"]["summary"] and "1 issue opened" in res["data"]["items"]["summary"]
+
+
+def test_summary_falls_back_to_count_only_requests(mocker):
+    svc = ActivityService()
+    svc.summarizer.store = None
+    mocker.patch("src.services.activity_service.UserResolver.resolve", return_value={"github": "user1", "jira": "acc-1"})
+    mocker.patch.object(svc.jira.async_client, "count_user_activity", return_value={"user": "acc-1", "count": 3})
+    gh = svc.github.async_client
+    mocker.patch.object(gh, "get_recent_repos", return_value={"success": True, "data": [
+        {"name": "r1", "full_name": "user1/r1"}, {"name": "r2", "full_name": "user1/r2"}]})
+    mocker.patch.object(gh, "count_commits", side_effect=[{"success": True, "data": 4}, {"success": True, "data": 1}])
+    mocker.patch.object(gh, "count_pull_requests", return_value={"success": True, "data": 2})
+    count_repos = mocker.patch.object(gh, "count_repos",
+                                      return_value={"success": False, "error": "boom", "reason": None})
+    listing = mocker.patch.object(gh, "get_recent_commits")
+
+    res = asyncio.run(svc.get_summary_async("abhishek", period="this_week"))
+
+    listing.assert_not_called()
+    count_repos.assert_not_called()  # the profile count has no period
+    assert res["data"]["items"]["counts"] == {"active_issues": 3, "commits": 5, "prs_opened": 2}
+    assert res["data"]["meta"]["degraded"] == {}
+    summary = res["data"]["items"]["summary"]
+    assert "(this week)" in summary and "5 commits" in summary and "2 pull requests opened" in summary
+    assert "Repositories" not in summary
+
+    gh.count_commits.side_effect = None
+    gh.count_commits.return_value = {"success": True, "data": 1}
+    res = asyncio.run(svc.get_counts_async("abhishek", period="default"))
+    assert res["data"]["items"]["repos"] is None
+    assert res["data"]["meta"]["degraded"] == {"github.repos": "error"}
+
+
+def test_count_path_agrees_with_synced_rollups_for_the_same_period(mocker, tmp_path):
+    from datetime import datetime, timedelta, timezone
+    from types import SimpleNamespace
+    from src.services.sync_service import SyncService
+
+    now = datetime.now(timezone.utc)
+    this_week = datetime(now.year, now.month, now.day, tzinfo=timezone.utc) - timedelta(days=now.weekday())
+    iso = lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    last_week, this_week_ts, before = (iso(this_week - timedelta(days=4)), iso(this_week + timedelta(seconds=1)),
+                                       iso(this_week - timedelta(days=20)))
+
+    commits = {"r1": [("user1", last_week)] * 3 + [("someone", last_week)] * 2 + [("user1", this_week_ts)],
+               "r2": [("user1", last_week), ("user1", before)]}
+    prs = [last_week, last_week, this_week_ts, before]
+
+    def respond(body, headers=None):
+        return SimpleNamespace(status_code=200, headers=headers or {}, json=lambda: body)
+
+    def github(method, url, headers=None, params=None, timeout=None):
+        params = params or {}
+        if url.endswith("/users/user1/repos"):
+            return respond([{"name": r, "full_name": f"user1/{r}", "pushed_at": iso(now)} for r in commits])
+        if "/commits" in url:
+            repo = url.split("/")[-2]
+            rows = [{"sha": f"{repo}-{n}", "html_url": f"http://gh/{repo}/{n}",
+                     "commit": {"message": "m", "author": {"date": at}}}
+                    for n, (who, at) in enumerate(commits[repo])
+                    if who == params.get("author", who) and params.get("since", at) <= at <= params.get("until", at)]
+            per_page, page = params["per_page"], params["page"]
+            link = f'<http://gh/c?per_page=1&page={len(rows)}>; rel="last"'
+            return respond(rows[(page - 1) * per_page: page * per_page],
+                           {"Link": link} if per_page == 1 and len(rows) > 1 else {})
+        if url.endswith("/search/issues"):
+            created = params["q"].split("created:")[1] if "created:" in params["q"] else ".."
+            lo, _, hi = created.partition("..")
+            found = [{"title": f"PR {n}", "html_url": f"http://gh/pr/{n}", "state": "open", "created_at": at}
+                     for n, at in enumerate(prs) if (lo or at) <= at <= (hi or at)]
+            return respond({"total_count": len(found), "items": found})
+        raise AssertionError(url)
+
+    sync = SyncService(ActivityStore(str(tmp_path / "activity.db")))
+    mocker.patch.object(sync.github.client, "session").request.side_effect = github
+    sync.sync_github("user1")
+
+    since, until = sync.github.resolve_period("last_week")
+    rollups = ActivitySummaryService(sync.store).rollup_counts({"github": "user1"}, since, until)
+    counts = sync.github.count_user_activity("user1", "last_week")["data"]["items"]
+
+    assert (rollups["commits"], rollups["prs_opened"]) == (4, 2)
+    assert (counts["commits"], counts["prs"]) == (rollups["commits"], rollups["prs_opened"])
+    assert "repos" not in counts and "repos" not in rollups
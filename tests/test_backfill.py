@@ -0,0 +1,78 @@
+import pytest
+from src.services.activity_store import ActivityStore
+from src.tools.backfill import Backfill, Unit
+
+
+@pytest.fixture
+def backfill(tmp_path):
+    return Backfill(ActivityStore(str(tmp_path / "activity.db")), jira_requests_per_second=1000)
+
+
+def commits(start, count):
+    return [{"sha": f"c{n}", "html_url": f"http://gh/c/{n}",
+             "commit": {"message": f"msg {n}", "author": {"date": f"2026-10-01T10:{n % 60:02d}:00Z"}}}
+            for n in range(start, start + count)]
+
+
+def test_commit_backfill_resumes_after_the_last_checkpointed_page(mocker, backfill):
+    pages = {1: commits(0, 100), 2: commits(100, 100), 3: commits(200, 7)}
+    fetch = mocker.patch.object(backfill.github.client, "get_recent_commits", side_effect=[
+        {"success": True, "data": pages[1]},
+        {"success": False, "error": "timeout", "reason": "timeout"},
+    ])
+
+    with pytest.raises(RuntimeError):
+        backfill.run(Unit("commits", "user1", "user1/repo1"))
+    assert backfill.store.cursor("backfill.commits", "user1/repo1") == {"page": 1, "since": None, "done": False}
+    assert backfill.store.cursor("github.commits", "user1/repo1")["sha"] == "c0"
+
+    fetch.side_effect = lambda *a, page, **kw: {"success": True, "data": pages[page]}
+    assert backfill.run(Unit("commits", "user1", "user1/repo1")) == 107
+    assert [c.kwargs["page"] for c in fetch.call_args_list[2:]] == [2, 3]
+    assert backfill.store.commits("user1")[1] == 207
+
+    # A finished unit is skipped on the next run
+    assert backfill.run(Unit("commits", "user1", "user1/repo1")) == 0
+    assert fetch.call_count == 4
+
+
+def test_jira_backfill_restarts_from_latest_update_and_warms_sync(mocker, backfill):
+    def page(key, updated, token=None):
+        return {"issues": [{"key": key, "summary": key, "status": "To Do", "done": False,
+                            "updated": updated}], "next_page_token": token}
+
+    get = mocker.patch.object(backfill.jira, "get_user_updates", side_effect=[
+        page("SCRUM-1", "2026-09-01T10:00:00.000+0000", token="t1"),
+        {"error": "timeout"},
+    ])
+    with pytest.raises(RuntimeError):
+        backfill.run(Unit("jira", "acc-1"))
+
+    get.side_effect = [page("SCRUM-2", "2026-09-05T10:00:00.000+0000")]
+    assert backfill.run(Unit("jira", "acc-1")) == 1
+    assert get.call_args.args == ("acc-1", "2026-08-31 10:00")
+
+    assert backfill.store.cursor("jira.issues", "acc-1") == "2026-09-05T10:00:00Z"
+    assert backfill.store.is_fresh("jira", "acc-1")
+
+
+def test_since_window_applies_to_prs_and_issues_and_pages_report_progress(mocker, tmp_path):
+    pages = []
+    backfill = Backfill(ActivityStore(str(tmp_path / "activity.db")), since="2026-01-01T00:00:00Z",
+                        jira_requests_per_second=1000, progress=pages.append)
+    prs = [{"title": f"PR {n}", "html_url": f"http://gh/pr/{n}", "state": "open",
+            "created_at": "2026-02-01T10:00:00Z"} for n in range(3)]
+    search = mocker.patch.object(backfill.github.client, "get_pull_requests",
+                                 return_value={"success": True, "data": {"items": prs}})
+    updates = mocker.patch.object(backfill.jira, "iter_user_updates", return_value=iter([{"issues": [
+        {"key": "SCRUM-1", "summary": "s", "status": "To Do", "done": False, "updated": "2026-03-01T10:00:00.000+0000"},
+    ]}]))
+
+    assert backfill.run(Unit("prs", "user1")) == 3
+    assert backfill.run(Unit("jira", "acc-1")) == 1
+
+    assert search.call_args.kwargs["created_since"] == "2026-01-01T00:00:00Z"
+    assert updates.call_args.args == ("acc-1", "2025-12-31 00:00")
+    assert pages == [3, 1]
+    # A windowed load leaves the user's store cold for the API
+    assert not backfill.store.is_fresh("jira", "acc-1")
@@ -0,0 +1,342 @@
+import time
+
+import pytest
+from src.integrations.conditional_cache import ConditionalCache
+from src.integrations.github_client import GitHubClient
+from src.integrations.rate_limiter import RateLimitScheduler
+from src.integrations.token_pool import TokenPool
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("no body")
+        return self._body
+
+
+@pytest.fixture
+def gh_client(mocker):
+    client = GitHubClient()
+    mocker.patch.object(GitHubClient, "etag_cache", ConditionalCache(maxsize=8))
+    mocker.patch.object(GitHubClient, "token_pool", TokenPool(["tok-1111"]))
+    mocker.patch.object(client, "session")
+    return client
+
+
+def test_etag_revalidation_serves_cached_body_on_304(gh_client):
+    body = [{"sha": "abc"}]
+    gh_client.session.request.side_effect = [
+        FakeResponse(200, body, {"ETag": '"v1"'}),
+        FakeResponse(304),
+    ]
+
+    first = gh_client.get_recent_commits("user1", "repo1")
+    second = gh_client.get_recent_commits("user1", "repo1")
+
+    assert first == {"success": True, "data": body}
+    assert second == first
+
+    # Second call must carry the validator from the first response
+    sent_headers = gh_client.session.request.call_args_list[1].kwargs["headers"]
+    assert sent_headers["If-None-Match"] == '"v1"'
+    assert gh_client.etag_cache.stats()["not_modified"] == 1
+
+
+def test_etag_cache_is_keyed_by_params(gh_client):
+    gh_client.session.request.side_effect = [
+        FakeResponse(200, [{"sha": "p1"}], {"ETag": '"p1"'}),
+        FakeResponse(200, [{"sha": "p2"}], {"ETag": '"p2"'}),
+    ]
+
+    gh_client.get_recent_commits("user1", "repo1", page=1)
+    gh_client.get_recent_commits("user1", "repo1", page=2)
+
+    sent_headers = gh_client.session.request.call_args_list[1].kwargs["headers"]
+    assert "If-None-Match" not in sent_headers
+
+
+def test_rate_limited_call_honors_retry_after_and_retries(gh_client):
+    gh_client.session.request.side_effect = [
+        FakeResponse(403, {"message": "You have exceeded a secondary rate limit"}, {"Retry-After": "0"}),
+        FakeResponse(200, [{"sha": "abc"}]),
+    ]
+
+    res = gh_client.get_recent_commits("user1", "repo1")
+
+    assert res["success"] is True
+    assert gh_client.session.request.call_count == 2
+
+
+def test_exhausted_budget_fails_fast_for_interactive_calls(gh_client):
+    import time
+    from src.integrations.rate_limiter import RateLimitExceeded
+
+    reset = int(time.time()) + 600
+    limiter = gh_client.token_pool.tokens[0].scheduler
+    limiter.record("core", FakeResponse(200, [], {
+        "X-RateLimit-Resource": "core",
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(reset),
+    }))
+
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("core")
+
+    res = gh_client.get_recent_commits("user1", "repo1")
+    assert res["success"] is False
+    assert "rate limit" in res["error"]
+    gh_client.session.request.assert_not_called()
+
+    budget = limiter.snapshot()["budgets"]["core"]
+    assert budget["remaining"] == 0
+    assert budget["limit"] == 5000
+
+
+def test_search_bucket_keeps_reserve_for_interactive_calls():
+    from src.integrations.rate_limiter import (
+        PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimitExceeded, TokenBucket,
+    )
+
+    limiter = RateLimitScheduler()
+    limiter.buckets["search"] = TokenBucket(rate=0.001, capacity=6)
+    limiter.reserves["search"] = 5
+
+    limiter.acquire("search", priority=PRIORITY_BACKGROUND, max_wait=0)
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("search", priority=PRIORITY_BACKGROUND, max_wait=0)
+
+    # Interactive calls may still spend the reserved tokens
+    limiter.acquire("search", priority=PRIORITY_INTERACTIVE, max_wait=0)
+
+
+def rate_headers(remaining, resource="core"):
+    import time
+    return {
+        "X-RateLimit-Resource": resource,
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time()) + 600),
+    }
+
+
+def test_token_pool_routes_to_token_with_most_budget(gh_client, mocker):
+    pool = TokenPool(["tok-aaaa", "tok-bbbb"])
+    mocker.patch.object(GitHubClient, "token_pool", pool)
+
+    pool.record(pool.tokens[0], "core", FakeResponse(200, [], rate_headers(10)))
+    pool.record(pool.tokens[1], "core", FakeResponse(200, [], rate_headers(4000)))
+    gh_client.session.request.return_value = FakeResponse(200, [], rate_headers(3999))
+
+    gh_client.get_recent_commits("user1", "repo1")
+
+    sent = gh_client.session.request.call_args.kwargs["headers"]
+    assert sent["Authorization"] == "token tok-bbbb"
+
+
+def test_token_pool_quarantines_revoked_token_and_retries(gh_client, mocker):
+    pool = TokenPool(["tok-aaaa", "tok-bbbb"])
+    mocker.patch.object(GitHubClient, "token_pool", pool)
+
+    gh_client.session.request.side_effect = [
+        FakeResponse(401, {"message": "Bad credentials"}),
+        FakeResponse(200, [{"sha": "abc"}]),
+    ]
+
+    res = gh_client.get_recent_commits("user1", "repo1")
+
+    assert res["success"] is True
+    first, second = [c.kwargs["headers"]["Authorization"] for c in gh_client.session.request.call_args_list]
+    assert first != second
+
+    revoked = [t for t in pool.snapshot()["tokens"] if t["revoked"]]
+    assert len(revoked) == 1
+    assert revoked[0]["quarantined_for"] > 0
+    assert revoked[0]["token"].startswith("…")
+
+
+def test_concurrent_identical_calls_share_one_request(gh_client):
+    import threading
+    from src.core.concurrency import bounded_map
+
+    release = threading.Event()
+
+    def slow_response(*args, **kwargs):
+        release.wait(2)
+        return FakeResponse(200, [{"sha": "abc"}])
+
+    gh_client.session.request.side_effect = slow_response
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+
+    results = bounded_map(lambda _: gh_client.get_recent_commits("user1", "repo1"), range(5), max_workers=5)
+
+    assert gh_client.session.request.call_count == 1
+    assert all(r == results[0] and r["success"] for r in results)
+
+
+def test_callers_do_not_wait_on_background_or_overdue_flights(gh_client):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.concurrency import Deadline, deadline_scope
+    from src.integrations.rate_limiter import background_priority
+
+    release, started = threading.Event(), threading.Semaphore(0)
+
+    def response(*args, **kwargs):
+        started.release()
+        if threading.current_thread() is not main:
+            release.wait(5)  # leaders running on the pool are stuck
+        return FakeResponse(200, [{"sha": "abc"}])
+
+    main = threading.current_thread()
+    gh_client.session.request.side_effect = response
+
+    def background():
+        with background_priority():
+            return gh_client.get_recent_commits("user1", "repo1")
+
+    with ThreadPoolExecutor(2) as pool:
+        stuck = pool.submit(background)
+        started.acquire()
+        # Interactive callers never join a background flight
+        assert gh_client.get_recent_commits("user1", "repo1")["success"]
+        started.acquire()
+
+        leader = pool.submit(gh_client.get_recent_commits, "user1", "repo1")
+        started.acquire()
+        # A follower stops waiting for a slow leader at its own deadline
+        with deadline_scope(Deadline(0.2)):
+            res = gh_client.get_recent_commits("user1", "repo1")
+        assert res["success"] is False and res["reason"] == "timeout"
+
+        assert gh_client.session.request.call_count == 3
+        release.set()
+        assert stuck.result()["success"] and leader.result()["success"]
+
+
+def test_request_deadline_caps_timeout_and_reports_expiry(mocker, gh_client):
+    from src.core.concurrency import Deadline, deadline_scope
+
+    mocker.patch("src.integrations.http_session.settings.github_timeout_seconds", 10.0)
+    gh_client.session.request.return_value = FakeResponse(200, [])
+
+    with deadline_scope(Deadline(2.0)):
+        gh_client.get_recent_commits("user1", "repo1")
+    connect, read = gh_client.session.request.call_args.kwargs["timeout"]
+    assert read <= 2.0 and connect <= read
+
+    # A spent deadline fails fast as a timeout, without calling GitHub
+    with deadline_scope(Deadline(0)):
+        res = gh_client.get_pull_requests("user1", "repo1")
+    assert res["success"] is False and res["reason"] == "timeout"
+    assert gh_client.session.request.call_count == 1
+
+
+def test_slow_get_is_hedged(mocker, gh_client):
+    import threading
+
+    mocker.patch("src.integrations.http_session.settings.http_hedge_delay_seconds", 0.05)
+    release = threading.Event()
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(2)  # the first attempt hangs
+            return FakeResponse(500, {})
+        return FakeResponse(200, [{"sha": "abc"}])
+
+    gh_client.session.request.side_effect = request
+    entry = gh_client.token_pool.tokens[0]
+    acquire = mocker.spy(entry.scheduler, "acquire")
+    record = mocker.spy(gh_client.token_pool, "record")
+    res = gh_client.get_recent_commits("user1", "repo1")
+    release.set()
+
+    assert res == {"success": True, "data": [{"sha": "abc"}]}
+    assert len(calls) == 2
+
+    # The duplicate takes its own rate-limit slot, and both responses are accounted for
+    assert acquire.call_count == 2
+    for _ in range(100):
+        if record.call_count == 2:
+            break
+        time.sleep(0.01)
+    assert sorted(c.args[2].status_code for c in record.call_args_list) == [200, 500]
+
+
+def test_hedging_never_queues_behind_a_busy_pool(mocker, gh_client):
+    import threading
+    from src.integrations import http_session
+
+    mocker.patch("src.integrations.http_session.settings.http_hedge_delay_seconds", 0.05)
+    mocker.patch.object(http_session, "_hedge_slots", threading.BoundedSemaphore(1))
+    threads, nested = [], []
+
+    def request(*args, **kwargs):
+        threads.append(threading.current_thread())
+        if len(threads) == 1:
+            # This call holds the only worker: the nested one runs unhedged on the calling thread
+            nested.append(gh_client.get_recent_commits("user1", "repo2"))
+        return FakeResponse(200, [{"sha": "abc"}])
+
+    gh_client.session.request.side_effect = request
+    assert gh_client.get_recent_commits("user1", "repo1")["success"]
+
+    assert nested[0]["success"]
+    assert threads[0].name.startswith("http-hedge") and threads[1] is threads[0]
+    assert gh_client.session.request.call_count == 2
+
+
+def test_count_only_requests_read_link_last_and_total_count(gh_client):
+    last = '<https://api.github.com/repositories/1/commits?per_page=1&since=2026-10-01T00%3A00%3A00Z&page=42>; rel="last"'
+    gh_client.session.request.side_effect = [
+        FakeResponse(200, [{"sha": "a"}], {"Link": last}),
+        FakeResponse(200, [], {}),
+        FakeResponse(409, {"message": "Git Repository is empty."}),
+        FakeResponse(200, {"total_count": 7, "items": [{}]}),
+    ]
+
+    assert gh_client.count_commits("user1", "repo1", since="2026-10-01T00:00:00Z") == {"success": True, "data": 42}
+    assert gh_client.count_commits("user1", "repo2") == {"success": True, "data": 0}
+    assert gh_client.count_commits("user1", "empty") == {"success": True, "data": 0}
+    assert gh_client.count_pull_requests("user1", "repo1", since="2026-10-01T00:00:00Z") == {"success": True, "data": 7}
+
+    first, *_, search = gh_client.session.request.call_args_list
+    assert first.kwargs["params"]["per_page"] == 1 and first.kwargs["params"]["since"] == "2026-10-01T00:00:00Z"
+    assert search.kwargs["params"]["per_page"] == 1
+    assert search.kwargs["params"]["q"].endswith("created:>=2026-10-01T00:00:00Z")
+
+
+def test_etag_cache_hands_out_copies_and_retries_an_orphaned_304(gh_client, mocker):
+    gh_client.session.request.side_effect = [
+        FakeResponse(200, [{"sha": "abc"}], {"ETag": '"v1"'}),
+        FakeResponse(304),
+    ]
+    first = gh_client.get_recent_commits("user1", "repo1")
+    first["data"][0]["sha"] = "mutated"
+    assert gh_client.get_recent_commits("user1", "repo1")["data"] == [{"sha": "abc"}]
+
+    # Entry evicted after the validators went out: the 304 is followed by a plain GET
+    gh_client.session.request.side_effect = [FakeResponse(304), FakeResponse(200, [{"sha": "new"}])]
+    mocker.patch.object(gh_client.etag_cache._entries, "get", return_value=None)
+    assert gh_client.get_recent_commits("user1", "repo1") == {"success": True, "data": [{"sha": "new"}]}
+    assert "If-None-Match" not in gh_client.session.request.call_args.kwargs["headers"]
+
+
+def test_etag_validators_are_scoped_to_the_token(gh_client, mocker):
+    gh_client.session.request.side_effect = [
+        FakeResponse(200, [{"sha": "abc"}], {"ETag": '"v1"'}),
+        FakeResponse(200, [{"sha": "abc"}], {"ETag": '"v1"'}),
+    ]
+    gh_client.get_recent_commits("user1", "repo1")
+
+    mocker.patch.object(GitHubClient, "token_pool", TokenPool(["tok-2222"]))
+    gh_client.get_recent_commits("user1", "repo1")
+    assert "If-None-Match" not in gh_client.session.request.call_args.kwargs["headers"]
@@ -0,0 +1,174 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+from src.core.config import settings
+from src.services.github_service import GitHubService
+
+USER = "user1"
+REPO = "repo1"
+
+# Upstream data, REST-shaped (with the bulk GitHub sends but we never use)
+COMMITS = [
+    {"sha": f"sha{i}", "html_url": f"http://gh/c/{i}",
+     "commit": {"message": f"msg {i}", "author": {"date": f"2026-10-0{i}T10:00:00Z"}},
+     "author": {"login": USER, "avatar_url": "x" * 200}, "parents": [{"sha": "p" * 40}] * 2}
+    for i in range(5, 0, -1)
+]
+# Someone else's commit in the same repo (forks, shared repos) is never the user's activity
+COMMITS.insert(2, {"sha": "other", "html_url": "http://gh/c/other",
+                   "commit": {"message": "not mine", "author": {"date": "2026-10-03T12:00:00Z"}},
+                   "author": {"login": "someone-else"}})
+PRS = [
+    {"title": f"PR {i}", "html_url": f"http://gh/pr/{i}", "body": "y" * 500, "labels": [], "user": {"login": USER}}
+    for i in range(2)
+]
+REPOS = [
+    {"name": "repo1", "full_name": f"{USER}/repo1", "html_url": "http://gh/r/1", "description": "d",
+     "pushed_at": "2026-10-05T10:00:00Z", "stargazers_count": 3, "forks_count": 1, "owner": {"bio": "z" * 500}},
+]
+
+
+def graphql_payload():
+    return {"data": {
+        "user": {
+            "repositories": {"nodes": [
+                {"name": r["name"], "nameWithOwner": r["full_name"], "url": r["html_url"],
+                 "description": r["description"], "pushedAt": r["pushed_at"],
+                 "stargazerCount": r["stargazers_count"], "forkCount": r["forks_count"]}
+                for r in REPOS
+            ]},
+            "active": {"nodes": [
+                {"nameWithOwner": r["full_name"], "defaultBranchRef": {"target": {"history": {
+                    # GraphQL reports the author's local offset; REST normalizes to UTC
+                    "nodes": [
+                        {"oid": c["sha"], "message": c["commit"]["message"], "url": c["html_url"],
+                         "author": {"date": c["commit"]["author"]["date"].replace("T10:00:00Z", "T15:30:00+05:30"),
+                                    "user": {"login": c["author"]["login"]}}}
+                        for c in COMMITS
+                    ],
+                }}}}
+                for r in REPOS
+            ]},
+        },
+        "search": {"issueCount": len(PRS), "nodes": [{"title": p["title"], "url": p["html_url"]} for p in PRS]},
+    }}
+
+
+class StubGitHub(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def _send(self, body):
+        raw = json.dumps(body).encode()
+        self.requests_seen.append((self.command, self.path, len(raw)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+
+        if url.path == f"/repos/{USER}/{REPO}/commits":
+            author = parse_qs(url.query).get("author", [None])[0]
+            self._send([c for c in COMMITS if c["author"]["login"] == author] if page == 1 else [])
+        elif url.path == "/search/issues":
+            self._send({"total_count": len(PRS), "items": PRS})
+        elif url.path == f"/users/{USER}/repos":
+            self._send(REPOS)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._send(graphql_payload())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_github():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StubGitHub.requests_seen = []
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture
+def gh_service(stub_github):
+    svc = GitHubService()
+    svc.repo_name = REPO
+    svc.client.BASE_URL = stub_github
+    return svc
+
+
+def test_graphql_matches_rest_in_one_smaller_round_trip(mocker, gh_service):
+    mocker.patch.object(settings, "github_use_graphql", False)
+    rest = gh_service.get_user_github_activity(USER, limit=3, offset=1)
+    rest_requests = list(StubGitHub.requests_seen)
+
+    StubGitHub.requests_seen = []
+    mocker.patch.object(settings, "github_use_graphql", True)
+    gql = gh_service.get_user_github_activity(USER, limit=3, offset=1)
+    gql_requests = list(StubGitHub.requests_seen)
+
+    # Cursors name distinct server-side snapshots; everything else must match
+    for res in (gql, rest):
+        for section in res["data"]["items"].values():
+            section["data"]["meta"].pop("next_cursor", None)
+    assert gql == rest
+
+    # REST: repo listing (shared by the concurrent commits and repos sections
+    # when their calls coalesce), commits, PR search
+    assert len(rest_requests) in (3, 4)
+    assert [r[0] for r in gql_requests] == ["POST"]
+    assert sum(r[2] for r in gql_requests) < sum(r[2] for r in rest_requests)
+
+
+def test_graphql_failure_falls_back_to_rest(mocker, gh_service):
+    mocker.patch.object(settings, "github_use_graphql", True)
+    mocker.patch.object(gh_service.client, "get_activity_graphql",
+                        return_value={"success": False, "error": "Something went wrong"})
+
+    res = gh_service.get_user_github_activity(USER, limit=3, offset=0)
+
+    assert res["data"]["items"]["commits"]["data"]["meta"]["returned"] == 3
+    assert len(StubGitHub.requests_seen) in (3, 4)
+
+
+def test_graphql_page_crowded_by_other_authors_falls_back_to_rest(mocker, gh_service):
+    mocker.patch.object(settings, "github_use_graphql", False)
+    rest = gh_service.get_user_github_activity(USER, limit=3, offset=0)
+
+    # The history page dropped someone else's commit and has more behind it
+    payload = graphql_payload()
+    for repo in payload["data"]["user"]["active"]["nodes"]:
+        repo["defaultBranchRef"]["target"]["history"]["pageInfo"] = {"hasNextPage": True}
+    mocker.patch.object(StubGitHub, "do_POST", lambda self: (
+        self.rfile.read(int(self.headers["Content-Length"])), self._send(payload)))
+    StubGitHub.requests_seen = []
+    mocker.patch.object(settings, "github_use_graphql", True)
+
+    res = gh_service.get_user_github_activity(USER, limit=3, offset=0)
+
+    assert [r[0] for r in StubGitHub.requests_seen][0] == "POST"
+    assert any(f"/repos/{USER}/{REPO}/commits" in r[1] for r in StubGitHub.requests_seen)
+    assert (res["data"]["items"]["commits"]["data"]["meta"]["total"]
+            == rest["data"]["items"]["commits"]["data"]["meta"]["total"])
+
+
+def test_rest_commit_listing_asks_for_the_users_commits_only(mocker, gh_service):
+    mocker.patch.object(settings, "github_use_graphql", False)
+
+    res = gh_service.get_user_commits(USER, limit=10)
+
+    assert "other" not in [c["sha"] for c in res["data"]["items"]]
+    assert res["data"]["meta"]["total"] == 5
+    commit_requests = [r[1] for r in StubGitHub.requests_seen if "/commits" in r[1]]
+    assert commit_requests and all(f"author={USER}" in path for path in commit_requests)
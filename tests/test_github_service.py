@@ -8,6 +8,16 @@ def gh_service():
     return GitHubService()
 
 
+@pytest.fixture
+def one_repo(mocker, gh_service):
+    """The user has a single recently-pushed repo."""
+    now = datetime.utcnow().replace(tzinfo=timezone.utc)
+    return mocker.patch.object(
+        gh_service.client, "get_recent_repos",
+        return_value={"success": True, "data": [{"full_name": "user1/repo1", "last_pushed": now.isoformat()}]},
+    )
+
+
 def fake_commit(timestamp):
     return {
         "sha": "abc123",
@@ -18,7 +28,7 @@ def fake_commit(timestamp):
         }
     }
 
-def test_get_commits_basic(mocker, gh_service):
+def test_get_commits_basic(mocker, gh_service, one_repo):
     now = datetime.utcnow().replace(tzinfo=timezone.utc)
     commits = [fake_commit(now.isoformat()) for _ in range(8)]
 
@@ -45,7 +55,7 @@ def test_get_commits_basic(mocker, gh_service):
     assert meta["total"] == 8
 
 
-def test_get_commits_date_filter(mocker, gh_service):
+def test_get_commits_date_filter(mocker, gh_service, one_repo):
     now = datetime.utcnow().replace(tzinfo=timezone.utc)
     old = now.replace(year=2000).isoformat()
     recent = now.isoformat()
@@ -96,3 +106,158 @@ def test_get_prs_and_repos(mocker, gh_service):
 
     assert prs["data"]["items"][0]["title"] == "PR1"
     assert repos["data"]["items"][0]["name"] == "repo1"
+
+
+def test_pr_listing_is_bounded_by_the_window_on_both_sides(mocker, gh_service):
+    search = mocker.patch.object(gh_service.client.session, "request",
+                                 return_value=mocker.Mock(status_code=200, headers={},
+                                                          json=lambda: {"total_count": 0, "items": []}))
+
+    gh_service.get_user_prs("user1", period="last_week")
+
+    since, until = gh_service.resolve_period("last_week")
+    q = search.call_args.kwargs["params"]["q"]
+    assert q.endswith(f"created:{since:%Y-%m-%dT%H:%M:%SZ}..{until:%Y-%m-%dT%H:%M:%SZ}")
+
+
+def test_github_activity_fetches_concurrently(mocker, gh_service):
+    import time
+
+    def slow(section):
+        def _fn(*args, **kwargs):
+            time.sleep(0.3)
+            return {"success": True, "section": section}
+        return _fn
+
+    mocker.patch.object(gh_service, "get_user_commits", side_effect=slow("commits"))
+    mocker.patch.object(gh_service, "get_user_prs", side_effect=slow("prs"))
+    mocker.patch.object(gh_service, "get_recent_repos", side_effect=slow("repos"))
+
+    started = time.monotonic()
+    res = gh_service.get_user_github_activity("user1", limit=5, offset=0)
+    elapsed = time.monotonic() - started
+
+    items = res["data"]["items"]
+    assert items["commits"]["section"] == "commits"
+    assert items["prs"]["section"] == "prs"
+    assert items["recent_repos"]["section"] == "repos"
+    assert elapsed < 0.8  # max of the calls, not the sum
+
+
+def test_github_activity_deadline_marks_timeout(mocker, gh_service):
+    import time
+    from src.core.concurrency import Deadline
+
+    mocker.patch.object(gh_service, "get_user_commits", side_effect=lambda *a, **k: time.sleep(1))
+    mocker.patch.object(gh_service, "get_user_prs", return_value={"success": True})
+    mocker.patch.object(gh_service, "get_recent_repos", return_value={"success": True})
+
+    res = gh_service.get_user_github_activity("user1", deadline=Deadline(0.1))
+
+    commits = res["data"]["items"]["commits"]
+    assert commits["success"] is False
+    assert commits["error"] == "timeout"
+    assert res["data"]["items"]["prs"]["success"] is True
+
+
+def test_get_commits_async_matches_sync(mocker, gh_service, one_repo):
+    import asyncio
+
+    now = datetime.utcnow().replace(tzinfo=timezone.utc)
+    commits = [fake_commit(now.isoformat()) for _ in range(3)]
+    raw = {"success": True, "data": commits}
+
+    mocker.patch.object(gh_service.client, "get_recent_commits", return_value=raw)
+    mocker.patch.object(gh_service.async_client, "get_recent_commits",
+                        new_callable=mocker.AsyncMock, return_value=raw)
+    mocker.patch.object(gh_service.async_client, "get_recent_repos",
+                        new_callable=mocker.AsyncMock, return_value=one_repo.return_value)
+
+    sync_res = gh_service.get_user_commits("user1", limit=2, offset=0)
+    async_res = asyncio.run(gh_service.get_user_commits_async("user1", limit=2, offset=0))
+
+    # Cursors name distinct server-side snapshots; everything else must match
+    async_res["data"]["meta"].pop("next_cursor")
+    sync_res["data"]["meta"].pop("next_cursor")
+    assert async_res == sync_res
+
+
+def test_get_commits_pages_lazily_with_window(mocker, gh_service, one_repo):
+    now = datetime.utcnow().replace(tzinfo=timezone.utc)
+    full_page = [fake_commit(now.isoformat()) for _ in range(100)]
+
+    client = mocker.patch.object(gh_service.client, "get_recent_commits",
+                                 return_value={"success": True, "data": full_page})
+
+    res = gh_service.get_user_commits("user1", limit=5, offset=150, period="this_month")
+
+    # offset+limit = 155 → exactly two pages, window pushed to the API
+    assert client.call_count == 2
+    kwargs = client.call_args_list[1].kwargs
+    assert kwargs["page"] == 2
+    assert kwargs["since"] is not None and kwargs["until"] is not None
+
+    meta = res["data"]["meta"]
+    assert meta["returned"] == 5
+    assert meta["has_more"] is True
+
+
+def test_get_commits_merges_active_repos_and_skips_idle(mocker, gh_service):
+    mocker.patch.object(gh_service.client, "get_recent_repos", return_value={"success": True, "data": [
+        {"full_name": "user1/a", "last_pushed": "2026-10-05T00:00:00+00:00"},
+        {"full_name": "user1/b", "last_pushed": "2026-10-04T00:00:00+00:00"},
+        {"full_name": "user1/idle", "last_pushed": "2026-09-01T00:00:00+00:00"},
+    ]})
+    pages = {
+        "a": [fake_commit("2026-10-05T00:00:00+00:00"), fake_commit("2026-10-02T00:00:00+00:00")],
+        "b": [fake_commit("2026-10-04T00:00:00+00:00"), fake_commit("2026-10-03T00:00:00+00:00")],
+    }
+    get = mocker.patch.object(gh_service.client, "get_recent_commits",
+                              side_effect=lambda owner, repo, **kw: {"success": True, "data": pages[repo]})
+
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    res = gh_service.get_user_commits("user1", limit=3, offset=0, since=since)
+
+    items = res["data"]["items"]
+    assert [c["repo"] for c in items] == ["user1/a", "user1/b", "user1/b"]
+    assert sorted(c.args[1] for c in get.call_args_list) == ["a", "b"]
+    assert res["data"]["meta"]["repos_scanned"] == 2
+
+
+def test_prs_cursor_pages_from_snapshot(mocker, gh_service):
+    prs = [{"title": f"PR {i}", "html_url": f"http://gh/pr/{i}"} for i in range(5)]
+    get = mocker.patch.object(gh_service.client, "get_pull_requests",
+                              return_value={"success": True, "data": {"items": prs}})
+
+    first = gh_service.get_user_prs("user1", limit=2)
+    cursor = first["data"]["meta"]["next_cursor"]
+    second = gh_service.get_user_prs("user1", limit=2, cursor=cursor)
+    last = gh_service.get_user_prs("user1", limit=2, cursor=second["data"]["meta"]["next_cursor"])
+
+    # Later pages come from the snapshot, not from GitHub
+    get.assert_called_once()
+    assert [p["title"] for p in second["data"]["items"]] == ["PR 2", "PR 3"]
+    assert [p["title"] for p in last["data"]["items"]] == ["PR 4"]
+    assert last["data"]["meta"]["next_cursor"] is None
+
+
+def test_internal_fetches_open_no_snapshots_and_store_is_bounded_by_items(mocker, gh_service):
+    from src.services.pagination import CursorStore, Snapshot, without_cursors
+
+    store = mocker.patch("src.services.pagination.cursor_store", CursorStore(max_items=10, ttl=60))
+    prs = [{"title": f"PR {i}", "html_url": f"http://gh/pr/{i}"} for i in range(5)]
+    mocker.patch.object(gh_service.client, "get_pull_requests", return_value={"success": True, "data": {"items": prs}})
+
+    with without_cursors():
+        res = gh_service.get_user_prs("user1", limit=2)
+    assert res["data"]["meta"]["total"] == 5
+    assert res["data"]["meta"]["next_cursor"] is None
+    assert store.stats()["size"] == 0
+
+    # Snapshots holding too many items in total push out the least recently used
+    first = store.open(Snapshot("a", range(6)))
+    second = store.open(Snapshot("b", range(3)))
+    assert store.get(first) is not None
+    store.open(Snapshot("c", range(4)))
+    assert store.get(second) is None and store.get(first) is not None
+    assert store.stats()["items"] == 10 and store.stats()["evictions"] == 1
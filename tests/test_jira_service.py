@@ -1,9 +1,12 @@
 # tests/test_jira_service.py
 import pytest
+from src.core.config import settings
 from src.services.jira_service import JiraService
 
 @pytest.fixture
 def jira_service():
+    JiraService.details_cache.clear()
+    JiraService.version_hints.clear()
     return JiraService()
 
 
@@ -59,6 +62,95 @@ def test_get_user_issues_empty(mocker, jira_service):
     assert "message" in res
     assert "No active issues" in res["message"]
 
+def test_get_user_issues_pages_lazily_and_counts(mocker, jira_service):
+    pages = {
+        None: {"issues": [make_issue(f"SCRUM-{i}") for i in range(3)], "next_page_token": "t2"},
+        "t2": {"issues": [make_issue(f"SCRUM-{i}") for i in range(3, 6)], "next_page_token": "t3"},
+    }
+    get = mocker.patch.object(jira_service.client, "get_user_activity",
+                              side_effect=lambda account_id, max_results, next_page_token: pages[next_page_token])
+    count = mocker.patch.object(jira_service.client, "count_user_activity", return_value={"count": 250})
+    mocker.patch("src.services.jira_service.settings.jira_page_size", 3)
+
+    res = jira_service.get_user_issues("5b4deb", limit=2, offset=3)
+
+    # Page t3 is never requested; the count fills in the total
+    assert get.call_count == 2
+    count.assert_called_once_with("5b4deb")
+    assert [i["key"] for i in res["data"]["items"]] == ["SCRUM-3", "SCRUM-4"]
+    assert res["data"]["meta"]["total"] == 250
+    assert res["data"]["meta"]["has_more"] is True
+
+
+def test_get_team_issues_partitions_one_batched_query(mocker, jira_service):
+    def issue(key, account_id):
+        return {"key": key, "fields": {"summary": "task", "status": {"name": "To Do"},
+                                       "updated": "2025-11-12", "assignee": {"accountId": account_id}}}
+
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {
+        "issues": [issue("SCRUM-1", "a1"), issue("SCRUM-2", "a2"), issue("SCRUM-3", "a1")],
+        "isLast": True,
+    }
+    post = mocker.patch.object(jira_service.client.session, "post", return_value=response)
+
+    res = jira_service.get_team_issues(["a1", "a2", "a3"], limit=10, offset=0)
+
+    post.assert_called_once()
+    assert 'assignee in ("a1", "a2", "a3")' in post.call_args.kwargs["json"]["jql"]
+    items = res["data"]["items"]
+    assert [i["key"] for i in items["a1"]["data"]["items"]] == ["SCRUM-1", "SCRUM-3"]
+    assert items["a2"]["data"]["meta"]["total"] == 1
+    assert items["a2"]["data"]["meta"]["total_is_lower_bound"] is False
+    assert items["a3"]["data"]["meta"]["total"] == 0
+
+
+def test_get_team_issues_stops_paging_once_every_window_is_filled(mocker, jira_service):
+    def page(keys, token):
+        return {"account_ids": ["a1", "a2"], "next_page_token": token,
+                "issues_by_user": {a: [{"key": f"{a}-{k}"} for k in keys] for a in ("a1", "a2")}}
+
+    pages = iter([page([1, 2], "t1"), page([3, 4], "t2"), page([5, 6], "t3")])
+    team = mocker.patch.object(jira_service.client, "get_team_activity", side_effect=lambda *a, **kw: next(pages))
+
+    res = jira_service.get_team_issues(["a1", "a2"], limit=2, offset=1)
+
+    assert team.call_count == 2  # the third page is never requested
+    a1 = res["data"]["items"]["a1"]["data"]
+    assert [i["key"] for i in a1["items"]] == ["a1-2", "a1-3"]
+    assert a1["meta"]["has_more"] is True
+    # The shared query had more pages, so a1's total is only what was seen
+    assert a1["meta"]["total"] == 4 and a1["meta"]["total_is_lower_bound"] is True
+    assert "at least 4" in res["data"]["items"]["a1"]["message"]
+
+
+def test_bulk_details_fields_only_and_lazy_changelog(mocker, jira_service):
+    bulk = mocker.Mock(status_code=200)
+    bulk.json.return_value = {
+        "issues": [{"key": "SCRUM-1", "fields": {"summary": "one", "status": {"name": "Done"}}}],
+        "issueErrors": [{"issueIdsOrKeys": ["SCRUM-9"], "errorMessages": ["Issue does not exist"]}],
+    }
+    post = mocker.patch.object(jira_service.client.session, "post", return_value=bulk)
+
+    history = {"created": "2025-11-12", "items": [{"field": "status", "fromString": "To Do", "toString": "Done"}]}
+    page = mocker.Mock(status_code=200)
+    page.json.return_value = {"startAt": 0, "total": 5000, "isLast": False, "values": [history] * 2}
+    get = mocker.patch.object(jira_service.client.session, "get", return_value=page)
+
+    plain = jira_service.get_issues_details(["SCRUM-1", "SCRUM-9"])
+    assert post.call_args.kwargs["json"]["issueIdsOrKeys"] == ["SCRUM-1", "SCRUM-9"]
+    assert get.call_count == 0
+    assert plain["data"]["meta"]["failed"] == ["SCRUM-9"]
+    assert plain["data"]["items"][0]["data"]["items"]["status"] == "Done"
+
+    res = jira_service.get_issues_details(["SCRUM-1"], changelog=True, changelog_limit=2)
+
+    # Two entries fit in the first changelog page; the other 4998 are never fetched
+    assert get.call_count == 1
+    assert get.call_args.args[0].endswith("/issue/SCRUM-1/changelog")
+    assert len(res["data"]["items"][0]["data"]["items"]["changelog"]) == 2
+
+
 def test_issue_details_parsing(mocker, jira_service):
     raw = {
         "key": "SCRUM-2",
@@ -112,3 +204,65 @@ def test_issue_details_parsing(mocker, jira_service):
     assert change["from"] == "To Do"
     assert change["to"] == "In Progress"
 
+
+
+def test_issue_details_cache_revalidates_by_updated(mocker, jira_service):
+    raw = {"key": "SCRUM-7", "fields": {"summary": "hot", "updated": "v1"}}
+    details = mocker.patch.object(jira_service.client, "get_issue_details", side_effect=lambda k: dict(raw))
+    version = mocker.patch.object(jira_service.client, "get_issue_version",
+                                  return_value={"key": "SCRUM-7", "fields": {"updated": "v1"}})
+
+    first = jira_service.get_issue_details("SCRUM-7")
+    assert jira_service.get_issue_details("SCRUM-7") is first
+    assert details.call_count == 1
+    assert version.call_count == 1
+
+    # A search result that already carries `updated` makes the probe unnecessary
+    jira_service._remember_versions([{"key": "SCRUM-7", "updated": "v1"}])
+    jira_service.get_issue_details("SCRUM-7")
+    assert version.call_count == 1
+
+    # Issue changed upstream: refetched and re-cached under the new version
+    jira_service.version_hints.clear()
+    version.return_value = {"key": "SCRUM-7", "fields": {"updated": "v2"}}
+    raw["fields"] = {"summary": "edited", "updated": "v2"}
+    assert jira_service.get_issue_details("SCRUM-7")["data"]["items"]["summary"] == "edited"
+    assert details.call_count == 2
+
+
+def test_store_seeded_version_hints_age_from_the_last_sync(mocker, jira_service):
+    jira_service.store = mocker.Mock()
+    jira_service.store.issues.return_value = ([{"key": "SCRUM-7", "updated": "v1"}], 1, 0)
+    jira_service.store.sync_age.return_value = settings.jira_version_hint_ttl + 1
+
+    jira_service._stored_user_issues("5b4deb", limit=10, offset=0)
+    assert jira_service._hinted_version("SCRUM-7") is None  # too old to skip the version probe
+
+    # A live search result is fresh, and an older store row never overrides it
+    jira_service._remember_versions([{"key": "SCRUM-7", "updated": "v2"}])
+    jira_service.store.sync_age.return_value = 1.0
+    jira_service._stored_user_issues("5b4deb", limit=10, offset=0)
+    assert jira_service._hinted_version("SCRUM-7") == "v2"
+
+
+def test_get_user_issues_cursor_continues_search(mocker, jira_service):
+    pages = {
+        None: {"issues": [make_issue(f"SCRUM-{i}") for i in range(3)], "next_page_token": "t2"},
+        "t2": {"issues": [make_issue(f"SCRUM-{i}") for i in range(3, 5)], "next_page_token": None},
+    }
+    get = mocker.patch.object(jira_service.client, "get_user_activity",
+                              side_effect=lambda account_id, max_results, next_page_token: pages[next_page_token])
+    mocker.patch.object(jira_service.client, "count_user_activity", return_value={"count": 5})
+    mocker.patch("src.services.jira_service.settings.jira_page_size", 3)
+
+    first = jira_service.get_user_issues("5b4deb", limit=2)
+    assert get.call_count == 1
+
+    second = jira_service.get_user_issues("5b4deb", limit=2, cursor=first["data"]["meta"]["next_cursor"])
+    third = jira_service.get_user_issues("5b4deb", limit=2, cursor=second["data"]["meta"]["next_cursor"])
+
+    # The search resumes at page t2 instead of starting over
+    assert get.call_count == 2
+    assert [i["key"] for i in second["data"]["items"]] == ["SCRUM-2", "SCRUM-3"]
+    assert [i["key"] for i in third["data"]["items"]] == ["SCRUM-4"]
+    assert third["data"]["meta"]["next_cursor"] is None
@@ -12,7 +12,7 @@ def test_health():
 def test_github_commits_route_monkeypatched(mocker):
     # Patch GitHubService methods to avoid external calls
     from src.services.github_service import GitHubService
-    mocker.patch.object(GitHubService, "get_user_commits", return_value={"success": True, "message":"ok","data":{"items":[]}, "meta": {"total":0}})
+    mocker.patch.object(GitHubService, "get_user_commits_async", new_callable=mocker.AsyncMock, return_value={"success": True, "message":"ok","data":{"items":[]}, "meta": {"total":0}})
     r = client.get("/github/someuser/commits")
     assert r.status_code == 200
     body = r.json()
@@ -21,7 +21,107 @@ def test_github_commits_route_monkeypatched(mocker):
 
 def test_jira_issues_route_monkeypatched(mocker):
     from src.services.jira_service import JiraService
-    mocker.patch.object(JiraService, "get_user_issues", return_value={"success": True, "message":"ok", "data": {"items":[]}, "meta": {"total":0}})
+    mocker.patch.object(JiraService, "get_user_issues_async", new_callable=mocker.AsyncMock, return_value={"success": True, "message":"ok", "data": {"items":[]}, "meta": {"total":0}})
     r = client.get("/api/v1/jira/users/abhishek/issues?limit=5&offset=0")
     # route may be prefixed differently in your code; adjust if needed
     assert r.status_code in (200, 404)  # if route path differs, allow 404 to be handled by you
+
+def test_jira_batch_route_resolves_users(mocker):
+    from src.services.jira_service import JiraService
+    batch = mocker.patch.object(JiraService, "get_team_issues_async", new_callable=mocker.AsyncMock,
+                                return_value={"success": True, "message": "ok", "data": {"items": {}, "meta": {}}})
+
+    r = client.post("/api/v1/jira/issues:batch?limit=5", json={"users": ["abhishek", "abhialien"]})
+
+    assert r.status_code == 200
+    assert batch.await_args.kwargs == {"limit": 5, "offset": 0}
+    assert len(batch.await_args.args[0]) == 2
+
+def test_jira_details_route_bounds_changelog_limit(mocker):
+    from src.services.jira_service import JiraService
+    details = mocker.patch.object(JiraService, "get_issues_details_async", new_callable=mocker.AsyncMock,
+                                  return_value={"success": True, "message": "ok", "data": {"items": []}})
+
+    r = client.post("/api/v1/jira/issues:details", json={"keys": ["SCRUM-1"], "changelog": True,
+                                                         "changelog_limit": 10 ** 9})
+    assert r.status_code == 422
+    assert not details.called
+
+    # Same bounds as the single-issue route
+    r = client.post("/api/v1/jira/issues:details", json={"keys": ["SCRUM-1"], "changelog": True,
+                                                         "changelog_limit": 0})
+    assert r.status_code == 422
+    assert client.get("/api/v1/jira/issues/SCRUM-1", params={"changelog_limit": 0}).status_code == 422
+
+    r = client.post("/api/v1/jira/issues:details", json={"keys": ["SCRUM-1"], "changelog": True,
+                                                         "changelog_limit": 50})
+    assert r.status_code == 200
+    assert details.await_args.kwargs["changelog_limit"] == 50
+
+def test_jira_details_route_caps_key_count(mocker):
+    from src.core.config import settings
+    from src.services.jira_service import JiraService
+    details = mocker.patch.object(JiraService, "get_issues_details_async", new_callable=mocker.AsyncMock,
+                                  return_value={"success": True, "message": "ok", "data": {"items": []}})
+    cap = settings.jira_details_max_keys
+
+    r = client.post("/api/v1/jira/issues:details", json={"keys": [f"SCRUM-{i}" for i in range(cap + 1)]})
+    assert r.status_code == 422
+    assert not details.called
+
+    r = client.post("/api/v1/jira/issues:details", json={"keys": [f"SCRUM-{i}" for i in range(cap)]})
+    assert r.status_code == 200
+    assert len(details.await_args.args[0]) == cap
+
+def test_activity_batch_route_caps_request_size(mocker):
+    from src.core.config import settings
+    from src.services.activity_service import ActivityService
+    batch = mocker.patch.object(ActivityService, "get_activity_batch_async", new_callable=mocker.AsyncMock,
+                                return_value={"success": True, "message": "ok", "data": {"items": []}})
+    cap = settings.activity_batch_max_items
+
+    r = client.post("/activity/batch", json={"questions": ["What is Abhishek doing?"] * (cap + 1)})
+    assert r.status_code == 422
+    r = client.post("/activity/batch", json={"users": ["abhishek"] * (cap + 1)})
+    assert r.status_code == 422
+    assert not batch.called
+
+    r = client.post("/activity/batch", json={"questions": ["What is Abhishek doing?"] * cap})
+    assert r.status_code == 200
+
+def test_health_reports_http_pools():
+    from src.integrations.github_client import GitHubClient
+    from src.integrations.jira_client import JiraClient
+
+    # Clients share one long-lived session per upstream
+    assert GitHubClient().session is GitHubClient().session
+    assert JiraClient().session is JiraClient().session
+
+    r = client.get("/health")
+    pools = r.json()["http_pools"]
+    assert "github" in pools
+    assert "jira" in pools
+    assert "budgets" in r.json()["github_rate_limit"]["tokens"][0]
+
+def test_activity_route_is_async(mocker):
+    from src.services.activity_service import ActivityService
+    mocker.patch.object(ActivityService, "get_activity_async", new_callable=mocker.AsyncMock,
+                        return_value={"success": True, "message": "ok", "data": {"items": {}, "meta": {}}})
+    r = client.post("/activity", json={"question": "What is Abhishek working on?"})
+    assert r.status_code == 200
+    assert r.json()["success"] is True
+
+def test_activity_stream_route_ndjson(mocker):
+    import json
+    from src.services.activity_service import ActivityService
+
+    async def events(self, question, limit, offset, deadline=None):
+        yield {"event": "section", "section": "jira", "data": {"success": True}}
+        yield {"event": "complete", "data": {"success": True}}
+
+    mocker.patch.object(ActivityService, "stream_activity_async", events)
+
+    r = client.post("/activity/stream", json={"question": "What is Abhishek doing?"})
+
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line)["event"] for line in r.text.splitlines()] == ["section", "complete"]
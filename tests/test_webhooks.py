@@ -0,0 +1,115 @@
+import hashlib
+import hmac
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import app
+from src.core.user_resolver import UserResolver
+from src.services.activity_service import ActivityService
+from src.services.activity_store import ActivityStore
+from src.services.webhook_service import webhook_processor
+
+client = TestClient(app)
+SECRET = "s3cret"
+
+PUSH = {
+    "repository": {"name": "repo1", "full_name": "user1/repo1", "html_url": "http://gh/r/1",
+                   "owner": {"login": "user1"}, "pushed_at": 1791200000},
+    "commits": [{"id": "abc", "message": "fix", "url": "http://gh/c/abc", "distinct": True,
+                 "timestamp": "2026-10-05T15:30:00+05:30", "author": {"username": "user1"}}],
+}
+
+
+def sign(body: bytes) -> str:
+    return "sha256=" + hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def store(mocker, tmp_path):
+    store = ActivityStore(str(tmp_path / "activity.db"))
+    mocker.patch("src.services.webhook_service.get_activity_store", return_value=store)
+    mocker.patch("src.api.routers.webhook_router.settings.github_webhook_secret", SECRET)
+    mocker.patch("src.api.routers.webhook_router.settings.jira_webhook_secret", SECRET)
+    mocker.patch.object(webhook_processor, "_ensure_worker")  # tests drain the queue with flush()
+    ActivityService.response_cache.clear()
+    return store
+
+
+def test_github_push_is_verified_queued_and_applied(mocker, store):
+    mocker.patch.dict(UserResolver.MAP, {"abhishek": {"jira": "acc-1", "github": "user1"}})
+    ActivityService.response_cache.set(("abhishek", "GITHUB_COMMITS", "default", 5, 0), {"stale": True}, 60)
+    body = json.dumps(PUSH).encode()
+
+    bad = client.post("/webhooks/github", content=body,
+                      headers={"X-GitHub-Event": "push", "X-Hub-Signature-256": "sha256=00"})
+    assert bad.status_code == 401
+
+    r = client.post("/webhooks/github", content=body,
+                    headers={"X-GitHub-Event": "push", "X-Hub-Signature-256": sign(body)})
+    assert r.status_code == 202 and r.json()["data"]["meta"]["queued"] is True
+
+    webhook_processor.flush()
+
+    items, total, _ = store.commits("user1")
+    assert total == 1
+    assert items[0] == {"repo": "user1/repo1", "message": "fix", "timestamp": "2026-10-05T10:00:00Z",
+                        "url": "http://gh/c/abc", "sha": "abc"}
+    assert len(ActivityService.response_cache) == 0
+
+
+def test_jira_issue_updated_upserts_issue_row(store):
+    payload = {"webhookEvent": "jira:issue_updated", "issue": {"key": "SCRUM-7", "fields": {
+        "summary": "task", "status": {"name": "In Progress", "statusCategory": {"key": "indeterminate"}},
+        "updated": "2026-10-05T10:00:00.000+0000", "assignee": {"accountId": "acc-1"}}}}
+    body = json.dumps(payload).encode()
+
+    r = client.post("/webhooks/jira", content=body, headers={"X-Hub-Signature": sign(body)})
+    assert r.status_code == 202
+    webhook_processor.flush()
+
+    items, _, _ = store.issues("acc-1")
+    assert items == [{"key": "SCRUM-7", "summary": "task", "status": "In Progress",
+                      "updated": "2026-10-05T10:00:00.000+0000"}]
+
+
+def test_jira_unassignment_removes_issue_and_other_projects_are_ignored(store):
+    def event(key, assignee, changelog=None):
+        fields = {"summary": "task", "status": {"name": "To Do"}, "created": "2026-10-01T10:00:00.000+0000",
+                  "updated": "2026-10-05T10:00:00.000+0000", "assignee": assignee and {"accountId": assignee}}
+        return {"webhookEvent": "jira:issue_updated", "issue": {"key": key, "fields": fields},
+                "changelog": {"items": changelog or []}}
+
+    unassign = [{"field": "assignee", "from": "acc-1", "to": None}]
+    for payload in (event("SCRUM-7", "acc-1"), event("SCRUM-8", "acc-1"), event("OTHER-1", "acc-1")):
+        body = json.dumps(payload).encode()
+        assert client.post("/webhooks/jira", content=body, headers={"X-Hub-Signature": sign(body)}).status_code == 202
+    webhook_processor.flush()
+    assert sorted(i["key"] for i in store.issues("acc-1")[0]) == ["SCRUM-7", "SCRUM-8"]
+
+    # Unassigned, then reassigned within the same batch: the last event wins
+    for payload in (event("SCRUM-7", None, unassign), event("SCRUM-8", None, unassign),
+                    event("SCRUM-8", "acc-1")):
+        body = json.dumps(payload).encode()
+        client.post("/webhooks/jira", content=body, headers={"X-Hub-Signature": sign(body)})
+    webhook_processor.flush()
+
+    assert [i["key"] for i in store.issues("acc-1")[0]] == ["SCRUM-8"]
+    assert store.rollup_totals("acc-1", ("issues_opened",)) == {"issues_opened": 1}
+
+
+def test_push_files_commits_under_their_author(store):
+    collaborator = {"id": "def", "message": "theirs", "url": "http://gh/c/def", "distinct": True,
+                    "timestamp": "2026-10-05T11:00:00Z", "author": {"username": "user2"}}
+    seen = {**PUSH["commits"][0], "id": "ghi", "distinct": False}
+    payload = {**PUSH, "commits": PUSH["commits"] + [collaborator, seen]}
+    body = json.dumps(payload).encode()
+
+    r = client.post("/webhooks/github", content=body,
+                    headers={"X-GitHub-Event": "push", "X-Hub-Signature-256": sign(body)})
+    assert r.status_code == 202
+    webhook_processor.flush()
+
+    assert [c["sha"] for c in store.commits("user1")[0]] == ["abc"]
+    assert [c["sha"] for c in store.commits("user2")[0]] == ["def"]
+    assert store.rollup_totals("user1", ("commits",)) == {"commits": 1}